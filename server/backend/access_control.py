@@ -0,0 +1,168 @@
+from django.conf import settings
+from django.db.models import Subquery
+from threading import Lock
+
+from . import metrics
+from .authentication_tools import auth_tools as at
+from .authentication_tools.identity import get_user_loader
+from .models import (
+	Ecclesiastical_Treasures,
+	RoleModel,
+	Users,
+)
+
+import copy
+import time
+
+
+class TreasureAccess:
+	"""
+	The decision of whether a user can view or edit a treasure, together
+	with the treasure row and its owner
+	"""
+
+	def __init__(self, treasure, user_id, user_role):
+		self.treasure = treasure
+		self.owner = treasure.user_fk
+		self.user_id = user_id
+		self.user_role = user_role
+		self.can_view = user_role is not None
+		self.can_edit = self.can_view and (user_id == treasure.user_fk_id or user_role == RoleModel.ADMIN)
+
+
+class TreasureAccessCache:
+	"""
+	Per-worker memo of access decisions with a short TTL. Entries of a
+	treasure are dropped by backend.treasure_sync as soon as this worker
+	changes the treasure, its media or the profile of its owner, and by
+	EcclesiasticalTreasuresDelete. Other workers keep serving the cached
+	treasure and owner rows for at most TTL_SEC, to reads only: the views
+	that modify a treasure or its media always check the database.
+	"""
+
+	def __init__(self, max_entries, ttl_sec):
+		self.max_entries = max_entries
+		self.ttl_sec = ttl_sec
+		self._entries = {}
+		self._lock = Lock()
+		self.hits = 0
+		self.misses = 0
+
+	def get(self, treasure_uuid, user_id):
+		with self._lock:
+			entry = self._entries.get((treasure_uuid, user_id))
+
+			if entry is None or entry[0] <= time.monotonic():
+				self.misses += 1
+				return None
+
+			self.hits += 1
+			return entry[1]
+
+	def set(self, treasure_uuid, user_id, access):
+		if self.ttl_sec <= 0:
+			return
+
+		with self._lock:
+			if len(self._entries) >= self.max_entries:
+				now = time.monotonic()
+				self._entries = {key: entry for key, entry in self._entries.items() if entry[0] > now}
+
+				if len(self._entries) >= self.max_entries:
+					self._entries.clear()
+
+			self._entries[(treasure_uuid, user_id)] = (time.monotonic() + self.ttl_sec, access)
+
+	def invalidate(self, treasure_uuid):
+		with self._lock:
+			for key in [key for key in self._entries if key[0] == treasure_uuid]:
+				del self._entries[key]
+
+	def invalidate_owner(self, user_id):
+		with self._lock:
+			for key in [key for key, entry in self._entries.items() if entry[1].owner.id == user_id]:
+				del self._entries[key]
+
+	def stats(self):
+		with self._lock:
+			return {
+				"entries": len(self._entries),
+				"ttl_sec": self.ttl_sec,
+				"hits": self.hits,
+				"misses": self.misses,
+			}
+
+
+access_cache = TreasureAccessCache(
+	settings.TREASURE_ACCESS_CACHE["MAX_ENTRIES"],
+	settings.TREASURE_ACCESS_CACHE["TTL_SEC"],
+)
+metrics.register("treasure_access", access_cache.stats)
+
+
+def _load_access(treasure_uuid, user_id):
+	treasure = Ecclesiastical_Treasures.objects.select_related(
+		"user_fk"
+	).annotate(
+		current_user_role=Subquery(
+			Users.objects.filter(id=user_id).values("role")[:1]
+		)
+	).filter(
+		uuid=treasure_uuid
+	).first()
+
+	if not treasure:
+		return None
+
+	return TreasureAccess(treasure, user_id, treasure.current_user_role)
+
+
+def get_treasure_access(request, treasure_uuid, for_update=False):
+	"""
+	Returns the TreasureAccess of the current user for the treasure, or None
+	if the treasure does not exist. Answered with one query at most, and
+	without any for repeated checks within the request or the TTL.
+
+	Views that modify the treasure or its media pass `for_update`, so that
+	the decision is read from the database rather than from the per-worker
+	cache, which may be up to TTL_SEC old when another worker changed the
+	owner or the role of the user.
+	"""
+	http_request = getattr(request, "_request", request)
+	memo = getattr(http_request, "narrate_treasure_access", None)
+
+	if memo is None:
+		memo = {}
+		http_request.narrate_treasure_access = memo
+
+	# Holds (access, whether it was read from the database in this request)
+	if treasure_uuid in memo and (memo[treasure_uuid][1] or not for_update):
+		return memo[treasure_uuid][0]
+
+	is_valid, payload = at.authenticate(request)
+	user_id = payload["user_id"] if is_valid else None
+	access = None if for_update else access_cache.get(treasure_uuid, user_id)
+	is_loaded = access is None
+
+	if is_loaded:
+		access = _load_access(treasure_uuid, user_id)
+
+		if access is not None:
+			access_cache.set(treasure_uuid, user_id, access)
+
+	if access is not None:
+		# Views may modify the rows, never hand out the shared instances
+		access = copy.copy(access)
+		access.treasure = copy.copy(access.treasure)
+		access.owner = copy.copy(access.owner)
+		access.treasure.user_fk = access.owner
+		get_user_loader(request).prime([access.owner])
+
+	memo[treasure_uuid] = (access, is_loaded)
+	return access
+
+
+def invalidate_treasure_access(request, treasure_uuid):
+	access_cache.invalidate(treasure_uuid)
+	http_request = getattr(request, "_request", request)
+	getattr(http_request, "narrate_treasure_access", {}).pop(treasure_uuid, None)
@@ -1,4 +1,44 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_migrate, pre_migrate
+
+
+def create_extensions(sender, **kwargs):
+	# The trigram indexes of the search fields need pg_trgm before the migrations create them
+	from django.db import connection
+
+	if connection.vendor != "postgresql":
+		return
+
+	with connection.cursor() as cursor:
+		cursor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+
+def partition_logging_entries(sender, **kwargs):
+	from django.conf import settings
+	from . import log_partitions
+
+	if not log_partitions.is_postgres():
+		return
+
+	if log_partitions.convert_to_partitioned():
+		print("Partitioned {} by month".format(log_partitions.TABLE))
+
+	log_partitions.ensure_partitions(settings.LOG_PARTITIONING["MONTHS_AHEAD"])
+
+
+def sync_missing_treasures(sender, **kwargs):
+	# The summaries, search documents and covers of treasures created before they were deployed
+	from django.db import connection
+	from . import treasure_sync
+
+	if connection.vendor != "postgresql":
+		return
+
+	synced = treasure_sync.sync_missing()
+
+	if synced:
+		print("Synced the summaries and search documents of {} treasures".format(synced))
+
 
 class NarrateAppConfig(AppConfig):
 	name = "backend"
@@ -6,6 +46,10 @@ class NarrateAppConfig(AppConfig):
 	def ready(self):
 		from django.apps import apps
 
+		pre_migrate.connect(create_extensions, sender=self)
+		post_migrate.connect(partition_logging_entries, sender=self)
+		post_migrate.connect(sync_missing_treasures, sender=self)
+
 		E56_Language = apps.get_model("backend", "E56_Language")
 		try:
 			# Populate language codes
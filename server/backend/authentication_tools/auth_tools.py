@@ -2,16 +2,46 @@ from django.conf import settings
 from backend.serializers import RefreshTokenSerializer
 from backend.views_utils import request_details
 from backend.custom_logging import logger as log
+from .principal_cache import principal_cache
 import jwt
 
 
-def authenticate(request):
+def decode_access_token(access_token):
+    """
+    Verifies the signature, audience and expiry of an access token locally.
+    Raises jwt.ExpiredSignatureError for expired tokens and
+    jwt.InvalidTokenError for any other invalid token.
+    """
+    payload = jwt.decode(
+        access_token,
+        settings.SIMPLE_JWT["SIGNING_KEY"],
+        settings.SIMPLE_JWT["ALGORITHM"],
+        audience=settings.SIMPLE_JWT["AUDIENCE"]
+    )
+
+    if payload.get("token_type") != "access":
+        raise jwt.InvalidTokenError("Not an access token")
+
+    return payload
+
+
+def authenticate_refresh(request):
+    """
+    Derives the principal from the refresh token cookie by minting a new
+    access token. Returns (is_valid, payload, access_token).
+    """
     try:
-        log.debug("[auth_tools.authenticate] - {} - {}".format(request.path, request_details(request)))
-        refresh_token = request.COOKIES.get("refresh_token")
+        log.debug("[auth_tools.authenticate_refresh] - {} - {}".format(request.path, request_details(request)))
+        refresh_token = request.COOKIES.get(settings.SIMPLE_JWT["AUTH_REFRESH_COOKIE"])
 
         if not refresh_token:
-            return False, None
+            return False, None, None
+
+        cached = principal_cache.get(refresh_token)
+
+        if cached is not None:
+            payload, access_token = cached
+            return True, payload, access_token
 
         data = {
             "refresh": refresh_token
@@ -19,15 +49,26 @@ def authenticate(request):
 
         _, new_token = RefreshTokenSerializer(data).validate(data)
         access_token = new_token.get("resource_str")
-        payload = jwt.decode(
-            access_token,
-            settings.SIMPLE_JWT["SIGNING_KEY"],
-            settings.SIMPLE_JWT["ALGORITHM"],
-            audience=settings.SIMPLE_JWT["AUDIENCE"]
-        )
-        return True, payload
+        payload = decode_access_token(access_token)
+        principal_cache.set(refresh_token, payload, access_token)
+        return True, payload, access_token
     except Exception as e:
-        return False, None
+        return False, None, None
+
+
+def authenticate(request):
+    """
+    Returns (is_valid, payload) for the request. When the authentication
+    middleware is installed the principal it attached to the request is used,
+    otherwise the refresh token cookie is validated.
+    """
+    state = getattr(request, "narrate_auth", None)
+
+    if state is not None:
+        return state.resolve()
+
+    is_valid, payload, _ = authenticate_refresh(request)
+    return is_valid, payload
 
 
 def auth_required(view_func):
@@ -0,0 +1,76 @@
+from backend.models import Users
+from . import auth_tools
+
+
+class UserLoader:
+    """
+    Request-scoped loader of Users rows. The current user is fetched lazily
+    and memoized; any lookup that misses also fetches the current user, so
+    a request that needs the current user and an owner costs one query.
+    """
+
+    def __init__(self, request):
+        self.request = request
+        self._users = {}
+
+    def current_user_id(self):
+        is_valid, payload = auth_tools.authenticate(self.request)
+        return payload["user_id"] if is_valid else None
+
+    def load_many(self, user_ids):
+        user_ids = set(user_id for user_id in user_ids if user_id is not None)
+        missing = set(user_id for user_id in user_ids if user_id not in self._users)
+
+        if missing:
+            current_user_id = self.current_user_id()
+
+            if current_user_id is not None and current_user_id not in self._users:
+                missing.add(current_user_id)
+
+            rows = Users.objects.in_bulk(missing)
+
+            for user_id in missing:
+                self._users[user_id] = rows.get(user_id)
+
+        return {user_id: self._users[user_id] for user_id in user_ids}
+
+    def load(self, user_id):
+        if user_id is None:
+            return None
+
+        return self.load_many([user_id])[user_id]
+
+    def current(self):
+        return self.load(self.current_user_id())
+
+    def prime(self, users):
+        for user in users:
+            if user is not None:
+                self._users[user.id] = user
+
+    def forget(self, user_id):
+        self._users.pop(user_id, None)
+
+
+def get_user_loader(request):
+    # DRF requests wrap the HttpRequest, keep a single loader on the latter
+    http_request = getattr(request, "_request", request)
+    loader = getattr(http_request, "narrate_user_loader", None)
+
+    if loader is None:
+        loader = UserLoader(request)
+        http_request.narrate_user_loader = loader
+
+    return loader
+
+
+def current_user(request):
+    return get_user_loader(request).current()
+
+
+def load_user(request, user_id):
+    return get_user_loader(request).load(user_id)
+
+
+def load_users(request, user_ids):
+    return get_user_loader(request).load_many(user_ids)
@@ -0,0 +1,88 @@
+from django.conf import settings
+from backend.custom_logging import logger as log
+from . import auth_tools
+import jwt
+
+
+BEARER_PREFIX = "Bearer "
+
+
+class RequestAuthentication:
+    """
+    The principal of a single request. The access token is verified
+    locally once; the refresh token is used only when the access token
+    is missing or has expired.
+    """
+
+    def __init__(self, request):
+        self.request = request
+        self.new_access_token = None
+        self._result = None
+
+    def get_access_token(self):
+        header = self.request.META.get("HTTP_AUTHORIZATION", "")
+
+        if header.startswith(BEARER_PREFIX):
+            return header[len(BEARER_PREFIX):].strip()
+
+        return self.request.COOKIES.get(settings.SIMPLE_JWT["AUTH_COOKIE"])
+
+    def resolve(self):
+        if self._result is None:
+            self._result = self._authenticate()
+
+        return self._result
+
+    def _authenticate(self):
+        access_token = self.get_access_token()
+
+        if access_token:
+            try:
+                return True, auth_tools.decode_access_token(access_token)
+            except jwt.ExpiredSignatureError:
+                log.debug("[RequestAuthentication] Access token expired, falling back to refresh token")
+            except jwt.InvalidTokenError as e:
+                log.debug("[RequestAuthentication] Invalid access token: {}".format(str(e)))
+                return False, None
+
+        is_valid, payload, new_access_token = auth_tools.authenticate_refresh(self.request)
+
+        if is_valid and new_access_token != access_token:
+            self.new_access_token = new_access_token
+
+        return is_valid, payload
+
+
+class AccessTokenAuthenticationMiddleware:
+    """
+    Attaches a lazily resolved principal to every request as `narrate_auth`
+    and renews the access token cookie whenever the refresh token was used.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        state = RequestAuthentication(request)
+        request.narrate_auth = state
+        response = self.get_response(request)
+        cookie_name = settings.SIMPLE_JWT["AUTH_COOKIE"]
+
+        # Views that log the user out delete the cookie themselves
+        if state.new_access_token and cookie_name not in response.cookies:
+            set_access_cookie(response, state.new_access_token)
+
+        return response
+
+
+def set_access_cookie(response, access_token):
+    response.set_cookie(
+        key = settings.SIMPLE_JWT["AUTH_COOKIE"],
+        value = access_token,
+        max_age = int(settings.SIMPLE_JWT["ACCESS_TOKEN_LIFETIME"].total_seconds()),
+        path = settings.SIMPLE_JWT["AUTH_COOKIE_PATH"],
+        domain = settings.SIMPLE_JWT["AUTH_COOKIE_DOMAIN"],
+        secure = settings.SIMPLE_JWT["AUTH_COOKIE_SECURE"],
+        httponly = settings.SIMPLE_JWT["AUTH_COOKIE_HTTP_ONLY"],
+        samesite = settings.SIMPLE_JWT["AUTH_COOKIE_SAMESITE"]
+    )
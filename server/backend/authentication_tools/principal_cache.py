@@ -0,0 +1,110 @@
+from collections import OrderedDict
+from threading import Lock
+from django.conf import settings
+from backend import metrics
+import hashlib
+import time
+
+
+class PrincipalCache:
+    """
+    Bounded LRU cache with a TTL that maps the hash of a refresh token
+    to the payload that was verified for it, together with the access token
+    that carries that payload. The raw refresh token is never stored.
+    """
+
+    def __init__(self, max_entries, ttl_sec):
+        self.max_entries = max_entries
+        self.ttl_sec = ttl_sec
+        self._entries = OrderedDict()
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @staticmethod
+    def make_key(refresh_token):
+        return hashlib.sha256(refresh_token.encode("utf-8")).hexdigest()
+
+    def get(self, refresh_token):
+        key = self.make_key(refresh_token)
+        now = time.monotonic()
+
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None:
+                self.misses += 1
+                return None
+
+            expires_at, payload, access_token = entry
+
+            if expires_at <= now:
+                del self._entries[key]
+                self.evictions += 1
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return payload, access_token
+
+    def set(self, refresh_token, payload, access_token=None):
+        if self.max_entries <= 0 or self.ttl_sec <= 0:
+            return
+
+        ttl_sec = self.ttl_sec
+        exp = payload.get("exp")
+
+        # Never keep a principal for longer than its token is valid
+        if exp:
+            ttl_sec = min(ttl_sec, exp - time.time())
+
+            if ttl_sec <= 0:
+                return
+
+        key = self.make_key(refresh_token)
+
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl_sec, payload, access_token)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, refresh_token):
+        if not refresh_token:
+            return
+
+        key = self.make_key(refresh_token)
+
+        with self._lock:
+            if self._entries.pop(key, None) is not None:
+                self.invalidations += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_sec": self.ttl_sec,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+            }
+
+
+principal_cache = PrincipalCache(
+    settings.PRINCIPAL_CACHE["MAX_ENTRIES"],
+    settings.PRINCIPAL_CACHE["TTL_SEC"],
+)
+metrics.register("principal_cache", principal_cache.stats)
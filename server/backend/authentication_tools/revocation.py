@@ -0,0 +1,196 @@
+from django.conf import settings
+from django.db import connection
+from django.utils import timezone
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken
+from rest_framework_simplejwt.tokens import RefreshToken
+from threading import Lock, Thread
+from backend import metrics
+from backend.custom_logging import logger as log
+import psycopg2
+import select
+import sys
+import time
+
+
+CHANNEL = "token_revoked"
+
+
+class RevocationIndex:
+    """
+    In-process index of the JTIs of blacklisted refresh tokens that have not
+    expired yet. It is loaded from the blacklist table once per worker and
+    then kept current through Postgres LISTEN/NOTIFY, so revocation checks
+    need no query. Until the index is loaded, checks fall back to the table.
+    """
+
+    def __init__(self, reconnect_interval_sec, poll_timeout_sec):
+        self.reconnect_interval_sec = reconnect_interval_sec
+        self.poll_timeout_sec = poll_timeout_sec
+        self._revoked = {}
+        self._lock = Lock()
+        self._listener = None
+        self.is_loaded = False
+        self.is_listening = False
+        self.lookups = 0
+        self.fallback_lookups = 0
+        self.notifications = 0
+        self.reloads = 0
+
+    def start(self):
+        """
+        Starts the listener thread of this worker. The thread loads the
+        index after it has subscribed to the channel, so that no revocation
+        published in between is missed.
+        """
+        with self._lock:
+            if self._listener is not None:
+                return
+
+            self._listener = Thread(target=self._listen, name="revocation-index", daemon=True)
+            self._listener.start()
+
+    def load(self):
+        rows = BlacklistedToken.objects.filter(
+            token__expires_at__gt=timezone.now()
+        ).values_list("token__jti", "token__expires_at")
+        revoked = {jti: int(expires_at.timestamp()) for jti, expires_at in rows.iterator()}
+
+        with self._lock:
+            self._revoked = revoked
+            self.is_loaded = True
+            self.reloads += 1
+
+    def add(self, jti, exp):
+        with self._lock:
+            self._revoked[jti] = int(exp)
+
+    def is_revoked(self, jti):
+        self.start()
+        self.lookups += 1
+
+        if not self.is_loaded:
+            self.fallback_lookups += 1
+            return BlacklistedToken.objects.filter(token__jti=jti).exists()
+
+        return jti in self._revoked
+
+    def prune(self):
+        """
+        Drops the JTIs of tokens that have expired, as those are rejected
+        by the expiry check anyway
+        """
+        now = int(time.time())
+
+        with self._lock:
+            self._revoked = {jti: exp for jti, exp in self._revoked.items() if exp > now}
+
+    def publish(self, jti, exp):
+        """
+        Notifies every worker, including this one, that a token was revoked
+        """
+        self.add(jti, exp)
+
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT pg_notify(%s, %s)", [CHANNEL, "{}:{}".format(jti, int(exp))])
+
+    def memory_footprint(self):
+        with self._lock:
+            size = sys.getsizeof(self._revoked)
+
+            for jti, exp in self._revoked.items():
+                size += sys.getsizeof(jti) + sys.getsizeof(exp)
+
+        return size
+
+    def stats(self):
+        return {
+            "entries": len(self._revoked),
+            "memory_bytes": self.memory_footprint(),
+            "is_loaded": self.is_loaded,
+            "is_listening": self.is_listening,
+            "lookups": self.lookups,
+            "fallback_lookups": self.fallback_lookups,
+            "notifications": self.notifications,
+            "reloads": self.reloads,
+        }
+
+    def _connect(self):
+        db = settings.DATABASES["default"]
+        conn = psycopg2.connect(
+            dbname=db["NAME"],
+            user=db["USER"],
+            password=db["PASSWORD"],
+            host=db["HOST"],
+            port=db["PORT"],
+        )
+        conn.set_isolation_level(psycopg2.extensions.ISOLATION_LEVEL_AUTOCOMMIT)
+
+        with conn.cursor() as cursor:
+            cursor.execute("LISTEN {}".format(CHANNEL))
+
+        return conn
+
+    def _listen(self):
+        while True:
+            conn = None
+
+            try:
+                conn = self._connect()
+                self.is_listening = True
+                # Notifications may have been missed while disconnected
+                self.load()
+                connection.close()
+                self._consume(conn)
+            except Exception as e:
+                log.error("[RevocationIndex] Listener error: {}".format(str(e)))
+            finally:
+                self.is_listening = False
+
+                if conn is not None:
+                    try:
+                        conn.close()
+                    except Exception:
+                        pass
+
+            time.sleep(self.reconnect_interval_sec)
+
+    def _consume(self, conn):
+        while True:
+            if select.select([conn], [], [], self.poll_timeout_sec) == ([], [], []):
+                self.prune()
+                continue
+
+            conn.poll()
+
+            while conn.notifies:
+                notify = conn.notifies.pop(0)
+                jti, exp = notify.payload.rsplit(":", 1)
+                self.add(jti, exp)
+                self.notifications += 1
+
+
+revocation_index = RevocationIndex(
+    settings.TOKEN_REVOCATION["RECONNECT_INTERVAL_SEC"],
+    settings.TOKEN_REVOCATION["POLL_TIMEOUT_SEC"],
+)
+metrics.register("token_revocation", revocation_index.stats)
+
+
+class IndexedRefreshToken(RefreshToken):
+    """
+    Refresh token that checks the revocation index instead of querying
+    the blacklist table
+    """
+
+    def check_blacklist(self):
+        jti = self.payload[api_settings.JTI_CLAIM]
+
+        if revocation_index.is_revoked(jti):
+            raise TokenError("Token is blacklisted")
+
+    def blacklist(self):
+        result = super(IndexedRefreshToken, self).blacklist()
+        revocation_index.publish(self.payload[api_settings.JTI_CLAIM], self.payload["exp"])
+        return result
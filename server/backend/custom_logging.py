@@ -1,20 +1,114 @@
+from collections import deque
+from datetime import datetime, timezone
 from django.conf import settings
-import inspect
+from django.db import connection, transaction
+import atexit
+import copy
+import importlib
+import json
 import logging
+import logging.handlers
+import os
+import random
 import sys
+import threading
 
-from backend.models import (
-	LoggingEntries,
-	Users,
-)
+from backend import log_rollups, metrics
+from backend.models import LoggingEntries
+
+
+# Frames of these files are never the caller of a log call
+_LOGGING_FILES = {
+	logging.__file__,
+	__file__,
+}
+
+
+class AuditPolicy:
+	"""
+	Decides which records get a row in the logs table. Errors and warnings
+	always do; other records do for the sample rate of their api, which is 1
+	unless configured otherwise. Records that are sampled out are still
+	counted in the hourly rollups.
+	"""
+
+	def __init__(self, default_sample_rate, sample_rates):
+		self.default_sample_rate = default_sample_rate
+		self.sample_rates = sample_rates
+
+	def should_write(self, record):
+		if getattr(record, "is_error", False) or record.levelno >= logging.WARNING:
+			return True
+
+		sample_rate = self.sample_rates.get(getattr(record, "api", None), self.default_sample_rate)
+		return sample_rate >= 1 or random.random() < sample_rate
 
 
 class DatabaseLogHandler(logging.Handler):
+	"""
+	Buffers log entries in memory and writes them with bulk_create from a
+	background thread, once BATCH_SIZE entries are waiting or every
+	FLUSH_INTERVAL_SEC. The buffer holds at most CAPACITY entries; entries
+	that do not fit, or that could not be written, are dropped or appended
+	to SPILL_PATH as JSON lines, depending on OVERFLOW_POLICY. Entries that
+	the audit policy samples out are only counted in the rollups. Entries
+	that are not written are still counted: their counts are kept, up to
+	CAPACITY, and added to the rollups with the next flush.
+	"""
+
+	def __init__(self, capacity, batch_size, flush_interval_sec, overflow_policy, spill_path, audit_policy):
+		super().__init__()
+
+		if overflow_policy not in ("drop", "spill"):
+			raise ValueError("Unsupported overflow policy: {}".format(overflow_policy))
+
+		self.capacity = capacity
+		self.batch_size = batch_size
+		self.flush_interval_sec = flush_interval_sec
+		self.overflow_policy = overflow_policy
+		self.spill_path = spill_path
+		self.audit_policy = audit_policy
+		self._buffer = deque()
+		self._uncounted = deque()
+		self._buffer_lock = threading.Lock()
+		self._flush_lock = threading.Lock()
+		self._wakeup = threading.Event()
+		self._thread = None
+		self._pid = None
+		self._closed = False
+		self.enqueued = 0
+		self.sampled_out = 0
+		self.flushed = 0
+		self.dropped = 0
+		self.spilled = 0
+		self.failed_flushes = 0
+		self.uncounted_dropped = 0
+
+	def _ensure_flusher(self):
+		# Started lazily and again after a fork, the thread does not survive it
+		if self._pid == os.getpid():
+			return
+
+		with self._buffer_lock:
+			if self._pid == os.getpid():
+				return
+
+			self._buffer.clear()
+			self._uncounted.clear()
+			self._thread = threading.Thread(target=self._run, name="db-log-flusher", daemon=True)
+			self._pid = os.getpid()
+			self._thread.start()
+
+	def _run(self):
+		while not self._closed:
+			self._wakeup.wait(self.flush_interval_sec)
+			self._wakeup.clear()
+			self.flush()
+
 	def emit(self, record):
 		try:
-			user = Users.objects.get(id=record.user_id) if hasattr(record, "user_id") and record.user_id else None
 			log_entry = LoggingEntries(
-				user_fk_id=user.id if user else None,
+				user_fk_id=getattr(record, "user_id", None) or None,
 				api=getattr(record, "api", None),
 				action=getattr(record, "action", None),
 				data=getattr(record, "data", None),
@@ -22,60 +116,416 @@ class DatabaseLogHandler(logging.Handler):
 				ip_address=getattr(record, "ip_address", None),
 				is_error=getattr(record, "is_error", False),
 			)
-			log_entry.save()
+			log_entry.is_sampled_out = not self.audit_policy.should_write(record)
 		except Exception as e:
 			print("Failed to save log to database. Reason: {}".format(str(e)))
+			return
+
+		if log_entry.is_sampled_out:
+			self.sampled_out += 1
+
+		if self._closed:
+			self._overflow([log_entry])
+			return
+
+		self._ensure_flusher()
+
+		with self._buffer_lock:
+			is_full = len(self._buffer) >= self.capacity
+
+			if not is_full:
+				self._buffer.append(log_entry)
+				self.enqueued += 1
+				depth = len(self._buffer)
+
+		if is_full:
+			self._overflow([log_entry])
+		elif depth >= self.batch_size:
+			self._wakeup.set()
+
+	def _take_batch(self):
+		with self._buffer_lock:
+			return [self._buffer.popleft() for _ in range(min(self.batch_size, len(self._buffer)))]
+
+	def _take_uncounted(self):
+		with self._buffer_lock:
+			uncounted = list(self._uncounted)
+			self._uncounted.clear()
+			return uncounted
+
+	def _defer_counts(self, log_entries):
+		# Only the fields of the rollup key are kept, the oldest are dropped beyond CAPACITY
+		with self._buffer_lock:
+			for log_entry in log_entries:
+				if len(self._uncounted) >= self.capacity:
+					self._uncounted.popleft()
+					self.uncounted_dropped += 1
+
+				self._uncounted.append(LoggingEntries(
+					user_fk_id=log_entry.user_fk_id,
+					api=log_entry.api,
+					action=log_entry.action,
+					is_error=log_entry.is_error,
+					ts_added=log_entry.ts_added,
+				))
+
+	def flush(self):
+		"""
+		Writes every buffered entry, in batches of BATCH_SIZE. The counts of
+		entries that were not written before are added with the first batch.
+		"""
+		with self._flush_lock:
+			batch = self._take_batch()
+			uncounted = self._take_uncounted()
+
+			while batch or uncounted:
+				try:
+					written = [log_entry for log_entry in batch if not log_entry.is_sampled_out]
+
+					with transaction.atomic():
+						LoggingEntries.objects.bulk_create(written)
+						log_rollups.record_entries(batch + uncounted)
+
+					self.flushed += len(written)
+				except Exception as e:
+					self.failed_flushes += 1
+					print("Failed to save logs to database. Reason: {}".format(str(e)))
+					self._overflow(batch)
+					self._defer_counts(uncounted)
+					# The connection may be broken, reconnect on the next flush
+					connection.close()
+
+				batch = self._take_batch()
+				uncounted = []
+
+	def _overflow(self, log_entries):
+		self._defer_counts(log_entries)
+		# Sampled out entries are counted only, there is nothing else to keep of them
+		log_entries = [log_entry for log_entry in log_entries if not log_entry.is_sampled_out]
+
+		if not log_entries:
+			return
+
+		if self.overflow_policy == "spill":
+			try:
+				with open(self.spill_path, "a") as f:
+					for log_entry in log_entries:
+						f.write(json.dumps({
+							"user_fk_id": log_entry.user_fk_id,
+							"api": log_entry.api,
+							"action": log_entry.action,
+							"data": log_entry.data,
+							"error_data": log_entry.error_data,
+							"ip_address": log_entry.ip_address,
+							"is_error": log_entry.is_error,
+							"ts_added": log_entry.ts_added.isoformat(),
+						}) + "\n")
+
+				self.spilled += len(log_entries)
+				return
+			except Exception as e:
+				print("Failed to spill logs to {}. Reason: {}".format(self.spill_path, str(e)))
+
+		self.dropped += len(log_entries)
+
+	def close(self):
+		"""
+		Stops the flusher and writes what is left in the buffer. Called on
+		interpreter exit and from the gunicorn worker_exit hook.
+		"""
+		self._closed = True
+		self._wakeup.set()
+
+		if self._pid == os.getpid():
+			self.flush()
+
+		super().close()
+
+	def stats(self):
+		with self._buffer_lock:
+			depth = len(self._buffer)
+			uncounted = len(self._uncounted)
+
+		return {
+			"queue_depth": depth,
+			"capacity": self.capacity,
+			"batch_size": self.batch_size,
+			"overflow_policy": self.overflow_policy,
+			"enqueued": self.enqueued,
+			"sampled_out": self.sampled_out,
+			"flushed": self.flushed,
+			"dropped": self.dropped,
+			"spilled": self.spilled,
+			"failed_flushes": self.failed_flushes,
+			"uncounted": uncounted,
+			"uncounted_dropped": self.uncounted_dropped,
+		}
 
 
 class ClassFilter(logging.Filter):
-	def _get_class_from_frame(self,fr):
-		args, _, _, value_dict = inspect.getargvalues(fr)
-		instance = None
+	"""
+	Sets `record.classname` to the class of the nearest method that issued
+	the log call, or "None" when there is none. Frames are walked lazily
+	from the caller outwards; whether a code object belongs to a method or
+	to the logging machinery is cached per code object.
+	"""
+	unwanted_classes = {"Logger", "RootLogger", "LoggerAdapter", "ClassFilter"}
 
-		if len(args) and args[0] == "self":
-			instance = value_dict.get("self", None)
+	def __init__(self, name=""):
+		super().__init__(name)
+		self._code_cache = {}
 
-		if instance:
-			return getattr(instance, "__class__", None)
+	def _classify(self, code):
+		"""
+		Returns None for frames to skip, otherwise whether the frame is a method
+		"""
+		kind = self._code_cache.get(code, False)
 
-		return None
+		if kind is False:
+			if code.co_filename in _LOGGING_FILES:
+				kind = None
+			else:
+				kind = code.co_argcount > 0 and code.co_varnames[0] == "self"
 
-	def filter(self, record):
-		stack = inspect.stack()
-		unwanted_classes = ["Logger", "ClassFilter"]
+			self._code_cache[code] = kind
+
+		return kind
+
+	def resolve_classname(self, frame):
+		while frame is not None:
+			if self._classify(frame.f_code):
+				class_obj = getattr(frame.f_locals.get("self"), "__class__", None)
+
+				if class_obj and class_obj.__name__ not in self.unwanted_classes:
+					return class_obj.__name__
 
-		for stack_frame in stack:
-			class_obj = self._get_class_from_frame(stack_frame[0])
+			frame = frame.f_back
 
-			if class_obj and class_obj.__name__ not in unwanted_classes:
-				if class_obj:
-					classname = class_obj.__name__
-				else:
-					classname = "None"
-				break
+		return "None"
+
+	def will_emit(self, record):
+		for handler in logger.handlers:
+			if record.levelno >= handler.level:
+				return True
+
+		return False
+
+	def filter(self, record):
+		if self.will_emit(record):
+			record.classname = self.resolve_classname(sys._getframe(1))
+		else:
+			record.classname = "None"
 
-		record.classname = classname
 		return True
 
 
+def _original(module_name, name):
+	# The unpatched object when gevent has monkey-patched the module
+	try:
+		from gevent import monkey
+	except ImportError:
+		return getattr(importlib.import_module(module_name), name)
+
+	return monkey.get_original(module_name, name)
+
+
+class JsonFormatter(logging.Formatter):
+	"""
+	Formats a record as one JSON object per line, including the extra data
+	of the records that are also written to the database
+	"""
+	extra_fields = ("user_id", "api", "action", "ip_address", "is_error", "error_data")
+
+	def format(self, record):
+		entry = {
+			"ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+			"level": record.levelname,
+			"classname": getattr(record, "classname", None),
+			"function": record.funcName,
+			"pid": record.process,
+			"message": record.getMessage(),
+		}
+
+		for field_name in self.extra_fields:
+			if hasattr(record, field_name):
+				entry[field_name] = getattr(record, field_name)
+
+		if record.exc_info:
+			entry["exception"] = self.formatException(record.exc_info)
+		elif record.exc_text:
+			# Formatted by PipelineQueueHandler, which drops exc_info
+			entry["exception"] = record.exc_text
+
+		if record.stack_info:
+			entry["stack"] = self.formatStack(record.stack_info)
+
+		return json.dumps(entry, default=str)
+
+
+class NativeQueueListener(logging.handlers.QueueListener):
+	"""
+	Writes the queued records to its handlers from a native thread, so that
+	slow disk or stdout writes never block a greenlet of a gevent worker.
+	The queue and the handler locks are native too. The thread is started
+	on the first record of every process, since it does not survive a fork
+	(e.g. of the celery pool processes).
+	"""
+
+	def __init__(self, *handlers):
+		super().__init__(None, *handlers, respect_handler_level=True)
+		self._pid = None
+		self._done = None
+		self._start_lock = _original("_thread", "allocate_lock")()
+
+		for handler in handlers:
+			handler.lock = _original("_thread", "RLock")()
+
+	def ensure_started(self):
+		if self._pid == os.getpid():
+			return
+
+		with self._start_lock:
+			if self._pid == os.getpid():
+				return
+
+			# Records queued before a fork belong to the parent process
+			self.queue = _original("queue", "SimpleQueue")()
+			self._done = _original("_thread", "allocate_lock")()
+			self._done.acquire()
+			self._pid = os.getpid()
+			_original("_thread", "start_new_thread")(self._run, ())
+
+	def _run(self):
+		try:
+			self._monitor()
+		finally:
+			self._done.release()
+
+	def start(self):
+		self.ensure_started()
+
+	def stop(self, timeout_sec=5):
+		"""
+		Writes the records that are still queued and stops the thread
+		"""
+		if self._pid != os.getpid():
+			return
+
+		self.enqueue_sentinel()
+
+		if self._done.acquire(timeout=timeout_sec):
+			self._done.release()
+
+		self._pid = None
+
+	def stats(self):
+		return {
+			"queue_depth": self.queue.qsize() if self._pid == os.getpid() else 0,
+			"handlers": [handler.__class__.__name__ for handler in self.handlers],
+		}
+
+
+class PipelineQueueHandler(logging.handlers.QueueHandler):
+	"""
+	Hands records over to a NativeQueueListener. The message is merged with
+	its arguments and the traceback is formatted in the calling thread, the
+	rest of the formatting and the writes happen on the listener thread.
+	"""
+
+	def __init__(self, listener):
+		super().__init__(None)
+		self.listener = listener
+		self.exception_formatter = logging.Formatter()
+
+	def prepare(self, record):
+		"""
+		Unlike QueueHandler.prepare, keeps the traceback and the stack in
+		exc_text and stack_info rather than appending them to the message,
+		so that the formatters of the listener render them as usual
+		"""
+		record = copy.copy(record)
+		record.message = record.getMessage()
+		record.msg = record.message
+		record.args = None
+
+		if record.exc_info:
+			if not record.exc_text:
+				record.exc_text = self.exception_formatter.formatException(record.exc_info)
+
+			record.exc_info = None
+
+		return record
+
+	def enqueue(self, record):
+		self.listener.ensure_started()
+		self.listener.queue.put_nowait(record)
+
+
+def build_file_handler():
+	rotation = settings.LOG_FILE["ROTATION"]
+
+	if rotation == "size":
+		return logging.handlers.RotatingFileHandler(
+			settings.LOGGER_PATH,
+			maxBytes=settings.LOG_FILE["MAX_BYTES"],
+			backupCount=settings.LOG_FILE["BACKUP_COUNT"],
+		)
+
+	if rotation == "time":
+		return logging.handlers.TimedRotatingFileHandler(
+			settings.LOGGER_PATH,
+			when=settings.LOG_FILE["WHEN"],
+			backupCount=settings.LOG_FILE["BACKUP_COUNT"],
+			utc=True,
+		)
+
+	if rotation == "watched":
+		return logging.handlers.WatchedFileHandler(settings.LOGGER_PATH)
+
+	raise ValueError("Unsupported log file rotation: {}".format(rotation))
+
+
 logger = logging.getLogger("narrate_logger")
-logger.setLevel(logging.DEBUG)
 logger.addFilter(ClassFilter())
 
-fh = logging.FileHandler(settings.LOGGER_PATH)
-fh.setLevel(logging.DEBUG)
+if settings.LOG_FORMAT == "json":
+	formatter = JsonFormatter()
+else:
+	formatter = logging.Formatter("%(levelname)s - %(classname)s - %(funcName)s - %(asctime)s - %(message)s")
 
-db_handler = DatabaseLogHandler()
-db_handler.setLevel(logging.INFO)
-
-formatter = logging.Formatter("%(levelname)s - %(classname)s - %(funcName)s - %(asctime)s - %(message)s")
+fh = build_file_handler()
+fh.setLevel(settings.LOG_LEVEL)
 fh.setFormatter(formatter)
-db_handler.setFormatter(formatter)
-
-logger.addHandler(fh)
-logger.addHandler(db_handler)
 
 sh = logging.StreamHandler(sys.stdout)
-sh.setLevel(logging.DEBUG)
+sh.setLevel(settings.LOG_LEVEL)
 sh.setFormatter(formatter)
-logger.addHandler(sh)
+
+# The file and stdout writes happen on the listener thread of every process
+listener = NativeQueueListener(fh, sh)
+queue_handler = PipelineQueueHandler(listener)
+queue_handler.setLevel(min(fh.level, sh.level))
+logger.addHandler(queue_handler)
+
+db_handler = DatabaseLogHandler(
+	settings.DB_LOG_HANDLER["CAPACITY"],
+	settings.DB_LOG_HANDLER["BATCH_SIZE"],
+	settings.DB_LOG_HANDLER["FLUSH_INTERVAL_SEC"],
+	settings.DB_LOG_HANDLER["OVERFLOW_POLICY"],
+	settings.DB_LOG_HANDLER["SPILL_PATH"],
+	AuditPolicy(
+		settings.AUDIT_POLICY["DEFAULT_SAMPLE_RATE"],
+		settings.AUDIT_POLICY["SAMPLE_RATES"],
+	),
+)
+db_handler.setLevel(logging.INFO)
+db_handler.setFormatter(formatter)
+logger.addHandler(db_handler)
+
+# Calls below every handler level return before a record is created
+logger.setLevel(min(handler.level for handler in logger.handlers))
+
+atexit.register(db_handler.close)
+atexit.register(listener.stop)
+metrics.register("db_log_handler", db_handler.stats)
+metrics.register("log_queue", listener.stats)
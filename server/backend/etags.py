@@ -0,0 +1,121 @@
+from django.db.models import Subquery
+from django.utils.cache import patch_vary_headers
+from django.utils.http import parse_etags
+from rest_framework import status
+from rest_framework.response import Response
+
+from .models import (
+	CatalogueVersion,
+	Ecclesiastical_Treasures,
+	RoleModel,
+	Users,
+)
+
+import hashlib
+
+
+# The read endpoints may be stored by the browser of the user only, and must be revalidated on every use
+CACHE_CONTROL = "private, no-cache"
+
+# The request headers that carry the identity of the user, which is part of every ETag
+VARY_HEADERS = ("Authorization", "Cookie")
+
+
+class TreasureState:
+	"""
+	The version of a treasure, its owner and the role of the current user,
+	read together. Responses that show the owner or whether the treasure
+	is editable take them from here rather than from the access cache, so
+	that they always match the ETag built from the same row.
+	"""
+
+	def __init__(self, user_id, ts_updated, user_role, owner_id, owner_email, owner_organization):
+		self.user_id = user_id
+		self.ts_updated = ts_updated
+		self.user_role = user_role
+		self.owner_id = owner_id
+		self.owner_email = owner_email
+		self.owner_organization = owner_organization
+		self.can_edit = user_role is not None and (user_id == owner_id or user_role == RoleModel.ADMIN)
+
+	@property
+	def version(self):
+		return (self.ts_updated, self.user_role)
+
+
+def treasure_state(treasure_uuid, user_id):
+	"""
+	Returns the TreasureState of a treasure for the current user, or None
+	if the treasure does not exist. One lookup of the uuid index.
+	"""
+	row = Ecclesiastical_Treasures.objects.filter(
+		uuid=treasure_uuid,
+	).annotate(
+		current_user_role=Subquery(Users.objects.filter(id=user_id).values("role")[:1]),
+	).values_list(
+		"ts_updated",
+		"current_user_role",
+		"user_fk_id",
+		"user_fk__email",
+		"user_fk__organization",
+	).first()
+
+	if row is None:
+		return None
+
+	return TreasureState(user_id, *row)
+
+
+def catalogue_state(user_id):
+	"""
+	Returns (catalogue version, role) of the current user, or None if the
+	user does not exist. One lookup of the primary key of the users.
+	"""
+	state = Users.objects.filter(
+		id=user_id,
+	).annotate(
+		catalogue_version=Subquery(CatalogueVersion.objects.filter(pk=1).values("version")[:1]),
+	).values_list("catalogue_version", "role").first()
+
+	if state is None:
+		return None
+
+	return state[0] or 0, state[1]
+
+
+def make_etag(*parts):
+	"""
+	Returns a strong ETag that changes with any of `parts`
+	"""
+	value = "\x1f".join(str(part) for part in parts)
+	return '"{}"'.format(hashlib.sha256(value.encode("utf-8")).hexdigest()[:32])
+
+
+def query_parts(request):
+	# The query parameters in a canonical order
+	return sorted((name, tuple(values)) for name, values in request.GET.lists())
+
+
+def is_not_modified(request, etag):
+	"""
+	Whether the If-None-Match header of the request holds `etag`
+	"""
+	if_none_match = request.META.get("HTTP_IF_NONE_MATCH")
+
+	if not if_none_match:
+		return False
+
+	# If-None-Match compares weakly, e.g. proxies that compress responses prefix the ETag with W/
+	etags = [value[2:] if value.startswith("W/") else value for value in parse_etags(if_none_match)]
+	return "*" in etags or etag in etags
+
+
+def set_validators(response, etag):
+	response["ETag"] = etag
+	response["Cache-Control"] = CACHE_CONTROL
+	patch_vary_headers(response, VARY_HEADERS)
+	return response
+
+
+def not_modified(etag):
+	return set_validators(Response(status=status.HTTP_304_NOT_MODIFIED), etag)
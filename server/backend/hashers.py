@@ -0,0 +1,45 @@
+from django.conf import settings
+from django.contrib.auth.hashers import (
+	PBKDF2PasswordHasher,
+	ScryptPasswordHasher,
+)
+
+import base64
+import hashlib
+
+
+class TunedPBKDF2PasswordHasher(PBKDF2PasswordHasher):
+	"""
+	PBKDF2 with the iteration count of the deployment. Hashes with any other
+	count still verify and are rehashed on the next successful login.
+	"""
+	iterations = settings.PASSWORD_HASHING["PBKDF2_ITERATIONS"]
+
+
+class TunedScryptPasswordHasher(ScryptPasswordHasher):
+	"""
+	Scrypt with the work factor of the deployment. Hashes with any other
+	parameters still verify and are rehashed on the next successful login.
+	maxmem is derived from the parameters of each hash, so that work factors
+	above the OpenSSL default limit of 32 MiB fit, including those of hashes
+	stored before the work factor was lowered.
+	"""
+	work_factor = settings.PASSWORD_HASHING["SCRYPT_WORK_FACTOR"]
+
+	def encode(self, password, salt, n=None, r=None, p=None):
+		self._check_encode_args(password, salt)
+		n = n or self.work_factor
+		r = r or self.block_size
+		p = p or self.parallelism
+		hash_ = hashlib.scrypt(
+			password.encode(),
+			salt=salt.encode(),
+			n=n,
+			r=r,
+			p=p,
+			# Twice the 128 * n * r * p bytes scrypt needs
+			maxmem=2 * 128 * n * r * p,
+			dklen=64,
+		)
+		hash_ = base64.b64encode(hash_).decode("ascii").strip()
+		return "%s$%d$%s$%d$%d$%s" % (self.algorithm, n, salt, r, p, hash_)
@@ -0,0 +1,137 @@
+from concurrent.futures import ThreadPoolExecutor
+from django.conf import settings
+from django.contrib.auth import hashers
+from threading import BoundedSemaphore, Lock
+
+from . import metrics
+from .application_error import ApplicationError
+from .custom_logging import logger as log
+
+
+def _is_gevent_patched():
+	try:
+		from gevent import monkey
+	except ImportError:
+		return False
+
+	return monkey.is_module_patched("threading")
+
+
+class HashingExecutor:
+	"""
+	Runs password hashing on a bounded pool of native threads. PBKDF2 and
+	scrypt release the GIL, so a gevent worker keeps serving its other
+	greenlets while a hash is being computed. At most MAX_WORKERS hashes run
+	at once and at most MAX_QUEUE wait; further submissions wait up to
+	QUEUE_TIMEOUT_SEC for a slot and are rejected with a 503 after that.
+	"""
+
+	def __init__(self, max_workers, max_queue, queue_timeout_sec):
+		self.max_workers = max_workers
+		self.max_queue = max_queue
+		self.queue_timeout_sec = queue_timeout_sec
+		self._slots = BoundedSemaphore(max_workers + max_queue)
+		self._lock = Lock()
+		self._pool = None
+		self._is_gevent = False
+		self.in_flight = 0
+		self.completed = 0
+		self.rejected = 0
+
+	def _get_pool(self):
+		# Created lazily, after gunicorn has forked and gevent has patched the worker
+		if self._pool is None:
+			with self._lock:
+				if self._pool is None:
+					self._is_gevent = _is_gevent_patched()
+
+					if self._is_gevent:
+						from gevent.threadpool import ThreadPool
+						self._pool = ThreadPool(self.max_workers)
+					else:
+						self._pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="hashing")
+
+		return self._pool
+
+	def submit(self, func, *args):
+		"""
+		Runs func(*args) on the pool and blocks the calling greenlet or
+		thread until the result is available
+		"""
+		if not self._slots.acquire(timeout=self.queue_timeout_sec):
+			with self._lock:
+				self.rejected += 1
+
+			raise ApplicationError(["service_unavailable"])
+
+		# Counters are only touched by callers, never by the pool threads
+		with self._lock:
+			self.in_flight += 1
+
+		try:
+			pool = self._get_pool()
+
+			if self._is_gevent:
+				return pool.spawn(func, *args).get()
+
+			return pool.submit(func, *args).result()
+		finally:
+			with self._lock:
+				self.in_flight -= 1
+				self.completed += 1
+
+			self._slots.release()
+
+	def stats(self):
+		with self._lock:
+			running = min(self.in_flight, self.max_workers)
+			return {
+				"backend": "gevent.threadpool" if self._is_gevent else "concurrent.futures",
+				"max_workers": self.max_workers,
+				"max_queue": self.max_queue,
+				"queue_depth": self.in_flight - running,
+				"running": running,
+				"completed": self.completed,
+				"rejected": self.rejected,
+			}
+
+
+executor = HashingExecutor(
+	settings.PASSWORD_HASHING_EXECUTOR["MAX_WORKERS"],
+	settings.PASSWORD_HASHING_EXECUTOR["MAX_QUEUE"],
+	settings.PASSWORD_HASHING_EXECUTOR["QUEUE_TIMEOUT_SEC"],
+)
+metrics.register("password_hashing", executor.stats)
+
+
+def make_password(password):
+	return executor.submit(hashers.make_password, password)
+
+
+def check_password(password, encoded):
+	"""
+	Returns (is_correct, must_update). must_update is True when the stored
+	hash uses an outdated hasher or work factor.
+	"""
+	result = {"must_update": False}
+
+	def setter(raw_password):
+		result["must_update"] = True
+
+	is_correct = executor.submit(hashers.check_password, password, encoded, setter)
+	return is_correct, result["must_update"]
+
+
+def check_user_password(user, password):
+	"""
+	Equivalent of AbstractBaseUser.check_password that hashes on the executor.
+	The upgraded hash is saved from the calling greenlet, never from a pool thread.
+	"""
+	is_correct, must_update = check_password(password, user.password)
+
+	if is_correct and must_update:
+		user.password = make_password(password)
+		user.save(update_fields=["password"])
+		log.debug("[hashing.check_user_password] Upgraded password hash of user {}".format(user.id))
+
+	return is_correct
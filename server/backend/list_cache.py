@@ -0,0 +1,101 @@
+from collections import OrderedDict
+from django.conf import settings
+from threading import Lock
+
+from . import metrics
+
+
+class ListResponseCache:
+	"""
+	Per-worker LRU cache of the pages of EcclesiasticalTreasuresList,
+	bounded by the number of pages and by the number of list items they
+	hold together. Keys start with the catalogue version, so every treasure
+	or media write makes the previous entries unreachable in all workers at
+	once; they are then evicted as least recently used.
+	"""
+
+	def __init__(self, max_entries, max_items):
+		self.max_entries = max_entries
+		self.max_items = max_items
+		self._entries = OrderedDict()
+		self._items = 0
+		self._lock = Lock()
+		self.hits = 0
+		self.misses = 0
+		self.evictions = 0
+
+	def get(self, key):
+		with self._lock:
+			entry = self._entries.get(key)
+
+			if entry is None:
+				self.misses += 1
+				return None
+
+			self._entries.move_to_end(key)
+			self.hits += 1
+			return entry[0]
+
+	def set(self, key, entry, items):
+		"""
+		Stores `entry`, a page of `items` list items. Pages larger than a
+		tenth of MAX_ITEMS are not cached, so that a few of them cannot
+		evict all the others.
+		"""
+		if self.max_entries <= 0 or items > self.max_items // 10:
+			return
+
+		with self._lock:
+			if key in self._entries:
+				self._items -= self._entries.pop(key)[1]
+
+			self._entries[key] = (entry, items)
+			self._items += items
+
+			while len(self._entries) > self.max_entries or self._items > self.max_items:
+				self._items -= self._entries.popitem(last=False)[1][1]
+				self.evictions += 1
+
+	def clear(self):
+		with self._lock:
+			self._entries.clear()
+			self._items = 0
+
+	def stats(self):
+		with self._lock:
+			lookups = self.hits + self.misses
+			return {
+				"entries": len(self._entries),
+				"max_entries": self.max_entries,
+				"items": self._items,
+				"max_items": self.max_items,
+				"hits": self.hits,
+				"misses": self.misses,
+				"hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+				"evictions": self.evictions,
+			}
+
+
+def make_key(catalogue_version, organization, search_keyword, exact_match, mode, page):
+	"""
+	Returns the cache key of a page of the list. The search keyword is
+	expected to be normalized by the caller, `page` is a hashable
+	description of the requested page, e.g. its cursor and limit. The
+	organization of the user is part of the key because it decides which
+	treasures come first, and so which ones are on each page.
+	"""
+	return (
+		catalogue_version,
+		organization,
+		mode,
+		bool(exact_match),
+		search_keyword or "",
+		page,
+	)
+
+
+list_cache = ListResponseCache(
+	settings.TREASURE_LIST_CACHE["MAX_ENTRIES"],
+	settings.TREASURE_LIST_CACHE["MAX_ITEMS"],
+)
+metrics.register("treasure_list_cache", list_cache.stats)
@@ -0,0 +1,202 @@
+from datetime import datetime, timezone
+from django.db import connection, transaction
+
+import gzip
+import os
+import re
+
+
+TABLE = "backend_loggingentries"
+DEFAULT_PARTITION = "{}_default".format(TABLE)
+PARTITION_NAME = re.compile(r"^{}_p(\d{{4}})(\d{{2}})$".format(TABLE))
+
+
+def _month_start(year, month):
+	year, month = year + (month - 1) // 12, (month - 1) % 12 + 1
+	return datetime(year, month, 1, tzinfo=timezone.utc)
+
+
+def _add_months(month_start, months):
+	return _month_start(month_start.year, month_start.month + months)
+
+
+def _partition_name(month_start):
+	return "{}_p{:04d}{:02d}".format(TABLE, month_start.year, month_start.month)
+
+
+def is_postgres():
+	return connection.vendor == "postgresql"
+
+
+def table_exists(cursor):
+	cursor.execute("SELECT to_regclass(%s) IS NOT NULL", [TABLE])
+	return cursor.fetchone()[0]
+
+
+def is_partitioned(cursor):
+	cursor.execute("SELECT relkind FROM pg_class WHERE oid = to_regclass(%s)", [TABLE])
+	row = cursor.fetchone()
+	return row is not None and row[0] == "p"
+
+
+def list_partitions(cursor):
+	"""
+	Returns {month_start: partition_name} of the monthly partitions
+	"""
+	cursor.execute("""
+		SELECT child.relname
+		FROM pg_inherits
+		JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+		WHERE pg_inherits.inhparent = to_regclass(%s)
+	""", [TABLE])
+	partitions = {}
+
+	for (name,) in cursor.fetchall():
+		match = PARTITION_NAME.match(name)
+
+		if match:
+			partitions[_month_start(int(match.group(1)), int(match.group(2)))] = name
+
+	return partitions
+
+
+def _create_partition(cursor, month_start):
+	# Rows of the month that were routed to the default partition move into
+	# the new one, otherwise attaching it would fail
+	name = _partition_name(month_start)
+	bounds = [month_start, _add_months(month_start, 1)]
+	cursor.execute("CREATE TABLE {} (LIKE {} INCLUDING DEFAULTS)".format(name, TABLE))
+	cursor.execute("""
+		WITH moved AS (
+			DELETE FROM {} WHERE ts_added >= %s AND ts_added < %s RETURNING *
+		)
+		INSERT INTO {} SELECT * FROM moved
+	""".format(DEFAULT_PARTITION, name), bounds)
+	cursor.execute("ALTER TABLE {} ATTACH PARTITION {} FOR VALUES FROM (%s) TO (%s)".format(TABLE, name), bounds)
+
+
+def convert_to_partitioned():
+	"""
+	Replaces the table created by the migrations with one partitioned by
+	month on ts_added, keeping its rows, indexes and foreign keys. The
+	primary key becomes (id, ts_added) since it has to include the partition
+	key; the ORM keeps addressing rows by id. Does nothing if the table is
+	already partitioned. Runs in a single transaction.
+	"""
+	with transaction.atomic(), connection.cursor() as cursor:
+		if not table_exists(cursor) or is_partitioned(cursor):
+			return False
+
+		cursor.execute("LOCK TABLE {} IN ACCESS EXCLUSIVE MODE".format(TABLE))
+		cursor.execute("""
+			SELECT indexdef FROM pg_indexes
+			WHERE schemaname = current_schema() AND tablename = %s AND indexname <> %s
+		""", [TABLE, "{}_pkey".format(TABLE)])
+		index_definitions = [row[0] for row in cursor.fetchall()]
+		cursor.execute("""
+			SELECT conname, pg_get_constraintdef(oid) FROM pg_constraint
+			WHERE conrelid = to_regclass(%s) AND contype = 'f'
+		""", [TABLE])
+		foreign_keys = cursor.fetchall()
+		cursor.execute("SELECT pg_get_serial_sequence(%s, 'id')", [TABLE])
+		sequence = cursor.fetchone()[0]
+
+		legacy_table = "{}_legacy".format(TABLE)
+		cursor.execute("ALTER TABLE {} RENAME TO {}".format(TABLE, legacy_table))
+		cursor.execute("CREATE TABLE {} (LIKE {} INCLUDING DEFAULTS) PARTITION BY RANGE (ts_added)".format(
+			TABLE,
+			legacy_table
+		))
+		cursor.execute("CREATE TABLE {} PARTITION OF {} DEFAULT".format(DEFAULT_PARTITION, TABLE))
+
+		cursor.execute("SELECT min(ts_added), max(ts_added) FROM {}".format(legacy_table))
+		oldest, newest = cursor.fetchone()
+
+		if oldest is not None:
+			month_start = _month_start(oldest.year, oldest.month)
+
+			while month_start <= newest:
+				_create_partition(cursor, month_start)
+				month_start = _add_months(month_start, 1)
+
+		cursor.execute("INSERT INTO {} SELECT * FROM {}".format(TABLE, legacy_table))
+
+		if sequence:
+			cursor.execute("ALTER SEQUENCE {} OWNED BY {}.id".format(sequence, TABLE))
+
+		cursor.execute("DROP TABLE {}".format(legacy_table))
+		cursor.execute("ALTER TABLE {0} ADD CONSTRAINT {0}_pkey PRIMARY KEY (id, ts_added)".format(TABLE))
+
+		for index_definition in index_definitions:
+			cursor.execute(index_definition)
+
+		for name, definition in foreign_keys:
+			cursor.execute("ALTER TABLE {} ADD CONSTRAINT {} {}".format(TABLE, name, definition))
+
+	return True
+
+
+def ensure_partitions(months_ahead):
+	"""
+	Creates the partitions of the current month and of the next
+	`months_ahead` months. Returns the names of the created partitions.
+	"""
+	now = datetime.now(timezone.utc)
+	current_month = _month_start(now.year, now.month)
+	created = []
+
+	with transaction.atomic(), connection.cursor() as cursor:
+		if not is_partitioned(cursor):
+			return created
+
+		existing = list_partitions(cursor)
+
+		for months in range(months_ahead + 1):
+			month_start = _add_months(current_month, months)
+
+			if month_start not in existing:
+				_create_partition(cursor, month_start)
+				created.append(_partition_name(month_start))
+
+	return created
+
+
+def archive_partitions(retention_months, archive_dir):
+	"""
+	Detaches the partitions of the months that ended more than
+	`retention_months` months ago, writes each one to a gzipped CSV file in
+	`archive_dir` and drops it. A partition is dropped only after its file
+	has been written. Returns the paths of the written files.
+	"""
+	now = datetime.now(timezone.utc)
+	cutoff = _add_months(_month_start(now.year, now.month), -retention_months)
+	archived = []
+
+	with connection.cursor() as cursor:
+		if not is_partitioned(cursor):
+			return archived
+
+		expired = sorted(
+			(month_start, name) for month_start, name in list_partitions(cursor).items()
+			if _add_months(month_start, 1) <= cutoff
+		)
+
+	if expired:
+		os.makedirs(archive_dir, exist_ok=True)
+
+	for month_start, name in expired:
+		path = os.path.join(archive_dir, "{}.csv.gz".format(name))
+		temp_path = "{}.tmp".format(path)
+
+		with transaction.atomic(), connection.cursor() as cursor:
+			cursor.execute("ALTER TABLE {} DETACH PARTITION {}".format(TABLE, name))
+
+			with gzip.open(temp_path, "wt", encoding="utf-8") as f:
+				cursor.copy_expert("COPY {} TO STDOUT WITH (FORMAT csv, HEADER)".format(name), f)
+
+			os.replace(temp_path, path)
+			cursor.execute("DROP TABLE {}".format(name))
+
+		archived.append(path)
+
+	return archived
@@ -0,0 +1,167 @@
+from collections import Counter
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import Count, Min, Q, Sum
+from django.db.models.functions import TruncDay, TruncHour
+
+from .models import LoggingEntries, LoggingRollup, Users
+
+import datetime
+
+
+DEFAULT_RANGE_DAYS = 7
+MAX_RANGE_DAYS = 366
+GRANULARITIES = {
+	"hour": TruncHour,
+	"day": TruncDay,
+}
+
+_UPSERT = """
+	INSERT INTO {table} (hour, api, action, is_error, organization, count)
+	VALUES {values}
+	ON CONFLICT (hour, api, action, is_error, organization)
+	DO UPDATE SET count = {table}.count + EXCLUDED.count
+"""
+
+
+def _upsert(counts):
+	# Sorted so that concurrent flushes of different workers lock rows in the same order
+	rows = sorted(counts.items())
+
+	if not rows:
+		return
+
+	with connection.cursor() as cursor:
+		cursor.execute(
+			_UPSERT.format(
+				table=LoggingRollup._meta.db_table,
+				values=", ".join(["(%s, %s, %s, %s, %s, %s)"] * len(rows)),
+			),
+			[value for key, count in rows for value in key + (count,)]
+		)
+
+
+def record_entries(log_entries):
+	"""
+	Adds the entries to the hourly counts. Called by the database log
+	handler in the transaction that inserts the entries, with the entries
+	that the audit policy samples out and those that could not be written
+	before. The counts of sampled apis therefore exceed their rows in the
+	table, see rebuild.
+	"""
+	user_ids = set(log_entry.user_fk_id for log_entry in log_entries if log_entry.user_fk_id)
+	organizations = dict(Users.objects.filter(id__in=user_ids).values_list("id", "organization")) if user_ids else {}
+	counts = Counter()
+
+	for log_entry in log_entries:
+		counts[(
+			log_entry.ts_added.replace(minute=0, second=0, microsecond=0),
+			log_entry.api or "",
+			log_entry.action or "",
+			bool(log_entry.is_error),
+			organizations.get(log_entry.user_fk_id) or "",
+		)] += 1
+
+	_upsert(counts)
+
+
+def _complete():
+	"""
+	Returns the condition of the keys whose entries all have a row in the
+	logs table under the current AUDIT_POLICY: errors, and the apis that
+	are not sampled
+	"""
+	policy = settings.AUDIT_POLICY
+
+	if policy["DEFAULT_SAMPLE_RATE"] >= 1:
+		sampled_apis = [api for api, sample_rate in policy["SAMPLE_RATES"].items() if sample_rate < 1]
+		return Q(is_error=True) | ~Q(api__in=sampled_apis)
+
+	complete_apis = [api for api, sample_rate in policy["SAMPLE_RATES"].items() if sample_rate >= 1]
+	return Q(is_error=True) | Q(api__in=complete_apis)
+
+
+def _to_hour(ts, round_up=False):
+	hour = ts.replace(minute=0, second=0, microsecond=0)
+	return hour + datetime.timedelta(hours=1) if round_up and hour != ts else hour
+
+
+def rebuild(ts_from=None, ts_to=None):
+	"""
+	Recomputes the counts of errors and of the apis that are not sampled
+	within [ts_from, ts_to), widened to whole hours, from LoggingEntries.
+	ts_from defaults to the hour of the oldest entry, so the counts of
+	archived partitions are kept, and ts_to to no bound. The other counts
+	include entries that have no row, they are kept as they are. The
+	recomputed counts lose the entries that the database log handler had
+	to drop. Returns the number of recomputed rows.
+	"""
+	complete = _complete()
+
+	with transaction.atomic():
+		cursor = connection.cursor()
+		cursor.execute("LOCK TABLE {} IN EXCLUSIVE MODE".format(LoggingRollup._meta.db_table))
+
+		if ts_from is None:
+			ts_from = LoggingEntries.objects.aggregate(ts_from=Min("ts_added"))["ts_from"]
+
+			if ts_from is None:
+				return 0
+
+		rollups = LoggingRollup.objects.filter(complete, hour__gte=_to_hour(ts_from))
+		entries = LoggingEntries.objects.filter(complete, ts_added__gte=_to_hour(ts_from))
+
+		if ts_to is not None:
+			rollups = rollups.filter(hour__lt=_to_hour(ts_to, round_up=True))
+			entries = entries.filter(ts_added__lt=_to_hour(ts_to, round_up=True))
+
+		rollups.delete()
+		rows = entries.annotate(
+			hour=TruncHour("ts_added")
+		).values(
+			"hour",
+			"api",
+			"action",
+			"is_error",
+			"user_fk__organization",
+		).annotate(
+			count=Count("id")
+		).order_by()
+
+		LoggingRollup.objects.bulk_create([
+			LoggingRollup(
+				hour=row["hour"],
+				api=row["api"] or "",
+				action=row["action"] or "",
+				is_error=bool(row["is_error"]),
+				organization=row["user_fk__organization"] or "",
+				count=row["count"],
+			)
+			for row in rows
+		], batch_size=1000)
+
+	return len(rows)
+
+
+def query(filters, granularity="hour"):
+	"""
+	Returns the counts within [ts_from, ts_to) that match the filters,
+	summed per `granularity` bucket
+	"""
+	queryset = LoggingRollup.objects.filter(hour__gte=filters["ts_from"], hour__lt=filters["ts_to"])
+
+	for field_name in ("api", "action", "is_error", "organization"):
+		if filters.get(field_name) is not None:
+			queryset = queryset.filter(**{field_name: filters[field_name]})
+
+	return list(queryset.annotate(
+		bucket=GRANULARITIES[granularity]("hour")
+	).values(
+		"bucket",
+		"api",
+		"action",
+		"is_error",
+		"organization",
+	).annotate(
+		total=Sum("count")
+	).order_by("bucket", "api", "action", "is_error", "organization"))
@@ -0,0 +1,12 @@
+from django.core.management.base import BaseCommand
+
+from backend import treasure_sync
+
+
+class Command(BaseCommand):
+	help = "Stores the cover photo of every treasure, e.g. after media were changed outside the API. " \
+		"Treasures synced after a migrate get theirs then."
+
+	def handle(self, *args, **options):
+		covered = treasure_sync.backfill_covers()
+		self.stdout.write("Stored the covers of {} treasures".format(covered))
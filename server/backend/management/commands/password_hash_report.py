@@ -0,0 +1,62 @@
+from collections import Counter
+from django.contrib.auth.hashers import (
+	UNUSABLE_PASSWORD_PREFIX,
+	get_hasher,
+)
+from django.core.management.base import BaseCommand
+
+from backend.models import Users
+
+
+WORK_FACTOR_KEYS = ("iterations", "work_factor", "block_size", "parallelism")
+
+
+class Command(BaseCommand):
+	help = "Reports the distribution of password hash algorithms and work factors across users"
+
+	def describe(self, encoded):
+		"""
+		Returns (algorithm, work factor description, must_update)
+		"""
+		if not encoded or encoded.startswith(UNUSABLE_PASSWORD_PREFIX):
+			return "unusable", "-", False
+
+		algorithm = encoded.split("$", 1)[0]
+
+		try:
+			hasher = get_hasher(algorithm)
+			decoded = hasher.decode(encoded)
+		except Exception:
+			return algorithm, "unknown", True
+
+		work_factor = ", ".join(
+			"{}={}".format(key, decoded[key]) for key in WORK_FACTOR_KEYS if key in decoded
+		)
+		must_update = algorithm != self.preferred.algorithm or self.preferred.must_update(encoded)
+		return algorithm, work_factor, must_update
+
+	def handle(self, *args, **options):
+		self.preferred = get_hasher("default")
+		distribution = Counter()
+		total = 0
+		must_update_total = 0
+
+		for encoded in Users.objects.values_list("password", flat=True).iterator():
+			algorithm, work_factor, must_update = self.describe(encoded)
+			distribution[(algorithm, work_factor, must_update)] += 1
+			total += 1
+			must_update_total += must_update
+
+		self.stdout.write("Preferred hasher: {}".format(self.preferred.algorithm))
+		self.stdout.write("{:<16} {:<48} {:<12} {:>8}".format("Algorithm", "Work factor", "Upgrade", "Users"))
+
+		for (algorithm, work_factor, must_update), count in distribution.most_common():
+			self.stdout.write("{:<16} {:<48} {:<12} {:>8}".format(
+					algorithm,
+					work_factor,
+					"on login" if must_update else "no",
+					count
+				)
+			)
+
+		self.stdout.write("Total users: {}, pending upgrade on next login: {}".format(total, must_update_total))
@@ -0,0 +1,31 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from backend import log_rollups
+
+
+def parse_time(value):
+	ts = parse_datetime(value)
+
+	if ts is None:
+		raise CommandError("Invalid date and time: {}".format(value))
+
+	return timezone.make_aware(ts, timezone.utc) if timezone.is_naive(ts) else ts
+
+
+class Command(BaseCommand):
+	help = "Recomputes the hourly log counts of errors and of the apis that are not sampled from the log entries, " \
+		"e.g. after the first deployment of the rollups. The counts of sampled apis, and those older than the " \
+		"oldest log entry, are kept. The recomputed counts lose the entries that the database log handler " \
+		"dropped, because they have no row."
+
+	def add_arguments(self, parser):
+		parser.add_argument("--from", dest="ts_from", type=parse_time,
+			help="First hour to recompute, e.g. 2024-01-01T00:00. Defaults to the hour of the oldest log entry.")
+		parser.add_argument("--to", dest="ts_to", type=parse_time,
+			help="Hour to stop before, e.g. 2024-02-01T00:00. Defaults to no bound.")
+
+	def handle(self, *args, **options):
+		rows = log_rollups.rebuild(options["ts_from"], options["ts_to"])
+		self.stdout.write("Rebuilt {} rollup rows".format(rows))
@@ -0,0 +1,12 @@
+from django.core.management.base import BaseCommand
+
+from backend import treasure_sync
+
+
+class Command(BaseCommand):
+	help = "Rebuilds the full text search documents of all treasures, e.g. after a change of their fields. " \
+		"Treasures without a search document get one after every migrate."
+
+	def handle(self, *args, **options):
+		synced = treasure_sync.rebuild()
+		self.stdout.write("Rebuilt {} search documents".format(synced))
@@ -0,0 +1,12 @@
+from django.core.management.base import BaseCommand
+
+from backend import treasure_sync
+
+
+class Command(BaseCommand):
+	help = "Rebuilds the summaries of all treasures read by the list and the treasure pages, e.g. after a change of their fields. " \
+		"Treasures without a summary get one after every migrate."
+
+	def handle(self, *args, **options):
+		rebuilt = treasure_sync.rebuild_summaries()
+		self.stdout.write("Rebuilt {} treasure summaries".format(rebuilt))
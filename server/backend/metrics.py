@@ -0,0 +1,38 @@
+from threading import Lock
+
+
+_providers = {}
+_providers_lock = Lock()
+
+
+def register(name, provider):
+	"""
+	Registers a callable that returns a dictionary with the current
+	counters of a component. Registering the same name again replaces
+	the previous provider.
+	"""
+	with _providers_lock:
+		_providers[name] = provider
+
+
+def unregister(name):
+	with _providers_lock:
+		_providers.pop(name, None)
+
+
+def snapshot():
+	"""
+	Returns the counters of every registered component of this worker process
+	"""
+	with _providers_lock:
+		providers = list(_providers.items())
+
+	results = {}
+
+	for name, provider in providers:
+		try:
+			results[name] = provider()
+		except Exception as e:
+			results[name] = {"error": str(e)}
+
+	return results
@@ -1,6 +1,9 @@
 from django.conf import settings
 from django.contrib.auth.models import AbstractBaseUser
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
+from django.db.models.functions import Cast, Upper
 from django.utils.timezone import now
 from django.core.files.storage import FileSystemStorage
 from datetime import timedelta
@@ -8,6 +11,16 @@ from datetime import timedelta
 upload_protected_storage = FileSystemStorage(location=settings.PROTECTED_MEDIA_ROOT)
 
 
+def trigram_index(field_name, name):
+	# Indexes UPPER(column::text), the expression that __icontains compiles to on
+	# PostgreSQL, so that substring searches can use the index. Needs pg_trgm,
+	# see backend.apps.
+	return GinIndex(
+		OpClass(Upper(Cast(field_name, output_field=models.TextField())), name="gin_trgm_ops"),
+		name=name,
+	)
+
+
 class OrganizationModel(models.Model):
 	AUTH = "AUTH"
 	IHU = "IHU"
@@ -49,6 +62,15 @@ class Users(AbstractBaseUser):
 
 	USERNAME_FIELD = "email"
 
+	class Meta:
+		indexes = [
+			trigram_index("email", "users_email_trgm"),
+			trigram_index("name", "users_name_trgm"),
+			trigram_index("surname", "users_surname_trgm"),
+			trigram_index("telephone", "users_telephone_trgm"),
+			trigram_index("organization", "users_organization_trgm"),
+		]
+
 
 class Ecclesiastical_Treasures(models.Model):
 	uuid = models.CharField(max_length=100, unique=True, null=False)
@@ -58,9 +80,16 @@ class Ecclesiastical_Treasures(models.Model):
 		on_delete=models.CASCADE,
 	)
 	ref_code = models.CharField(max_length=100, null=True, blank=True)
+	# The resized first 2D photo shown in the list, kept by backend.treasure_sync
+	cover_img_src = models.CharField(max_length=1000, null=True, blank=True, default=None)
 	ts_added = models.DateTimeField(default=now)
 	ts_updated = models.DateTimeField(default=now)
 
+	class Meta:
+		indexes = [
+			trigram_index("uuid", "treasures_uuid_trgm"),
+		]
+
 
 class E56_Language(models.Model):
 	code = models.CharField(max_length=1000, unique=True, null=False, blank=False)
@@ -78,6 +107,11 @@ class E5_Event(models.Model):
 	ts_added = models.DateTimeField(default=now)
 	ts_updated = models.DateTimeField(default=now)
 
+	class Meta:
+		indexes = [
+			trigram_index("content", "e5_content_trgm"),
+		]
+
 
 class E11_Modification(models.Model):
 	treasure_fk = models.ForeignKey(
@@ -89,6 +123,11 @@ class E11_Modification(models.Model):
 	ts_added = models.DateTimeField(default=now)
 	ts_updated = models.DateTimeField(default=now)
 
+	class Meta:
+		indexes = [
+			trigram_index("content", "e11_content_trgm"),
+		]
+
 
 class E14_Condition_Assessment(models.Model):
 	treasure_fk = models.ForeignKey(
@@ -100,6 +139,11 @@ class E14_Condition_Assessment(models.Model):
 	ts_added = models.DateTimeField(default=now)
 	ts_updated = models.DateTimeField(default=now)
 
+	class Meta:
+		indexes = [
+			trigram_index("content", "e14_content_trgm"),
+		]
+
 
 class E34_Inscription(models.Model):
 	treasure_fk = models.ForeignKey(
@@ -111,6 +155,11 @@ class E34_Inscription(models.Model):
 	ts_added = models.DateTimeField(default=now)
 	ts_updated = models.DateTimeField(default=now)
 
+	class Meta:
+		indexes = [
+			trigram_index("content", "e34_content_trgm"),
+		]
+
 
 class E35_Title(models.Model):
 	treasure_fk = models.ForeignKey(
@@ -127,6 +176,11 @@ class E35_Title(models.Model):
 	ts_added = models.DateTimeField(default=now)
 	ts_updated = models.DateTimeField(default=now)
 
+	class Meta:
+		indexes = [
+			trigram_index("content", "e35_content_trgm"),
+		]
+
 
 class E41_Appellation(models.Model):
 	treasure_fk = models.ForeignKey(
@@ -143,6 +197,11 @@ class E41_Appellation(models.Model):
 	ts_added = models.DateTimeField(default=now)
 	ts_updated = models.DateTimeField(default=now)
 
+	class Meta:
+		indexes = [
+			trigram_index("content", "e41_content_trgm"),
+		]
+
 
 class E42_Identifier(models.Model):
 	treasure_fk = models.ForeignKey(
@@ -154,6 +213,11 @@ class E42_Identifier(models.Model):
 	ts_added = models.DateTimeField(default=now)
 	ts_updated = models.DateTimeField(default=now)
 
+	class Meta:
+		indexes = [
+			trigram_index("code", "e42_code_trgm"),
+		]
+
 
 class E52_Time_Span(models.Model):
 	treasure_fk = models.ForeignKey(
@@ -165,6 +229,11 @@ class E52_Time_Span(models.Model):
 	ts_added = models.DateTimeField(default=now)
 	ts_updated = models.DateTimeField(default=now)
 
+	class Meta:
+		indexes = [
+			trigram_index("duration", "e52_duration_trgm"),
+		]
+
 
 class E53_Place(models.Model):
 	treasure_fk = models.ForeignKey(
@@ -176,6 +245,11 @@ class E53_Place(models.Model):
 	ts_added = models.DateTimeField(default=now)
 	ts_updated = models.DateTimeField(default=now)
 
+	class Meta:
+		indexes = [
+			trigram_index("content", "e53_content_trgm"),
+		]
+
 
 class E54_Dimension(models.Model):
 	treasure_fk = models.ForeignKey(
@@ -187,6 +261,11 @@ class E54_Dimension(models.Model):
 	ts_added = models.DateTimeField(default=now)
 	ts_updated = models.DateTimeField(default=now)
 
+	class Meta:
+		indexes = [
+			trigram_index("content", "e54_content_trgm"),
+		]
+
 
 class E55_Type(models.Model):
 	treasure_fk = models.ForeignKey(
@@ -198,6 +277,11 @@ class E55_Type(models.Model):
 	ts_added = models.DateTimeField(default=now)
 	ts_updated = models.DateTimeField(default=now)
 
+	class Meta:
+		indexes = [
+			trigram_index("kind", "e55_kind_trgm"),
+		]
+
 
 class E57_Material(models.Model):
 	treasure_fk = models.ForeignKey(
@@ -209,6 +293,11 @@ class E57_Material(models.Model):
 	ts_added = models.DateTimeField(default=now)
 	ts_updated = models.DateTimeField(default=now)
 
+	class Meta:
+		indexes = [
+			trigram_index("content", "e57_content_trgm"),
+		]
+
 
 class E63_Beginning_of_Existence(models.Model):
 	treasure_fk = models.ForeignKey(
@@ -220,6 +309,11 @@ class E63_Beginning_of_Existence(models.Model):
 	ts_added = models.DateTimeField(default=now)
 	ts_updated = models.DateTimeField(default=now)
 
+	class Meta:
+		indexes = [
+			trigram_index("content", "e63_content_trgm"),
+		]
+
 
 class E71_Human_Made_Thing(models.Model):
 	treasure_fk = models.ForeignKey(
@@ -231,6 +325,11 @@ class E71_Human_Made_Thing(models.Model):
 	ts_added = models.DateTimeField(default=now)
 	ts_updated = models.DateTimeField(default=now)
 
+	class Meta:
+		indexes = [
+			trigram_index("creator", "e71_creator_trgm"),
+		]
+
 
 class E73_Information_Object(models.Model):
 	treasure_fk = models.ForeignKey(
@@ -242,6 +341,11 @@ class E73_Information_Object(models.Model):
 	ts_added = models.DateTimeField(default=now)
 	ts_updated = models.DateTimeField(default=now)
 
+	class Meta:
+		indexes = [
+			trigram_index("content", "e73_content_trgm"),
+		]
+
 
 class E74_Group(models.Model):
 	treasure_fk = models.ForeignKey(
@@ -253,6 +357,11 @@ class E74_Group(models.Model):
 	ts_added = models.DateTimeField(default=now)
 	ts_updated = models.DateTimeField(default=now)
 
+	class Meta:
+		indexes = [
+			trigram_index("content", "e74_content_trgm"),
+		]
+
 
 class E78_Curated_Holding(models.Model):
 	treasure_fk = models.ForeignKey(
@@ -264,6 +373,11 @@ class E78_Curated_Holding(models.Model):
 	ts_added = models.DateTimeField(default=now)
 	ts_updated = models.DateTimeField(default=now)
 
+	class Meta:
+		indexes = [
+			trigram_index("content", "e78_content_trgm"),
+		]
+
 
 class Biography(models.Model):
 	treasure_fk = models.ForeignKey(
@@ -288,6 +402,11 @@ class Data_Administration(models.Model):
 	ts_added = models.DateTimeField(default=now)
 	ts_updated = models.DateTimeField(default=now)
 
+	class Meta:
+		indexes = [
+			trigram_index("content", "data_admin_content_trgm"),
+		]
+
 
 class Description(models.Model):
 	treasure_fk = models.ForeignKey(
@@ -301,6 +420,12 @@ class Description(models.Model):
 	ts_added = models.DateTimeField(default=now)
 	ts_updated = models.DateTimeField(default=now)
 
+	class Meta:
+		indexes = [
+			trigram_index("short_version", "descr_short_version_trgm"),
+			trigram_index("extended_version", "descr_extended_version_trgm"),
+		]
+
 
 class Pieces_of_Ecclesiastical_Treasure(models.Model):
 	treasure_fk = models.ForeignKey(
@@ -313,6 +438,12 @@ class Pieces_of_Ecclesiastical_Treasure(models.Model):
 	ts_added = models.DateTimeField(default=now)
 	ts_updated = models.DateTimeField(default=now)
 
+	class Meta:
+		indexes = [
+			trigram_index("documentation", "pieces_documentation_trgm"),
+			trigram_index("bibliography", "pieces_bibliography_trgm"),
+		]
+
 
 class Previous_Documentation(models.Model):
 	treasure_fk = models.ForeignKey(
@@ -325,6 +456,12 @@ class Previous_Documentation(models.Model):
 	ts_added = models.DateTimeField(default=now)
 	ts_updated = models.DateTimeField(default=now)
 
+	class Meta:
+		indexes = [
+			trigram_index("documentation", "prev_doc_documentation_trgm"),
+			trigram_index("bibliography", "prev_doc_bibliography_trgm"),
+		]
+
 
 class Treasure_Images(models.Model):
 	treasure_fk = models.ForeignKey(
@@ -408,3 +545,120 @@ class LoggingEntries(models.Model):
 	is_error = models.BooleanField(null=True, blank=True, default=False)
 	ts_added = models.DateTimeField(default=now)
 	ts_last_updated = models.DateTimeField(default=now)
+
+	class Meta:
+		# Keyset pagination of the system logs, alone and with each filter
+		indexes = [
+			models.Index(fields=["ts_added", "id"], name="logging_ts_id_idx"),
+			models.Index(fields=["api", "ts_added", "id"], name="logging_api_ts_id_idx"),
+			models.Index(fields=["action", "ts_added", "id"], name="logging_action_ts_id_idx"),
+			models.Index(fields=["user_fk", "ts_added", "id"], name="logging_user_ts_id_idx"),
+			models.Index(fields=["ip_address", "ts_added", "id"], name="logging_ip_ts_id_idx"),
+			models.Index(fields=["is_error", "ts_added", "id"], name="logging_error_ts_id_idx"),
+		]
+
+
+class LoggingRollup(models.Model):
+	"""
+	Number of log entries per hour, api, action, is_error and organization
+	of the user. Kept current by the database log handler, see
+	backend.log_rollups. Missing values are stored as empty strings so that
+	every key is unique.
+	"""
+	hour = models.DateTimeField()
+	api = models.CharField(max_length=100, default="")
+	action = models.CharField(max_length=100, default="")
+	is_error = models.BooleanField(default=False)
+	organization = models.CharField(max_length=50, default="")
+	count = models.BigIntegerField(default=0)
+
+	class Meta:
+		constraints = [
+			models.UniqueConstraint(
+				fields=["hour", "api", "action", "is_error", "organization"],
+				name="logging_rollup_key",
+			),
+		]
+
+
+class RateLimitBucket(models.Model):
+	"""
+	A token bucket of backend.rate_limiting shared by all workers. Times are
+	seconds since the epoch on the clock of the database.
+	"""
+	key = models.CharField(max_length=200, primary_key=True)
+	tokens = models.FloatField()
+	updated_at = models.FloatField()
+	expires_at = models.FloatField(db_index=True)
+
+	class Meta:
+		db_table = "rate_limit_bucket"
+
+
+class TreasureSearchDocument(models.Model):
+	"""
+	The searchable text of a treasure, denormalized from the tables that
+	reference it and grouped by weight, with its full text search vector.
+	Kept current by backend.treasure_sync.
+	"""
+	treasure = models.OneToOneField(
+		Ecclesiastical_Treasures,
+		to_field="uuid",
+		on_delete=models.CASCADE,
+		primary_key=True,
+		related_name="search_document",
+	)
+	titles = models.TextField(default="")
+	descriptions = models.TextField(default="")
+	details = models.TextField(default="")
+	owner = models.TextField(default="")
+	search_vector = SearchVectorField(null=True)
+	ts_updated = models.DateTimeField(default=now)
+
+	class Meta:
+		indexes = [
+			GinIndex(fields=["search_vector"], name="treasure_search_vector_idx"),
+		]
+
+
+class TreasureSummary(models.Model):
+	"""
+	The fields of a treasure shown in the list and in the headers of its
+	pages, denormalized from the treasure, its English title and
+	appellation and its owner. Kept current by backend.treasure_sync.
+	"""
+	treasure = models.OneToOneField(
+		Ecclesiastical_Treasures,
+		to_field="uuid",
+		on_delete=models.CASCADE,
+		primary_key=True,
+		related_name="summary",
+	)
+	user_fk = models.ForeignKey(
+		Users,
+		to_field="id",
+		on_delete=models.CASCADE,
+	)
+	user_email = models.CharField(max_length=100, default="")
+	user_organization = models.CharField(max_length=50, default="")
+	title_en = models.CharField(max_length=1000, null=True, blank=True, default=None)
+	appellation_en = models.CharField(max_length=1000, null=True, blank=True, default=None)
+	cover_img_src = models.CharField(max_length=1000, null=True, blank=True, default=None)
+	ts_added = models.DateTimeField(default=now)
+	ts_updated = models.DateTimeField(default=now)
+
+	class Meta:
+		db_table = "treasure_summary"
+
+
+class CatalogueVersion(models.Model):
+	"""
+	A single row whose version is bumped by backend.treasure_sync after every
+	write of a treasure, its media or the users shown in the list, so that
+	responses derived from the catalogue can tell whether they are current.
+	"""
+	version = models.BigIntegerField(default=0)
+	ts_updated = models.DateTimeField(default=now)
+
+	class Meta:
+		db_table = "catalogue_version"
@@ -0,0 +1,290 @@
+from collections import OrderedDict
+from django.conf import settings
+from django.db import connection, transaction
+from rest_framework.response import Response
+from threading import Lock
+
+from . import metrics
+from .application_error import ApplicationError
+from .custom_logging import logger as log
+from .models import RateLimitBucket
+from .views_utils import get_ip_address
+
+import functools
+import hashlib
+import math
+import time
+
+
+class TokenBucket:
+	"""
+	Token bucket that holds up to `capacity` tokens and regains
+	`refill_per_min` tokens per minute
+	"""
+
+	def __init__(self, capacity, refill_per_min):
+		self.capacity = capacity
+		self.refill_per_sec = refill_per_min / 60.0
+
+	def take(self, state, now):
+		"""
+		Returns (new_state, retry_after_sec) for a request at `now`.
+		retry_after_sec is 0 when the request is allowed.
+		"""
+		if state is None:
+			tokens = self.capacity
+		else:
+			tokens, updated_at = state
+			tokens = min(self.capacity, tokens + (now - updated_at) * self.refill_per_sec)
+
+		if tokens >= 1:
+			return (tokens - 1, now), 0
+
+		return (tokens, now), (1 - tokens) / self.refill_per_sec
+
+	def ttl(self):
+		return int(math.ceil(self.capacity / self.refill_per_sec))
+
+
+class LocalBackend:
+	"""
+	Buckets kept in the memory of the worker process. The limits apply per
+	worker, so on its own the effective limit of a deployment is multiplied
+	by the number of workers.
+	"""
+
+	def __init__(self, max_keys):
+		self.max_keys = max_keys
+		self._buckets = OrderedDict()
+		self._lock = Lock()
+
+	def take_all(self, keyed_buckets):
+		now = time.monotonic()
+
+		with self._lock:
+			states, retry_after = _take_all(keyed_buckets, {key: self._buckets.get(key) for key in keyed_buckets}, now)
+
+			if retry_after:
+				return retry_after
+
+			for key, state in states.items():
+				self._buckets[key] = state
+				self._buckets.move_to_end(key)
+
+			while len(self._buckets) > self.max_keys:
+				self._buckets.popitem(last=False)
+
+		return 0
+
+	def size(self):
+		return len(self._buckets)
+
+
+class DatabaseBackend:
+	"""
+	Buckets kept in the rate_limit_bucket table, shared by all workers. The
+	rows of the buckets of a request are locked in key order within one
+	transaction, so concurrent requests never take the same token twice.
+	Times are taken from the clock of the database.
+	"""
+
+	_INSERT = """
+		INSERT INTO {table} (key, tokens, updated_at, expires_at)
+		SELECT key, capacity, clock.now, clock.now
+		FROM (VALUES {values}) AS buckets (key, capacity),
+			(SELECT EXTRACT(EPOCH FROM clock_timestamp())::double precision AS now) AS clock
+		ORDER BY key
+		ON CONFLICT (key) DO NOTHING
+	"""
+
+	_LOCK = """
+		SELECT key, tokens, updated_at, EXTRACT(EPOCH FROM clock_timestamp())::double precision
+		FROM {table}
+		WHERE key IN %s
+		ORDER BY key
+		FOR UPDATE
+	"""
+
+	_UPDATE = """
+		UPDATE {table} AS bucket
+		SET tokens = taken.tokens, updated_at = taken.updated_at, expires_at = taken.expires_at
+		FROM (VALUES {values}) AS taken (key, tokens, updated_at, expires_at)
+		WHERE bucket.key = taken.key
+	"""
+
+	def take_all(self, keyed_buckets):
+		table = RateLimitBucket._meta.db_table
+		keys = sorted(keyed_buckets)
+
+		with transaction.atomic(), connection.cursor() as cursor:
+			cursor.execute(
+				self._INSERT.format(table=table, values=", ".join(["(%s, %s::double precision)"] * len(keys))),
+				[value for key in keys for value in (key, float(keyed_buckets[key].capacity))]
+			)
+			cursor.execute(self._LOCK.format(table=table), [tuple(keys)])
+			rows = cursor.fetchall()
+			now = rows[0][3]
+			states, retry_after = _take_all(
+				keyed_buckets,
+				{key: (tokens, updated_at) for key, tokens, updated_at, _ in rows},
+				now
+			)
+
+			if retry_after:
+				return retry_after
+
+			cursor.execute(
+				self._UPDATE.format(
+					table=table,
+					values=", ".join(["(%s, %s::double precision, %s::double precision, %s::double precision)"] * len(keys))
+				),
+				[value for key in keys for value in (key,) + states[key] + (now + keyed_buckets[key].ttl(),)]
+			)
+
+		return 0
+
+	def size(self):
+		return None
+
+
+def _take_all(keyed_buckets, states, now):
+	"""
+	Returns ({key: new_state}, retry_after) for taking a token from every
+	bucket. retry_after is 0 when all of them have one; otherwise it is the
+	longest wait, and the new states must not be stored.
+	"""
+	new_states = {}
+	retry_after = 0
+
+	for key, bucket in keyed_buckets.items():
+		new_states[key], bucket_retry_after = bucket.take(states.get(key), now)
+		retry_after = max(retry_after, bucket_retry_after)
+
+	return new_states, retry_after
+
+
+def purge_expired_buckets():
+	"""
+	Deletes the buckets that have refilled completely, which behave like
+	missing ones. Returns their number.
+	"""
+	with connection.cursor() as cursor:
+		cursor.execute(
+			"DELETE FROM {} WHERE expires_at < EXTRACT(EPOCH FROM clock_timestamp())".format(
+				RateLimitBucket._meta.db_table
+			)
+		)
+		return cursor.rowcount
+
+
+class RateLimiter:
+	"""
+	Checks the buckets of a request against each backend in turn. The first
+	is in process, so requests that exceed a limit in this worker are
+	rejected without touching the shared backend that follows it.
+	"""
+
+	def __init__(self, backends, rules):
+		self.backends = backends
+		self.buckets = {
+			scope: {key_type: TokenBucket(**rule) for key_type, rule in scope_rules.items()}
+			for scope, scope_rules in rules.items()
+		}
+		self.allowed = {}
+		self.rejected = {}
+
+	@staticmethod
+	def get_identity(request, key_type):
+		if key_type == "ip":
+			return get_ip_address(request)
+
+		if key_type == "email":
+			data = request.data
+			email = data.get("email") if hasattr(data, "get") else None
+			return email.strip().lower() if isinstance(email, str) and email.strip() else None
+
+		raise ValueError("Unsupported rate limit key type: {}".format(key_type))
+
+	def check(self, scope, request):
+		"""
+		Takes a token from every bucket of the scope that applies to the
+		request, and from none of them unless all have one. Returns 0 if
+		the request is allowed, otherwise the seconds after which it will
+		be.
+		"""
+		keyed_buckets = {}
+
+		for key_type, bucket in self.buckets.get(scope, {}).items():
+			identity = self.get_identity(request, key_type)
+
+			if identity is None:
+				continue
+
+			key = "rate_limit:{}:{}:{}".format(
+				scope,
+				key_type,
+				hashlib.sha256(identity.encode("utf-8")).hexdigest()
+			)
+			keyed_buckets[key] = bucket
+
+		for backend in self.backends if keyed_buckets else []:
+			retry_after = backend.take_all(keyed_buckets)
+
+			if retry_after:
+				self.rejected[scope] = self.rejected.get(scope, 0) + 1
+				return retry_after
+
+		self.allowed[scope] = self.allowed.get(scope, 0) + 1
+		return 0
+
+	def stats(self):
+		return {
+			"backends": [backend.__class__.__name__ for backend in self.backends],
+			"local_keys": self.backends[0].size(),
+			"allowed": dict(self.allowed),
+			"rejected": dict(self.rejected),
+		}
+
+
+def _build_backends():
+	backends = [LocalBackend(settings.RATE_LIMITS["MAX_LOCAL_KEYS"])]
+
+	if settings.RATE_LIMITS["BACKEND"] == "database":
+		backends.append(DatabaseBackend())
+
+	return backends
+
+
+limiter = RateLimiter(_build_backends(), settings.RATE_LIMITS["RULES"])
+metrics.register("rate_limiting", limiter.stats)
+
+
+def rate_limited(scope):
+	"""
+	Rejects the request before the view runs when any bucket of the scope is
+	empty. Requests over the limit of this worker are rejected in process;
+	only those it admits take their tokens from the shared buckets, with
+	one transaction. No request is rejected after a lookup of the user or
+	the password hasher.
+	"""
+	def decorator(view_method):
+		@functools.wraps(view_method)
+		def wrap(self, request, *args, **kwargs):
+			retry_after = limiter.check(scope, request)
+
+			if not retry_after:
+				return view_method(self, request, *args, **kwargs)
+
+			log.debug("[rate_limited] %s - %s rejected, retry after %.0fs",
+				scope,
+				get_ip_address(request),
+				retry_after
+			)
+			e = ApplicationError(["request_limit_exceeded", max(1, int(math.ceil(retry_after / 60)))])
+			response = Response(e.get_response_body(), status=e.status_code)
+			response["Retry-After"] = str(int(math.ceil(retry_after)))
+			return response
+
+		return wrap
+
+	return decorator
@@ -1,4 +1,3 @@
-from django.contrib.auth.hashers import check_password
 from django.core.exceptions import ValidationError
 from django.urls import (
 	resolve,
@@ -16,7 +15,13 @@ from rest_framework_simplejwt.serializers import (
 
 import datetime
 
+from . import hashing
+from . import log_rollups
+from . import system_logs
+from . import treasure_search
+from . import treasure_sync
 from .application_error import ApplicationError
+from .authentication_tools.revocation import IndexedRefreshToken
 from .custom_logging import logger as log
 from .models import *
 from .status_codes import get_code_and_response
@@ -85,11 +90,10 @@ class LoginSerializer(TokenObtainPairSerializer):
 	def get_token(cls, user):
 		token = super(LoginSerializer, cls).get_token(user)
 		email = user.email
-		user_row = Users.objects.filter(email=email).values("role", "organization", "name", "surname")
-		user_row_role = user_row[0].get("role")
-		user_row_organization = user_row[0].get("organization")
-		user_row_name = user_row[0].get("name")
-		user_row_surname = user_row[0].get("surname")
+		user_row_role = user.role
+		user_row_organization = user.organization
+		user_row_name = user.name
+		user_row_surname = user.surname
 
 		token["iss"] = "NarrateAuthentication"
 		token["iat"] = int(str(datetime.datetime.now().timestamp()).split(".")[0])
@@ -180,7 +184,7 @@ class LoginSerializer(TokenObtainPairSerializer):
 		if not active_user_row.ts_activation:
 			raise ApplicationError(["resource_not_activated", "user"])
 
-		if user_row.check_password(password):
+		if hashing.check_user_password(user_row, password):
 			log.debug("[LoginSerializer] [validate] Valid credentials")
 			refresh = self.get_token(user_row)
 			status_code, message = get_code_and_response(["resource_created_return_obj", "jwt"])
@@ -202,6 +206,8 @@ class LoginSerializer(TokenObtainPairSerializer):
 
 
 class RefreshTokenSerializer(TokenRefreshSerializer):
+	token_class = IndexedRefreshToken
+
 	def validate(self, attrs):
 		self.response_body = {}
 
@@ -611,12 +617,75 @@ class EcclesiasticalTreasuresUpdateSerializer(CustomSerializer):
 class EcclesiasticalTreasuresListSerializer(CustomSerializer):
 	search_keyword = serializers.CharField(required=False)
 	exact_match = serializers.BooleanField(required=False)
+	mode = serializers.ChoiceField(
+		choices=treasure_sync.SEARCH_MODES,
+		required=False,
+		default=treasure_sync.KEYWORD
+	)
+	cursor = serializers.CharField(required=False)
+	draw = serializers.IntegerField(required=False, min_value=0)
+	start = serializers.IntegerField(required=False, min_value=0, default=0)
 
 	class Meta:
 		model = Ecclesiastical_Treasures
-		fields= ("search_keyword", "exact_match",)
+		fields= ("search_keyword", "exact_match", "mode", "cursor", "draw", "start",)
 		extra_kwargs = {}
 
+	def __init__(self, *args, **kwargs):
+		# Set here since treasure_search cannot be imported before this module
+		super(EcclesiasticalTreasuresListSerializer, self).__init__(*args, **kwargs)
+		self.fields["limit"] = serializers.IntegerField(
+			required=False,
+			min_value=1,
+			max_value=treasure_search.MAX_LIMIT,
+			default=treasure_search.DEFAULT_LIMIT
+		)
+		# The page size of DataTables, -1 for all rows, which is capped to MAX_LIMIT
+		self.fields["length"] = serializers.IntegerField(
+			required=False,
+			min_value=-1,
+			default=treasure_search.DEFAULT_LIMIT
+		)
+
+	def _datatables_order(self):
+		# order[i][column] is the index of a column whose name is in columns[index][data]
+		order = []
+		index = 0
+
+		while "order[{}][column]".format(index) in self.initial_data:
+			column_index = self.initial_data.get("order[{}][column]".format(index))
+			column = self.initial_data.get("columns[{}][data]".format(column_index))
+			direction = self.initial_data.get("order[{}][dir]".format(index), "asc")
+
+			if column not in treasure_search.ORDERABLE_COLUMNS or direction not in ("asc", "desc"):
+				raise serializers.ValidationError({"order": ["Invalid order"]}, code="invalid")
+
+			order.append((column, direction == "desc"))
+			index += 1
+
+		return order
+
+	def validate(self, data):
+		if data.get("cursor"):
+			keys = treasure_search.sort_keys(data.get("search_keyword"), data["mode"])
+
+			try:
+				treasure_search.decode_cursor(keys, data["cursor"])
+			except ValueError:
+				raise serializers.ValidationError({"cursor": ["Invalid cursor"]}, code="invalid")
+
+		if data.get("draw") is not None:
+			length = data["length"]
+
+			data["datatables"] = {
+				"start": data["start"],
+				"length": treasure_search.MAX_LIMIT if length < 0 else min(length, treasure_search.MAX_LIMIT),
+				"order": self._datatables_order(),
+				"search": self.initial_data.get("search[value]", ""),
+			}
+
+		return data
+
 
 class EcclesiasticalTreasuresMediaListSerializer(CustomSerializer):
 	treasure_id = serializers.CharField(required=True)
@@ -861,3 +930,83 @@ class ActivateAccountSerializer(CustomSerializer):
 				"required": True
 			}
 		}
+
+
+class SystemLogsFilterSerializer(CustomSerializer):
+	api = serializers.CharField(required=False)
+	action = serializers.CharField(required=False)
+	is_error = serializers.BooleanField(required=False)
+	user_fk = serializers.IntegerField(required=False)
+	ip_address = serializers.CharField(required=False)
+	ts_from = serializers.DateTimeField(required=False)
+	ts_to = serializers.DateTimeField(required=False)
+
+	class Meta:
+		model = LoggingEntries
+		fields = ("api", "action", "is_error", "user_fk", "ip_address", "ts_from", "ts_to",)
+		extra_kwargs = {}
+
+
+class SystemLogsListSerializer(SystemLogsFilterSerializer):
+	cursor = serializers.CharField(required=False)
+	limit = serializers.IntegerField(
+		required=False,
+		min_value=1,
+		max_value=system_logs.MAX_LIMIT,
+		default=system_logs.DEFAULT_LIMIT
+	)
+
+	class Meta(SystemLogsFilterSerializer.Meta):
+		fields = SystemLogsFilterSerializer.Meta.fields + ("cursor", "limit",)
+
+	def validate_cursor(self, value):
+		try:
+			system_logs.decode_cursor(value)
+		except ValueError:
+			raise serializers.ValidationError("Invalid cursor", code="invalid")
+
+		return value
+
+
+class SystemLogsExportSerializer(SystemLogsFilterSerializer):
+	export_format = serializers.ChoiceField(
+		choices=system_logs.EXPORT_FORMATS,
+		required=False,
+		default=system_logs.NDJSON
+	)
+
+	class Meta(SystemLogsFilterSerializer.Meta):
+		fields = SystemLogsFilterSerializer.Meta.fields + ("export_format",)
+
+
+class SystemLogsRollupListSerializer(CustomSerializer):
+	api = serializers.CharField(required=False, allow_blank=True)
+	action = serializers.CharField(required=False, allow_blank=True)
+	is_error = serializers.BooleanField(required=False)
+	organization = serializers.CharField(required=False, allow_blank=True)
+	ts_from = serializers.DateTimeField(required=False)
+	ts_to = serializers.DateTimeField(required=False)
+	granularity = serializers.ChoiceField(
+		choices=tuple(log_rollups.GRANULARITIES),
+		required=False,
+		default="hour"
+	)
+
+	class Meta:
+		model = LoggingRollup
+		fields = ("api", "action", "is_error", "organization", "ts_from", "ts_to", "granularity",)
+		extra_kwargs = {}
+
+	def validate(self, attrs):
+		attrs["ts_to"] = attrs.get("ts_to") or now()
+		attrs["ts_from"] = attrs.get("ts_from") or attrs["ts_to"] - datetime.timedelta(days=log_rollups.DEFAULT_RANGE_DAYS)
+
+		if attrs["ts_to"] - attrs["ts_from"] > datetime.timedelta(days=log_rollups.MAX_RANGE_DAYS):
+			raise serializers.ValidationError({
+				"ts_from": serializers.ErrorDetail(
+					"The range cannot exceed {} days".format(log_rollups.MAX_RANGE_DAYS),
+					code="invalid"
+				)
+			})
+
+		return attrs
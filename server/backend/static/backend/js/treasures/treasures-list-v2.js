@@ -1,29 +1,48 @@
 "use strict";
 
-function fetchTreasures() {
-    var response = {};
+var treasuresFilter = {
+    search_keyword: "",
+    exact_match: false,
+};
+
+function showLoadError(text) {
+    Swal.fire({
+        text: text,
+        icon: "error",
+        buttonsStyling: false,
+        confirmButtonText: "Okay, got it!",
+        customClass: {
+            confirmButton: "btn btn-primary"
+        }
+    });
+}
+
+// Loads a page of treasures for DataTables in server-side mode, with the parameters that DataTables sends (draw, start, length, order, search)
+function fetchTreasuresPage(dtParams, callback) {
     var xhr = new XMLHttpRequest();
+    var filterParams = treasuresFilter.search_keyword.length > 0 ? treasuresFilter : {};
+    var params = $.param(Object.assign({}, dtParams, filterParams));
     $("#datatable_treasures tbody").css("filter", "blur(1.0rem)");
 
     xhr.addEventListener("readystatechange", function () {
         if (xhr.readyState !== 4) return;
 
-        response = JSON.parse(xhr.responseText);
-
         if (xhr.status >= 200 && xhr.status < 300) {
-            const data = response["resource_array"];
-            TreasuresDatatable.init(data);
+            const response = JSON.parse(xhr.responseText);
+            callback({
+                draw: response["draw"],
+                recordsTotal: response["records_total"],
+                recordsFiltered: response["records_filtered"],
+                data: response["resource_array"],
+            });
         } else {
-            response = JSON.parse(xhr.responseText);
-            Swal.fire({
-                text: "There was an error loading data. Please try again later.",
-                icon: "error",
-                buttonsStyling: false,
-                confirmButtonText: "Okay, got it!",
-                customClass: {
-                    confirmButton: "btn btn-primary"
-                }
+            callback({
+                draw: dtParams["draw"],
+                recordsTotal: 0,
+                recordsFiltered: 0,
+                data: [],
             });
+            showLoadError("There was an error loading data. Please try again later.");
         }
         setTimeout(() => {
             $("#filterArea").css("filter", "none");
@@ -36,20 +55,16 @@ function fetchTreasures() {
             $("#filterArea").css("filter", "none");
             $("#datatable_treasures tbody").css("filter", "none");
         }, 500);
-        Swal.fire({
-            text: "Unable to communicate with the server. Please try again later.",
-            icon: "error",
-            buttonsStyling: false,
-            confirmButtonText: "Okay, got it!",
-            customClass: {
-                confirmButton: "btn btn-primary"
-            }
-        });
+        showLoadError("Unable to communicate with the server. Please try again later.");
     };
-    xhr.open("GET", baseURL + "/ecclesiastical-treasures/list/", true);
+    xhr.open("GET", baseURL + "/ecclesiastical-treasures/list/?" + params, true);
     xhr.send();
 }
 
+function fetchTreasures() {
+    TreasuresDatatable.reload();
+}
+
 function setupFilterArea() {
     $("#free_text_term").val("");
     $("#exactmatch-check").prop("checked", false);
@@ -65,71 +80,22 @@ function toggleCheckbox() {
 }
 
 function applyTreasuresFilter() {
-    var free_text_term = $("#free_text_term").val();
-    var isTrueChecked = $("#exactmatch-check").prop("checked");
-    var exact_match = isTrueChecked ? true : false;
-
-    const params = "?search_keyword=" + free_text_term + "&exact_match=" + exact_match;
-
-    var response = {};
-    $("#datatable_treasures tbody").css("filter", "blur(1.0rem)");
-
-    var xhr = new XMLHttpRequest();
-    xhr.addEventListener("readystatechange", function () {
-        if (xhr.readyState !== 4) return;
-
-        response = JSON.parse(xhr.responseText);
-
-        if (xhr.status >= 200 && xhr.status < 300) {
-            const data = response["resource_array"];
-            TreasuresDatatable.init(data);
-        } else {
-            Swal.fire({
-                text: "There was an error loading data. Please try again later.",
-                icon: "error",
-                buttonsStyling: false,
-                confirmButtonText: "Okay, got it!",
-                customClass: {
-                    confirmButton: "btn btn-primary"
-                }
-            });
-        }
-
-        setTimeout(() => {
-            $("#datatable_treasures tbody").css("filter", "none");
-        }, 500);
-
-    });
-
-    xhr.onerror = () => {
-        setTimeout(() => {
-            $("#datatable_treasures tbody").css("filter", "none");
-        }, 500);
-        Swal.fire({
-            text: "Unable to communicate with the server. Please try again later.",
-            icon: "error",
-            buttonsStyling: false,
-            confirmButtonText: "Okay, got it!",
-            customClass: {
-                confirmButton: "btn btn-primary"
-            }
-        });
-    };
-
-    xhr.open("GET", baseURL + "/ecclesiastical-treasures/list/" + params, true);
-    xhr.send();
-
+    treasuresFilter.search_keyword = $("#free_text_term").val();
+    treasuresFilter.exact_match = $("#exactmatch-check").prop("checked") ? true : false;
+    TreasuresDatatable.reload();
 }
 
 function resetTreasuresFilter() {
     setupFilterArea();
+    treasuresFilter.search_keyword = "";
+    treasuresFilter.exact_match = false;
     fetchTreasures();
 }
 
 var TreasuresDatatable = function () {
     var dt;
 
-    var initDatatable = function (data) {
+    var initDatatable = function () {
         dt = $("#datatable_treasures").DataTable({
             order: [],
             language: {
@@ -138,7 +104,12 @@ var TreasuresDatatable = function () {
             responsive: true,
             searchDelay: 500,
             bDestroy: true,
-            data: data,
+            serverSide: true,
+            processing: true,
+            pageLength: 50,
+            ajax: function (data, callback, settings) {
+                fetchTreasuresPage(data, callback);
+            },
             columns: [
                 {
                     title: "Treasure ID",
@@ -147,6 +118,7 @@ var TreasuresDatatable = function () {
                 {
                     title: "Default Media",
                     data: "default_img_src",
+                    orderable: false,
                     render: function (data, type, row) {
                         return "<img src=" + row["default_img_src"] + " width=50 height=50 />";
                     },
@@ -225,8 +197,15 @@ var TreasuresDatatable = function () {
     }
 
     return {
-        init: function (data) {
-            initDatatable(data);
+        init: function () {
+            initDatatable();
+        },
+        reload: function () {
+            if (dt) {
+                dt.ajax.reload();
+            } else {
+                initDatatable();
+            }
         }
     }
 }();
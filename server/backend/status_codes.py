@@ -25,7 +25,7 @@ RESPONSE_TYPES = {
 	"array": "\<Array\>",
 }
 
-IGNORE_BAD_REQUEST = ["SystemLogsList",]
+IGNORE_BAD_REQUEST = ["SystemMetricsList",]
 
 STATUS_CODES = {
 	"resource_is_activated": {
@@ -96,6 +96,10 @@ STATUS_CODES = {
 		"code": 500,
 		"msg": "Internal server error"
 	},
+	"service_unavailable": {
+		"code": 503,
+		"msg": "Service unavailable. Try again later."
+	},
 }
 
 VARIABLE_RESULTS = {
@@ -110,6 +114,7 @@ GENERAL_DESCRIPTIONS = {
 	"already_exists_fields": "Any field that is unique and already exists, will be returned in the list",
 	"bad_formatted_fields": "Any field that is not in the correct format will be returned in the list",
 	"email": "The email of the individual",
+	"draw": "The draw counter of the DataTables request",
 	"error_details": "A dictionary that contains descriptive information " \
 		"about the validation errors in the form of key-value pairs. " \
 		"Each key is a string that corresponds to the problematic field " \
@@ -118,6 +123,7 @@ GENERAL_DESCRIPTIONS = {
 	"message": "A general message description",
 	"missing_required_fields": "The missing required fields are returned as a list",
 	"name": "The name of the individual",
+	"next_cursor": "The cursor of the next page, null on the last page",
 	"extra_details": "Extra details regarding the resource",
 	"resource": "A value associated with that resource",
 	"resource_array": "An array with all the available data",
@@ -131,6 +137,8 @@ GENERAL_DESCRIPTIONS = {
 	"surname": "The surname of the individual",
 	"task_status": "The status of the task: ['PENDING', 'SUCCESS', 'FAILURE']",
 	"reason": "The reason behind this error message",
+	"records_filtered": "The number of records that match the search and the DataTables search value",
+	"records_total": "The number of records that match the search",
 }
 
 CUSTOM_RESPONSES = {}
@@ -138,10 +146,12 @@ CUSTOM_RESPONSES = {}
 FIELD_TYPES = {
 	"already_exists_fields": openapi.TYPE_ARRAY,
 	"bad_formatted_fields": openapi.TYPE_ARRAY,
+	"draw": openapi.TYPE_INTEGER,
 	"error_details": openapi.TYPE_OBJECT,
 	"extra_details": openapi.TYPE_STRING,
 	"message": openapi.TYPE_STRING,
 	"missing_required_fields": openapi.TYPE_ARRAY,
+	"next_cursor": openapi.TYPE_STRING,
 	"resource": openapi.TYPE_STRING,
 	"resource_array": openapi.TYPE_ARRAY,
 	"resource_is_activated": openapi.TYPE_BOOLEAN,
@@ -150,6 +160,8 @@ FIELD_TYPES = {
 	"resource_str": openapi.TYPE_STRING,
 	"task_status": openapi.TYPE_STRING,
 	"reason": openapi.TYPE_STRING,
+	"records_filtered": openapi.TYPE_INTEGER,
+	"records_total": openapi.TYPE_INTEGER,
 }
 
 ENUM_VARIABLES = {
@@ -187,7 +199,10 @@ ENUM_VARIABLES = {
 	"EcclesiasticalTreasuresUpdate": {},
 	"FileMgmtMediaTempAdd": {},
 	"FileMgmtMediaTempDelete": {},
+	"SystemLogsExport": {},
 	"SystemLogsList": {},
+	"SystemLogsRollupList": {},
+	"SystemMetricsList": {},
 }
 
 VIEWS_DESCRIPTION = {
@@ -542,6 +557,10 @@ VIEWS_DESCRIPTION = {
 			"variables": [
 				"message",
 				"resource_array",
+				"next_cursor",
+				"draw",
+				"records_total",
+				"records_filtered",
 			]
 		},
 		{
@@ -757,12 +776,82 @@ VIEWS_DESCRIPTION = {
 			]
 		},
 	],
+	"SystemLogsExport": [
+		{
+			"status_code": [200],
+			"variables": []
+		},
+		{
+			"status_code": [400],
+			"variables": [
+				"message",
+				"bad_formatted_fields",
+				"missing_required_fields",
+				"error_details"
+			],
+		},
+		{
+			"status_code": [401, 403, 415, 500],
+			"variables": [
+				"message",
+			]
+		},
+	],
 	"SystemLogsList": [
 		{
 			"status_code": [200],
 			"variables": [
 				"message",
 				"resource_array",
+				"next_cursor",
+			]
+		},
+		{
+			"status_code": [400],
+			"variables": [
+				"message",
+				"bad_formatted_fields",
+				"missing_required_fields",
+				"error_details"
+			],
+		},
+		{
+			"status_code": [401, 403, 415, 500],
+			"variables": [
+				"message",
+			]
+		},
+	],
+	"SystemLogsRollupList": [
+		{
+			"status_code": [200],
+			"variables": [
+				"message",
+				"resource_array",
+			]
+		},
+		{
+			"status_code": [400],
+			"variables": [
+				"message",
+				"bad_formatted_fields",
+				"missing_required_fields",
+				"error_details"
+			],
+		},
+		{
+			"status_code": [401, 403, 415, 500],
+			"variables": [
+				"message",
+			]
+		},
+	],
+	"SystemMetricsList": [
+		{
+			"status_code": [200],
+			"variables": [
+				"message",
+				"resource_obj",
 			]
 		},
 		{
@@ -0,0 +1,157 @@
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
+
+from .models import LoggingEntries
+
+import base64
+import csv
+import io
+import json
+
+
+DEFAULT_LIMIT = 100
+MAX_LIMIT = 1000
+
+CSV = "csv"
+NDJSON = "ndjson"
+EXPORT_FORMATS = (NDJSON, CSV)
+EXPORT_CONTENT_TYPES = {
+	CSV: "text/csv; charset=utf-8",
+	NDJSON: "application/x-ndjson; charset=utf-8",
+}
+# Rows fetched per round trip of the server-side cursor and rows per chunk written to the response
+EXPORT_CHUNK_SIZE = 2000
+EXPORT_FIELDS = (
+	"id",
+	"ts_added",
+	"user_fk_id",
+	"api",
+	"action",
+	"ip_address",
+	"is_error",
+	"data",
+	"error_data",
+)
+
+# Exact-match filters and the LoggingEntries field each one applies to
+FILTER_FIELDS = {
+	"api": "api",
+	"action": "action",
+	"is_error": "is_error",
+	"user_fk": "user_fk_id",
+	"ip_address": "ip_address",
+}
+
+
+def encode_cursor(ts_added, entry_id):
+	value = "{}|{}".format(ts_added.isoformat(), entry_id)
+	return base64.urlsafe_b64encode(value.encode("ascii")).decode("ascii")
+
+
+def decode_cursor(cursor):
+	"""
+	Returns the (ts_added, id) of the last entry of the previous page.
+	Raises ValueError if the cursor was not produced by encode_cursor.
+	"""
+	try:
+		value = base64.urlsafe_b64decode(cursor.encode("ascii")).decode("ascii")
+		ts_added, entry_id = value.split("|")
+		ts_added = parse_datetime(ts_added)
+		entry_id = int(entry_id)
+	except Exception:
+		raise ValueError("Invalid cursor")
+
+	if ts_added is None:
+		raise ValueError("Invalid cursor")
+
+	return ts_added, entry_id
+
+
+def filter_entries(filters):
+	"""
+	Applies the exact-match filters and the [ts_from, ts_to) range of `filters`
+	"""
+	queryset = LoggingEntries.objects.all()
+
+	for name, field_name in FILTER_FIELDS.items():
+		if filters.get(name) is not None:
+			queryset = queryset.filter(**{field_name: filters[name]})
+
+	if filters.get("ts_from") is not None:
+		queryset = queryset.filter(ts_added__gte=filters["ts_from"])
+
+	if filters.get("ts_to") is not None:
+		queryset = queryset.filter(ts_added__lt=filters["ts_to"])
+
+	return queryset
+
+
+def fetch_page(filters, cursor=None, limit=DEFAULT_LIMIT):
+	"""
+	Returns (entries, next_cursor) for the page that follows `cursor`, newest
+	entries first. Every page is a range scan of the (ts_added, id) indexes,
+	so its cost does not depend on how many pages precede it. next_cursor is
+	None on the last page.
+	"""
+	queryset = filter_entries(filters)
+
+	if cursor:
+		ts_added, entry_id = decode_cursor(cursor)
+		# The plain upper bound lets the planner prune the newer monthly partitions
+		queryset = queryset.filter(ts_added__lte=ts_added).filter(
+			Q(ts_added__lt=ts_added) | Q(ts_added=ts_added, id__lt=entry_id)
+		)
+
+	entries = list(queryset.order_by("-ts_added", "-id").values()[:limit + 1])
+	next_cursor = None
+
+	if len(entries) > limit:
+		entries = entries[:limit]
+		next_cursor = encode_cursor(entries[-1]["ts_added"], entries[-1]["id"])
+
+	return entries, next_cursor
+
+
+def _chunked(rows, size):
+	chunk = []
+
+	for row in rows:
+		chunk.append(row)
+
+		if len(chunk) == size:
+			yield chunk
+			chunk = []
+
+	if chunk:
+		yield chunk
+
+
+def export_entries(filters, export_format):
+	"""
+	Yields the filtered entries, oldest first, as NDJSON or CSV text in
+	chunks of EXPORT_CHUNK_SIZE rows. Rows are read through a server-side
+	cursor, so memory use does not depend on the number of exported rows.
+	"""
+	rows = filter_entries(filters).order_by("ts_added", "id").values_list(
+		*EXPORT_FIELDS
+	).iterator(chunk_size=EXPORT_CHUNK_SIZE)
+
+	if export_format == CSV:
+		buffer = io.StringIO()
+		writer = csv.writer(buffer)
+		writer.writerow(EXPORT_FIELDS)
+		yield buffer.getvalue()
+
+		for chunk in _chunked(rows, EXPORT_CHUNK_SIZE):
+			buffer.seek(0)
+			buffer.truncate()
+			writer.writerows(chunk)
+			yield buffer.getvalue()
+
+		return
+
+	# Keeps the microseconds of ts_added, unlike DjangoJSONEncoder
+	encoder = json.JSONEncoder(default=lambda value: value.isoformat())
+
+	for chunk in _chunked(rows, EXPORT_CHUNK_SIZE):
+		yield "".join(encoder.encode(dict(zip(EXPORT_FIELDS, row))) + "\n" for row in chunk)
@@ -0,0 +1,54 @@
+from django.conf import settings
+from rest_framework_simplejwt.token_blacklist.models import OutstandingToken
+from rest_framework_simplejwt.utils import aware_utcnow
+
+from narrate_project.celery import app
+from . import log_partitions
+from . import rate_limiting
+from .custom_logging import logger as log
+
+
+@app.task(bind=True, time_limit=settings.CELERY_TASK_TIME_LIMIT)
+def flush_expired_tokens(self):
+	"""
+	Deletes expired outstanding refresh tokens. Their blacklist entries are
+	removed by cascade, which keeps the revocation index small at load time.
+	"""
+	deleted, _ = OutstandingToken.objects.filter(expires_at__lte=aware_utcnow()).delete()
+	log.debug("[flush_expired_tokens] Deleted %s expired token rows", deleted)
+	return deleted
+
+
+@app.task(bind=True, time_limit=settings.CELERY_TASK_TIME_LIMIT)
+def create_log_partitions(self):
+	"""
+	Creates the monthly partitions of the logs ahead of time, so that new
+	entries never land in the default partition
+	"""
+	created = log_partitions.ensure_partitions(settings.LOG_PARTITIONING["MONTHS_AHEAD"])
+	log.debug("[create_log_partitions] Created partitions: %s", created)
+	return created
+
+
+@app.task(bind=True, time_limit=settings.CELERY_TASK_TIME_LIMIT)
+def archive_log_partitions(self):
+	"""
+	Moves the partitions of the logs that are older than the retention window
+	out of the database into compressed files
+	"""
+	archived = log_partitions.archive_partitions(
+		settings.LOG_PARTITIONING["RETENTION_MONTHS"],
+		settings.LOG_PARTITIONING["ARCHIVE_DIR"]
+	)
+	log.info("[archive_log_partitions] Archived partitions: %s", archived)
+	return archived
+
+
+@app.task(bind=True, time_limit=settings.CELERY_TASK_TIME_LIMIT)
+def purge_rate_limit_buckets(self):
+	"""
+	Deletes the rate limit buckets that have refilled completely
+	"""
+	deleted = rate_limiting.purge_expired_buckets()
+	log.debug("[purge_rate_limit_buckets] Deleted %s buckets", deleted)
+	return deleted
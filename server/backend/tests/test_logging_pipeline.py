@@ -0,0 +1,52 @@
+"""
+Checks that records written through the queue of the logging pipeline keep
+their message arguments, traceback and stack for the formatters of the
+listener thread.
+
+	python manage.py test backend.tests.test_logging_pipeline
+"""
+from django.test import SimpleTestCase
+
+from backend.custom_logging import JsonFormatter, NativeQueueListener, PipelineQueueHandler
+
+import io
+import json
+import logging
+
+
+class PipelineFormattingTests(SimpleTestCase):
+	def setUp(self):
+		self.stream = io.StringIO()
+		handler = logging.StreamHandler(self.stream)
+		handler.setFormatter(JsonFormatter())
+		self.listener = NativeQueueListener(handler)
+		self.logger = logging.getLogger("narrate_logger.tests.pipeline")
+		self.logger.propagate = False
+		self.logger.setLevel(logging.DEBUG)
+		self.handler = PipelineQueueHandler(self.listener)
+		self.logger.addHandler(self.handler)
+
+	def tearDown(self):
+		self.logger.removeHandler(self.handler)
+		self.listener.stop()
+
+	def written_entry(self):
+		self.listener.stop()
+		return json.loads(self.stream.getvalue().splitlines()[-1])
+
+	def test_exception_is_a_separate_field(self):
+		try:
+			raise ValueError("broken treasure")
+		except ValueError:
+			self.logger.exception("Failed to sync %s", "treasure")
+
+		entry = self.written_entry()
+		self.assertEqual(entry["message"], "Failed to sync treasure")
+		self.assertIn("ValueError: broken treasure", entry["exception"])
+
+	def test_stack_is_a_separate_field(self):
+		self.logger.warning("Slow query", stack_info=True)
+
+		entry = self.written_entry()
+		self.assertEqual(entry["message"], "Slow query")
+		self.assertIn("test_stack_is_a_separate_field", entry["stack"])
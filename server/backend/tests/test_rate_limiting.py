@@ -0,0 +1,34 @@
+"""
+Checks that a request takes a token from every bucket of its scope or from
+none of them, so that requests rejected for one identity do not drain the
+buckets of the others.
+
+	python manage.py test backend.tests.test_rate_limiting
+"""
+from django.test import SimpleTestCase
+
+from backend.rate_limiting import LocalBackend, TokenBucket
+
+
+class LocalBackendTakeAllTests(SimpleTestCase):
+	def setUp(self):
+		self.backend = LocalBackend(max_keys=100)
+		self.email = TokenBucket(capacity=1, refill_per_min=1)
+		self.ip = TokenBucket(capacity=3, refill_per_min=1)
+
+	def test_rejected_request_takes_no_token(self):
+		self.assertEqual(self.backend.take_all({"email": self.email, "ip": self.ip}), 0)
+		self.assertGreater(self.backend.take_all({"email": self.email, "ip": self.ip}), 0)
+
+		# The rejected request left both tokens of the IP bucket
+		self.assertEqual(self.backend.take_all({"ip": self.ip}), 0)
+		self.assertEqual(self.backend.take_all({"ip": self.ip}), 0)
+		self.assertGreater(self.backend.take_all({"ip": self.ip}), 0)
+
+	def test_keys_are_bounded(self):
+		backend = LocalBackend(max_keys=2)
+
+		for key in ("a", "b", "c"):
+			backend.take_all({key: self.ip})
+
+		self.assertEqual(backend.size(), 2)
@@ -0,0 +1,92 @@
+"""
+Regression test of the number of SQL queries of EcclesiasticalTreasuresList,
+which must not grow with the number of matching treasures.
+
+Runs against PostgreSQL, after the migrations of the backend app have been
+generated, e.g. in the narrate-server container:
+
+	python manage.py test backend.tests.test_treasure_list_queries
+"""
+from django.test import RequestFactory, TestCase
+from rest_framework_simplejwt.tokens import AccessToken
+from unittest import mock
+
+from backend import treasure_sync, views
+from backend.authentication_tools.middleware import RequestAuthentication
+from backend.custom_logging import db_handler
+from backend.list_cache import list_cache
+from backend.models import E35_Title, E56_Language, Ecclesiastical_Treasures, OrganizationModel, Users
+
+import uuid
+
+
+# The user of the access token (DRF authentication), the catalogue version
+# and role of the ETag, the catalogue version of the list cache key, the
+# page of treasures with their summaries, and the current user for
+# is_editable
+LIST_QUERIES = 5
+
+
+class TreasureListQueriesTest(TestCase):
+
+	def setUp(self):
+		# The audit log is written by a background thread that cannot see the test transaction
+		patcher = mock.patch.object(db_handler, "emit")
+		patcher.start()
+		self.addCleanup(patcher.stop)
+		list_cache.clear()
+		self.language = E56_Language.objects.get_or_create(code="en")[0]
+		self.user = self.create_user(OrganizationModel.AUTH)
+		self.other_user = self.create_user(OrganizationModel.IHU)
+
+	def create_user(self, organization):
+		return Users.objects.create(
+			email="{}@example.com".format(uuid.uuid4().hex),
+			name="Name",
+			surname="Surname",
+			organization=organization,
+			password="",
+		)
+
+	def seed(self, treasures):
+		for index in range(treasures):
+			treasure = Ecclesiastical_Treasures.objects.create(
+				uuid=str(uuid.uuid4()),
+				user_fk=self.user if index % 2 else self.other_user,
+			)
+			E35_Title.objects.create(
+				treasure_fk_id=treasure.uuid,
+				language_fk=self.language,
+				content="Vespers icon {}".format(index),
+			)
+			treasure_sync.sync_treasure(treasure.uuid)
+
+	def get(self, params):
+		token = AccessToken.for_user(self.user)
+		token["organization"] = self.user.organization
+		token["role"] = self.user.role
+		request = RequestFactory().get(
+			"/backend/ecclesiastical-treasures/list/",
+			params,
+			HTTP_AUTHORIZATION="Bearer {}".format(token),
+		)
+		request.narrate_auth = RequestAuthentication(request)
+		return views.EcclesiasticalTreasuresList.as_view()(request)
+
+	def assert_list_queries(self, treasures):
+		self.seed(treasures)
+
+		for params in ({}, {"search_keyword": "vespers"}, {"search_keyword": "vespers", "mode": "fulltext"}):
+			list_cache.clear()
+
+			with self.subTest(params=params), self.assertNumQueries(LIST_QUERIES):
+				response = self.get(params)
+
+			self.assertEqual(response.status_code, 200)
+			self.assertEqual(len(response.data["resource_array"]), treasures)
+
+	def test_one_treasure(self):
+		self.assert_list_queries(1)
+
+	def test_many_treasures(self):
+		self.assert_list_queries(40)
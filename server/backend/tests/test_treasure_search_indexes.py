@@ -0,0 +1,116 @@
+"""
+Checks that the substring search of EcclesiasticalTreasuresList can use the
+trigram index of every searched field of the users and of TREASURE_FIELDS.
+Sequential scans are disabled, so the plan reads a table without an index
+only if no index matches the search condition.
+
+Runs against PostgreSQL with pg_trgm, after the migrations of the backend app
+have been generated, e.g. in the narrate-server container:
+
+	python manage.py test backend.tests.test_treasure_search_indexes
+"""
+from django.db import connection
+from django.test import TestCase
+
+from backend.models import E56_Language, Ecclesiastical_Treasures, OrganizationModel, Users
+from backend.treasure_search import TREASURE_FIELDS, search_treasures
+
+import json
+import random
+import string
+import uuid
+
+
+TREASURES = 200
+USERS = 20
+
+
+def random_text(words):
+	return " ".join(
+		"".join(random.choice(string.ascii_lowercase) for _ in range(random.randint(3, 10))) for _ in range(words)
+	)
+
+
+def plan_nodes(node):
+	yield node
+
+	for child in node.get("Plans", []):
+		yield from plan_nodes(child)
+
+
+class TreasureSearchIndexesTest(TestCase):
+
+	@classmethod
+	def setUpTestData(cls):
+		language = E56_Language.objects.get_or_create(code="en")[0]
+		user_rows = Users.objects.bulk_create([
+			Users(
+				email="{}@example.com".format(uuid.uuid4().hex),
+				name=random_text(1),
+				surname=random_text(1),
+				organization=OrganizationModel.AUTH,
+				password="",
+			) for _ in range(USERS)
+		])
+		treasure_rows = Ecclesiastical_Treasures.objects.bulk_create([
+			Ecclesiastical_Treasures(
+				uuid=str(uuid.uuid4()),
+				user_fk=random.choice(user_rows),
+			) for _ in range(TREASURES)
+		])
+
+		for model, field_names in cls.fields_by_model().items():
+			has_language = any(field.name == "language_fk" for field in model._meta.fields)
+			rows = []
+
+			for treasure in treasure_rows:
+				values = {}
+
+				for field_name in field_names:
+					if model._meta.get_field(field_name).get_internal_type() == "JSONField":
+						values[field_name] = [random_text(3) for _ in range(2)]
+					else:
+						values[field_name] = random_text(8)
+
+				if has_language:
+					values["language_fk"] = language
+
+				rows.append(model(treasure_fk_id=treasure.uuid, **values))
+
+			model.objects.bulk_create(rows)
+
+	@staticmethod
+	def fields_by_model():
+		fields_by_model = {}
+
+		for model, field_name in TREASURE_FIELDS:
+			fields_by_model.setdefault(model, []).append(field_name)
+
+		return fields_by_model
+
+	def explain(self, search_keyword):
+		sql, params = search_treasures(search_keyword, False).values("uuid").query.sql_with_params()
+
+		with connection.cursor() as cursor:
+			for model in [Users, Ecclesiastical_Treasures] + list(self.fields_by_model()):
+				cursor.execute("ANALYZE {}".format(model._meta.db_table))
+
+			# Local to the transaction of the test
+			cursor.execute("SET LOCAL enable_seqscan = off")
+			cursor.execute("EXPLAIN (FORMAT JSON) " + sql, params)
+			plan = cursor.fetchone()[0]
+
+		if isinstance(plan, str):
+			plan = json.loads(plan)
+
+		return plan[0]["Plan"]
+
+	def test_search_uses_trigram_indexes(self):
+		plan = self.explain("vespers")
+		index_names = set(node["Index Name"] for node in plan_nodes(plan) if "Index Name" in node)
+
+		for model in [Users] + list(self.fields_by_model()):
+			for index in model._meta.indexes:
+				if index.name.endswith("_trgm"):
+					with self.subTest(index=index.name):
+						self.assertIn(index.name, index_names)
@@ -0,0 +1,366 @@
+from django.contrib.postgres.search import SearchQuery, SearchRank
+from django.db.models import (
+	Case,
+	F,
+	FloatField,
+	IntegerField,
+	Q,
+	Value,
+	When,
+)
+from django.db.models.functions import Cast
+from django.utils.dateparse import parse_datetime
+
+from .authentication_tools.identity import current_user
+from .models import *
+from .treasure_sync import FULLTEXT, KEYWORD, SEARCH_CONFIG
+from . import list_cache, treasure_sync
+
+import base64
+import datetime
+import functools
+import json
+import operator
+
+
+DEFAULT_IMG_SRC = "/static/backend/assets/media/media_default.png"
+
+DEFAULT_LIMIT = 50
+MAX_LIMIT = 500
+
+# The columns of the list that DataTables may sort by, and the field each one sorts by
+ORDERABLE_COLUMNS = {
+	"uuid": "uuid",
+	"title_en": "summary__title_en",
+	"appellation_en": "summary__appellation_en",
+	"user_email": "summary__user_email",
+	"user_organization": "summary__user_organization",
+}
+
+# The fields of a list item read from the treasure summary
+SUMMARY_FIELDS = {
+	"user_email": F("summary__user_email"),
+	"user_organization": F("summary__user_organization"),
+	"title_en": F("summary__title_en"),
+	"appellation_en": F("summary__appellation_en"),
+	"default_img_src": F("summary__cover_img_src"),
+}
+
+# The searchable text fields of the models that reference a treasure
+TREASURE_FIELDS = (
+	(E5_Event, "content"),
+	(E11_Modification, "content"),
+	(E14_Condition_Assessment, "content"),
+	(E34_Inscription, "content"),
+	(E35_Title, "content"),
+	(E41_Appellation, "content"),
+	(E42_Identifier, "code"),
+	(E52_Time_Span, "duration"),
+	(E53_Place, "content"),
+	(E54_Dimension, "content"),
+	(E55_Type, "kind"),
+	(E57_Material, "content"),
+	(E63_Beginning_of_Existence, "content"),
+	(E71_Human_Made_Thing, "creator"),
+	(E73_Information_Object, "content"),
+	(E74_Group, "content"),
+	(E78_Curated_Holding, "content"),
+	(Data_Administration, "content"),
+	(Description, "short_version"),
+	(Description, "extended_version"),
+	(Pieces_of_Ecclesiastical_Treasure, "documentation"),
+	(Pieces_of_Ecclesiastical_Treasure, "bibliography"),
+	(Previous_Documentation, "documentation"),
+	(Previous_Documentation, "bibliography"),
+)
+
+# The searchable fields of the user who added a treasure
+USER_FIELDS = ("email", "name", "surname", "telephone", "organization")
+
+
+def _match(field_name, search_keyword, exact_match):
+	if exact_match:
+		return Q(**{field_name: search_keyword})
+
+	return Q(**{"{}__icontains".format(field_name): search_keyword})
+
+
+def search_treasures(search_keyword, exact_match):
+	"""
+	Returns the queryset of the treasures whose uuid, owner or any field of
+	TREASURE_FIELDS matches the keyword, all of them if there is no keyword.
+	Every condition is an uncorrelated subquery of the same statement, run
+	once with the trigram index of its fields rather than once per treasure.
+	"""
+	treasures = Ecclesiastical_Treasures.objects.all()
+
+	if not search_keyword:
+		return treasures
+
+	fields_by_model = {}
+
+	for model, field_name in TREASURE_FIELDS:
+		fields_by_model.setdefault(model, []).append(field_name)
+
+	conditions = [
+		_match("uuid", search_keyword, exact_match),
+		Q(user_fk_id__in=Users.objects.filter(
+			functools.reduce(operator.or_, (_match(field_name, search_keyword, exact_match) for field_name in USER_FIELDS))
+		).values("id")),
+	]
+
+	for model, field_names in fields_by_model.items():
+		conditions.append(Q(uuid__in=model.objects.filter(
+			functools.reduce(operator.or_, (_match(field_name, search_keyword, exact_match) for field_name in field_names)),
+		).values("treasure_fk_id")))
+
+	return treasures.filter(functools.reduce(operator.or_, conditions))
+
+
+def search_treasures_fulltext(search_keyword, exact_match):
+	"""
+	Returns the queryset of the treasures whose search document matches the
+	keyword, the most relevant first, all of them if there is no keyword.
+	The keyword is parsed as a web search (quoted phrases, OR, -word), or as
+	a single phrase if exact_match is set.
+	"""
+	treasures = Ecclesiastical_Treasures.objects.all()
+
+	if not search_keyword:
+		return treasures
+
+	query = SearchQuery(
+		search_keyword,
+		config=SEARCH_CONFIG,
+		search_type="phrase" if exact_match else "websearch",
+	)
+
+	return treasures.filter(
+		search_document__search_vector=query,
+	).annotate(
+		# ts_rank is a real, as a double it survives the round trip through the cursor
+		rank=Cast(SearchRank(F("search_document__search_vector"), query), output_field=FloatField()),
+	).order_by("-rank", "id")
+
+
+def _own_organization_first(organization):
+	return Case(
+		When(summary__user_organization=organization, then=Value(0)),
+		default=Value(1),
+		output_field=IntegerField(),
+	)
+
+
+def _matching_treasures(payload, search_keyword, exact_match, mode):
+	if mode == FULLTEXT:
+		treasures = search_treasures_fulltext(search_keyword, exact_match)
+	else:
+		treasures = search_treasures(search_keyword, exact_match)
+
+	return treasures.annotate(own_organization=_own_organization_first(payload["organization"]))
+
+
+def sort_keys(search_keyword, mode):
+	"""
+	Returns the (annotation, descending) keys of the default order of the
+	list: the organization of the current user first, then the most
+	relevant treasures in full text mode or the most recently added ones
+	otherwise. The id makes every key unique.
+	"""
+	if mode == FULLTEXT and search_keyword:
+		return [("own_organization", False), ("rank", True), ("id", True)]
+
+	return [("own_organization", False), ("ts_added", True), ("id", True)]
+
+
+def encode_cursor(keys, row):
+	values = []
+
+	for name, _ in keys:
+		value = row[name]
+		values.append(value.isoformat() if isinstance(value, datetime.datetime) else value)
+
+	value = json.dumps({"keys": [name for name, _ in keys], "values": values})
+	return base64.urlsafe_b64encode(value.encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(keys, cursor):
+	"""
+	Returns the values of the sort keys of the last treasure of the previous
+	page. Raises ValueError if the cursor was not produced by encode_cursor
+	for the same keys.
+	"""
+	try:
+		value = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8"))
+		names, values = value["keys"], value["values"]
+	except Exception:
+		raise ValueError("Invalid cursor")
+
+	if names != [name for name, _ in keys] or len(values) != len(keys):
+		raise ValueError("Invalid cursor")
+
+	if "ts_added" in names:
+		index = names.index("ts_added")
+		values[index] = parse_datetime(values[index]) if isinstance(values[index], str) else None
+
+		if values[index] is None:
+			raise ValueError("Invalid cursor")
+
+	return values
+
+
+def _after(keys, values):
+	# (k1, k2, ...) after (v1, v2, ...) in the order of the keys
+	conditions = []
+
+	for index, (name, descending) in enumerate(keys):
+		condition = {previous_name: values[previous_index] for previous_index, (previous_name, _) in enumerate(keys[:index])}
+		condition["{}__{}".format(name, "lt" if descending else "gt")] = values[index]
+		conditions.append(Q(**condition))
+
+	return functools.reduce(operator.or_, conditions)
+
+
+def _order_by(keys):
+	return ["-" + name if descending else name for name, descending in keys]
+
+
+def _page_items(treasure_rows):
+	"""
+	Returns (user_fk_id, item) of the treasures of `treasure_rows`, in the
+	same order. The rows carry the SUMMARY_FIELDS of the treasures, so the
+	items are the same for every user and can be cached.
+	"""
+	page_items = []
+
+	for row in treasure_rows:
+		current_item = {}
+		current_item["uuid"] = row["uuid"]
+		current_item["user_email"] = row["user_email"] or ""
+		current_item["user_organization"] = row["user_organization"] or ""
+		current_item["title_en"] = row["title_en"]
+		current_item["appellation_en"] = row["appellation_en"]
+		current_item["default_img_src"] = row["default_img_src"] or DEFAULT_IMG_SRC
+		page_items.append((row["user_fk_id"], current_item))
+
+	return page_items
+
+
+def _list_items(request, page_items):
+	# The fields that depend on the current user are added to copies of the cached items
+	current_user_obj = current_user(request)
+	is_admin = current_user_obj.role == RoleModel.ADMIN
+
+	return [
+		dict(item, is_editable=is_admin or current_user_obj.id == user_fk_id) for user_fk_id, item in page_items
+	]
+
+
+def _cache_key(payload, search_keyword, exact_match, mode, page):
+	# Substring matches ignore case, exact matches and full text operators such as OR do not
+	if search_keyword and mode == KEYWORD and not exact_match:
+		search_keyword = search_keyword.lower()
+
+	return list_cache.make_key(
+		treasure_sync.catalogue_version(),
+		payload["organization"],
+		search_keyword,
+		exact_match,
+		mode,
+		page,
+	)
+
+
+def _treasures_page(payload, search_keyword, exact_match, mode, cursor, limit):
+	keys = sort_keys(search_keyword, mode)
+	treasures = _matching_treasures(payload, search_keyword, exact_match, mode)
+
+	if cursor:
+		treasures = treasures.filter(_after(keys, decode_cursor(keys, cursor)))
+
+	treasure_rows = list(treasures.order_by(*_order_by(keys)).values(
+		"uuid",
+		"user_fk_id",
+		*[name for name, _ in keys],
+		**SUMMARY_FIELDS
+	)[:limit + 1])
+	next_cursor = None
+
+	if len(treasure_rows) > limit:
+		treasure_rows = treasure_rows[:limit]
+		next_cursor = encode_cursor(keys, treasure_rows[-1])
+
+	return _page_items(treasure_rows), next_cursor
+
+
+def list_treasures(request, payload, search_keyword, exact_match, mode=KEYWORD, cursor=None, limit=DEFAULT_LIMIT):
+	"""
+	Returns (items, next_cursor) for the page of matching treasures that
+	follows `cursor`, in the order of sort_keys. The page is read with a
+	keyset condition on the sort keys, so its cost does not depend on how
+	many pages precede it. next_cursor is None on the last page. Pages are
+	cached per catalogue version, only is_editable is computed per request.
+	"""
+	key = _cache_key(payload, search_keyword, exact_match, mode, ("cursor", cursor, limit))
+	page = list_cache.list_cache.get(key)
+
+	if page is None:
+		page = _treasures_page(payload, search_keyword, exact_match, mode, cursor, limit)
+		list_cache.list_cache.set(key, page, len(page[0]))
+
+	page_items, next_cursor = page
+	return _list_items(request, page_items), next_cursor
+
+
+def _datatables_page(payload, search_keyword, exact_match, mode, datatables):
+	treasures = _matching_treasures(payload, search_keyword, exact_match, mode)
+	records_total = treasures.count()
+
+	if datatables["search"]:
+		treasures = treasures.filter(uuid__in=search_treasures(datatables["search"], False).values("uuid"))
+		records_filtered = treasures.count()
+	else:
+		records_filtered = records_total
+
+	if datatables["order"]:
+		keys = [(ORDERABLE_COLUMNS[column], descending) for column, descending in datatables["order"]]
+		keys.append(("id", True))
+	else:
+		keys = sort_keys(search_keyword, mode)
+
+	start = datatables["start"]
+	treasure_rows = list(treasures.order_by(*_order_by(keys)).values(
+		"uuid",
+		"user_fk_id",
+		**SUMMARY_FIELDS
+	)[start:start + datatables["length"]])
+
+	return _page_items(treasure_rows), records_total, records_filtered
+
+
+def list_treasures_datatables(request, payload, search_keyword, exact_match, mode, datatables):
+	"""
+	Returns (items, records_total, records_filtered) for a request of the
+	DataTables server-side protocol. `datatables` holds the validated
+	start, length, order (a list of (column, descending)) and search value.
+	The matching treasures are filtered by the search value, sorted by the
+	requested columns or by sort_keys if there are none, and only the
+	requested page is read and hydrated. Pages are cached like those of
+	list_treasures.
+	"""
+	key = _cache_key(payload, search_keyword, exact_match, mode, (
+		"datatables",
+		datatables["start"],
+		datatables["length"],
+		tuple(tuple(column) for column in datatables["order"]),
+		# The search value is always matched as a substring
+		datatables["search"].lower(),
+	))
+	page = list_cache.list_cache.get(key)
+
+	if page is None:
+		page = _datatables_page(payload, search_keyword, exact_match, mode, datatables)
+		list_cache.list_cache.set(key, page, len(page[0]))
+
+	page_items, records_total, records_filtered = page
+	return _list_items(request, page_items), records_total, records_filtered
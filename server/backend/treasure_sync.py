@@ -0,0 +1,343 @@
+from django.conf import settings
+from django.contrib.postgres.search import SearchVector
+from django.db import transaction
+from django.db.models import F, Q
+from django.utils.timezone import now
+
+from .models import *
+
+import functools
+import operator
+
+
+DIR_MEDIA = "/protected_media/"
+DIR_MEDIA_SYNCED = "media/synced/"
+
+# The media types whose first synced photo is the cover of a treasure, in order of preference
+COVER_MEDIA_TYPES = ("photo", "content", "conservation")
+
+# Treasures whose covers or summaries are computed together by backfill_covers and rebuild_summaries
+BATCH_SIZE = 500
+
+# The catalogue is in four languages, so words are neither stemmed nor dropped as stop words
+SEARCH_CONFIG = "simple"
+
+# How EcclesiasticalTreasuresList matches the search keyword: substrings of any field, or words of the search documents
+KEYWORD = "keyword"
+FULLTEXT = "fulltext"
+SEARCH_MODES = (KEYWORD, FULLTEXT)
+
+# The text fields of the search document, with the fields of the models that reference a treasure they are built from
+DOCUMENT_FIELDS = {
+	"titles": (
+		(E35_Title, "content"),
+		(E41_Appellation, "content"),
+	),
+	"descriptions": (
+		(Description, "short_version"),
+		(Description, "extended_version"),
+	),
+	"details": (
+		(E71_Human_Made_Thing, "creator"),
+		(E57_Material, "content"),
+		(E34_Inscription, "content"),
+		(E53_Place, "content"),
+		(E74_Group, "content"),
+		(Data_Administration, "content"),
+	),
+}
+
+# The fields of the user who added a treasure that make up the owner text
+OWNER_FIELDS = ("name", "surname", "email", "organization")
+
+# The weight of each text field in the search vector, A ranks highest
+DOCUMENT_WEIGHTS = (
+	("titles", "A"),
+	("descriptions", "B"),
+	("details", "C"),
+	("owner", "D"),
+)
+
+
+def _texts(value):
+	# The JSON arrays of E74_Group and Data_Administration are flattened into their strings
+	if isinstance(value, (list, tuple)):
+		for item in value:
+			yield from _texts(item)
+	elif isinstance(value, dict):
+		for item in value.values():
+			yield from _texts(item)
+	elif value is not None and value != "":
+		yield str(value)
+
+
+def _owner_text(user):
+	return "\n".join(_texts([getattr(user, field_name) for field_name in OWNER_FIELDS]))
+
+
+def search_vector():
+	"""
+	Returns the expression of the weighted search vector of a search document
+	"""
+	return functools.reduce(operator.add, (
+		SearchVector(field_name, weight=weight, config=SEARCH_CONFIG) for field_name, weight in DOCUMENT_WEIGHTS
+	))
+
+
+def cover_img_srcs(treasure_uuids):
+	"""
+	Returns {uuid: img_src} of the treasures whose first synced photo of the
+	first media type that has one is a 2D image
+	"""
+	first_photos = {}
+	rows = MediaFile.objects.filter(
+		treasure_fk_id__in=treasure_uuids,
+		media_type__in=COVER_MEDIA_TYPES,
+		is_file_synced=True,
+	).order_by(
+		"treasure_fk_id",
+		"media_type",
+		"ts_synced",
+		"id",
+	).distinct(
+		"treasure_fk_id",
+		"media_type",
+	)
+
+	for row in rows:
+		first_photos[(row.treasure_fk_id, row.media_type)] = row
+
+	img_srcs = {}
+
+	for treasure_uuid in treasure_uuids:
+		for media_type in COVER_MEDIA_TYPES:
+			row = first_photos.get((treasure_uuid, media_type))
+
+			if not row:
+				continue
+
+			if row.file_ext.lstrip(".") in settings.MEDIA_FORMAT_2D:
+				img_srcs[treasure_uuid] = "/backend" + DIR_MEDIA + DIR_MEDIA_SYNCED + \
+					str(row.dir_path) + "/" + str(row.uuid) + "_resized" + str(row.file_ext)
+				break
+
+	return img_srcs
+
+
+def sync_cover(treasure):
+	"""
+	Stores the cover photo of a treasure in its cover_img_src, None if it
+	has no synced 2D photo
+	"""
+	treasure.cover_img_src = cover_img_srcs([treasure.uuid]).get(treasure.uuid)
+	Ecclesiastical_Treasures.objects.filter(uuid=treasure.uuid).update(cover_img_src=treasure.cover_img_src)
+
+
+def english_contents(model, treasure_uuids):
+	"""
+	Returns {uuid: content} of the first English row of `model` of each treasure
+	"""
+	contents = {}
+	rows = model.objects.filter(
+		treasure_fk_id__in=treasure_uuids,
+		language_fk__code="en",
+	).order_by("id").values_list("treasure_fk_id", "content")
+
+	for treasure_uuid, content in rows:
+		contents.setdefault(treasure_uuid, content)
+
+	return contents
+
+
+def _summaries(treasures):
+	# The treasures come with their user_fk
+	treasure_uuids = [treasure.uuid for treasure in treasures]
+	titles = english_contents(E35_Title, treasure_uuids)
+	appellations = english_contents(E41_Appellation, treasure_uuids)
+	ts_now = now()
+
+	return [
+		TreasureSummary(
+			treasure_id=treasure.uuid,
+			user_fk_id=treasure.user_fk_id,
+			user_email=treasure.user_fk.email,
+			user_organization=treasure.user_fk.organization,
+			title_en=titles.get(treasure.uuid),
+			appellation_en=appellations.get(treasure.uuid),
+			cover_img_src=treasure.cover_img_src,
+			ts_added=treasure.ts_added,
+			ts_updated=ts_now,
+		) for treasure in treasures
+	]
+
+
+def catalogue_version():
+	"""
+	Returns the current version of the catalogue, 0 before its first write
+	"""
+	version = CatalogueVersion.objects.filter(pk=1).values_list("version", flat=True).first()
+	return version or 0
+
+
+def bump_catalogue_version():
+	"""
+	Increments the version of the catalogue. Call it in the transaction of
+	every write that changes what the treasure list shows.
+	"""
+	updated = CatalogueVersion.objects.filter(pk=1).update(version=F("version") + 1, ts_updated=now())
+
+	if not updated:
+		CatalogueVersion.objects.get_or_create(pk=1)
+		CatalogueVersion.objects.filter(pk=1).update(version=F("version") + 1, ts_updated=now())
+
+
+def sync_treasure(treasure_uuid, media_changed=False):
+	"""
+	Rebuilds the search document and the summary of a treasure from its
+	current rows, and its cover photo if `media_changed`, and sets its
+	ts_updated. Call it after every change of a treasure, its media or the
+	rows that reference it, in the same transaction. Documents and
+	summaries of deleted treasures are deleted by the cascade. Returns
+	False if the treasure does not exist.
+	"""
+	treasure = Ecclesiastical_Treasures.objects.select_related("user_fk").filter(uuid=treasure_uuid).first()
+
+	if not treasure:
+		return False
+
+	fields_by_model = {}
+
+	for document_field, fields in DOCUMENT_FIELDS.items():
+		for model, field_name in fields:
+			fields_by_model.setdefault(model, []).append((document_field, field_name))
+
+	texts = {document_field: [] for document_field in DOCUMENT_FIELDS}
+
+	for model, fields in fields_by_model.items():
+		rows = model.objects.filter(
+			treasure_fk_id=treasure_uuid,
+		).order_by("id").values_list(*[field_name for _, field_name in fields])
+
+		for row in rows:
+			for (document_field, _), value in zip(fields, row):
+				texts[document_field].extend(_texts(value))
+
+	document = {document_field: "\n".join(values) for document_field, values in texts.items()}
+	document["owner"] = _owner_text(treasure.user_fk)
+	document["ts_updated"] = now()
+
+	with transaction.atomic():
+		TreasureSearchDocument.objects.update_or_create(treasure_id=treasure_uuid, defaults=document)
+		TreasureSearchDocument.objects.filter(treasure_id=treasure_uuid).update(search_vector=search_vector())
+
+		if media_changed:
+			sync_cover(treasure)
+
+		# The version of the treasure in the ETags of its read endpoints
+		Ecclesiastical_Treasures.objects.filter(uuid=treasure_uuid).update(ts_updated=document["ts_updated"])
+
+		# Saving with the primary key set updates the row, or inserts it if there is none
+		_summaries([treasure])[0].save()
+		bump_catalogue_version()
+		# Imported here, backend.access_control depends on this module through the serializers
+		from .access_control import access_cache
+		access_cache.invalidate(treasure_uuid)
+
+	return True
+
+
+def sync_user_treasures(user):
+	"""
+	Updates the owner text of the search documents, the owner fields of
+	the summaries and the ts_updated of the treasures of a user, after a
+	change of their profile
+	"""
+	documents = TreasureSearchDocument.objects.filter(treasure__user_fk_id=user.id)
+
+	with transaction.atomic():
+		Ecclesiastical_Treasures.objects.filter(user_fk_id=user.id).update(ts_updated=now())
+		documents.update(owner=_owner_text(user), ts_updated=now())
+		documents.update(search_vector=search_vector())
+		TreasureSummary.objects.filter(user_fk_id=user.id).update(
+			user_email=user.email,
+			user_organization=user.organization,
+			ts_updated=now(),
+		)
+		bump_catalogue_version()
+		from .access_control import access_cache
+		access_cache.invalidate_owner(user.id)
+
+
+def rebuild():
+	"""
+	Rebuilds the search documents of all treasures. Returns their number.
+	"""
+	treasure_uuids = Ecclesiastical_Treasures.objects.order_by("id").values_list("uuid", flat=True)
+	synced = 0
+
+	for treasure_uuid in treasure_uuids.iterator():
+		synced += sync_treasure(treasure_uuid)
+
+	return synced
+
+
+def backfill_covers():
+	"""
+	Stores the cover photo of every treasure and of its summary, BATCH_SIZE
+	treasures at a time. Returns the number of treasures that have one.
+	"""
+	treasure_rows = list(Ecclesiastical_Treasures.objects.order_by("id").values_list("id", "uuid"))
+	covered = 0
+
+	for index in range(0, len(treasure_rows), BATCH_SIZE):
+		batch = treasure_rows[index:index + BATCH_SIZE]
+		img_srcs = cover_img_srcs([treasure_uuid for _, treasure_uuid in batch])
+		Ecclesiastical_Treasures.objects.bulk_update([
+			Ecclesiastical_Treasures(id=treasure_id, cover_img_src=img_srcs.get(treasure_uuid))
+			for treasure_id, treasure_uuid in batch
+		], ["cover_img_src"])
+		TreasureSummary.objects.bulk_update([
+			TreasureSummary(treasure_id=treasure_uuid, cover_img_src=img_srcs.get(treasure_uuid))
+			for _, treasure_uuid in batch
+		], ["cover_img_src"])
+		bump_catalogue_version()
+		covered += len(img_srcs)
+
+	return covered
+
+
+def rebuild_summaries():
+	"""
+	Rebuilds the summaries of all treasures, BATCH_SIZE treasures at a time.
+	Returns their number.
+	"""
+	treasure_ids = list(Ecclesiastical_Treasures.objects.order_by("id").values_list("id", flat=True))
+
+	for index in range(0, len(treasure_ids), BATCH_SIZE):
+		treasures = list(Ecclesiastical_Treasures.objects.select_related("user_fk").filter(
+			id__in=treasure_ids[index:index + BATCH_SIZE],
+		))
+
+		with transaction.atomic():
+			TreasureSummary.objects.filter(treasure_id__in=[treasure.uuid for treasure in treasures]).delete()
+			TreasureSummary.objects.bulk_create(_summaries(treasures))
+			bump_catalogue_version()
+
+	return len(treasure_ids)
+
+
+def sync_missing():
+	"""
+	Syncs the treasures that have no summary or no search document, e.g.
+	those created before either was deployed, with their cover photos.
+	Called after every migration by backend.apps, so that a deployment
+	needs none of the rebuild commands. Returns their number.
+	"""
+	treasure_uuids = list(Ecclesiastical_Treasures.objects.filter(
+		Q(summary__isnull=True) | Q(search_document__isnull=True),
+	).order_by("id").values_list("uuid", flat=True))
+
+	for treasure_uuid in treasure_uuids:
+		sync_treasure(treasure_uuid, media_changed=True)
+
+	return len(treasure_uuids)
@@ -71,7 +71,12 @@ urlpatterns = [
 	re_path(r"^file-management/media/temp/delete/$", views.FileMgmtMediaTempDelete.as_view(), name="file-management/media/temp/delete"),
 
 	# System Logs
+	re_path(r"^system-logs/export/$", views.SystemLogsExport.as_view(), name="system-logs/export"),
 	re_path(r"^system-logs/list/$", views.SystemLogsList.as_view(), name="system-logs/list"),
+	re_path(r"^system-logs/rollups/list/$", views.SystemLogsRollupList.as_view(), name="system-logs/rollups/list"),
+
+	# System Metrics
+	re_path(r"^system-metrics/list/$", views.SystemMetricsList.as_view(), name="system-metrics/list"),
 
 	re_path(r"^$", views.dashboardView, name="dashboard"),
 ]
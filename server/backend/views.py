@@ -2,7 +2,6 @@ from celery.result import AsyncResult
 from datetime import timedelta
 from django.db.models import Q
 from django.conf import settings
-from django.contrib.auth.hashers import make_password
 from django.core.signing import (
 	BadSignature,
 	SignatureExpired,
@@ -13,6 +12,7 @@ from django.http import (
 	HttpResponse,
 	HttpResponseForbidden,
 	HttpResponseRedirect,
+	StreamingHttpResponse,
 )
 from django.shortcuts import render
 from django.template import loader
@@ -37,7 +37,6 @@ from rest_framework_simplejwt.views import (
 	TokenRefreshView,
 )
 
-from rest_framework_simplejwt.tokens import RefreshToken as SimplejwtRefreshToken
 
 import base64
 import hashlib
@@ -47,22 +46,41 @@ import os
 import uuid
 
 from narrate_project.celery import app
+from .access_control import (
+	get_treasure_access,
+	invalidate_treasure_access,
+)
 from .application_error import ApplicationError
 
-from .custom_logging import logger as log
 from .models import *
 from .serializers import *
 from .status_codes import *
 from .views_utils import *
 from .authentication_tools import auth_tools as at
+from .authentication_tools.middleware import set_access_cookie
+from .authentication_tools.identity import current_user
+from .authentication_tools.principal_cache import principal_cache
+from .authentication_tools.revocation import IndexedRefreshToken
+from . import etags
+from . import hashing
+from . import log_rollups
+from . import metrics
+from . import system_logs
+from . import treasure_search
+from . import treasure_sync
 from .forms import MediaFileForm
 from .password_policy import is_compliant
+from .rate_limiting import rate_limited
 
 
 BAD_REQUEST = "bad_request"
 CONTENT = "content"
+DRAW = "draw"
 INTERNAL_SERVER_ERROR = "internal_server_error"
 MESSAGE = "message"
+NEXT_CURSOR = "next_cursor"
+RECORDS_FILTERED = "records_filtered"
+RECORDS_TOTAL = "records_total"
 RESOURCE = "resource"
 RESOURCE_ARRAY = "resource_array"
 RESOURCE_IS_ACTIVATED = "resource_is_activated"
@@ -111,8 +129,7 @@ def logout(request):
 		function_name = "logout"
 		function_action = "LOGOUT"
 		user_id = None
-		req_details = request_details(request)
-		log.debug("{} Log out attempt".format(req_details))
+		request_logger(request).debug("Log out attempt")
 
 		is_valid, payload = at.authenticate(request)
 
@@ -122,15 +139,16 @@ def logout(request):
 		user_id = payload["user_id"]
 		response = HttpResponseRedirect(reverse("login"))
 		response.delete_cookie(settings.SIMPLE_JWT["AUTH_REFRESH_COOKIE"], path="/", domain=None, samesite="Strict")
-		refresh_token = SimplejwtRefreshToken(request.COOKIES.get("refresh_token"))
+		response.delete_cookie(settings.SIMPLE_JWT["AUTH_COOKIE"], path="/", domain=None, samesite="Strict")
+		refresh_token = IndexedRefreshToken(request.COOKIES.get("refresh_token"))
 		refresh_token.blacklist()
+		principal_cache.invalidate(request.COOKIES.get("refresh_token"))
 	except Exception as e:
-		log.error("{} DB LOG (Internal error): {}".format(req_details, str(e)),
+		request_logger(request).error("DB LOG (Internal error): %s", e,
 			extra={
 				"api": function_name,
 				"action": function_action,
 				"error_data": str(e),
-				"ip_address": get_ip_address(request),
 				"is_error": True
 			}
 		)
@@ -138,20 +156,19 @@ def logout(request):
 	if request.session.get("next_url"):
 		del request.session["next_url"]
 
-	log.info("{} DB LOG".format(req_details),
+	request_logger(request).info("DB LOG",
 		extra={
 			"user_id": user_id,
 			"api": function_name,
 			"action": function_action,
-			"ip_address": get_ip_address(request),
 		}
 	)
-	log.debug("{} SUCCESS".format(req_details))
+	request_logger(request).debug("SUCCESS")
 	return response
 
 
 def get_user_info(request, user_obj):
-	log.debug("{} Will get user's info".format(request_details(request)))
+	request_logger(request).debug("Will get user's info")
 	user = {}
 
 	try:
@@ -172,11 +189,25 @@ def get_user_info(request, user_obj):
 			"role": "",
 			"profile_pic_src": "",
 		}
-		log.debug("{} Error getting user's info. Reason: {}".format(request_details(request), str(e)))
+		request_logger(request).debug("Error getting user's info. Reason: %s", e)
 
 	return user
 
 
+def get_treasure_titles(treasure_uuid):
+	"""
+	Returns the English title and appellation of a treasure from its summary
+	"""
+	summary_row = TreasureSummary.objects.filter(
+		treasure_id=treasure_uuid,
+	).values_list("title_en", "appellation_en").first()
+
+	if not summary_row:
+		return "", ""
+
+	return summary_row[0] or "", summary_row[1] or ""
+
+
 @cache_control(no_cache=True, must_revalidate=True, no_store=True)
 def signUpView(request):
 	template = loader.get_template("backend/authentication/sign_up.html")
@@ -222,13 +253,13 @@ def resetPasswordView(request):
 		cuxid_message = cuxid_bytes.decode("ascii")
 		unsigned = signer.unsign(cuxid_message, max_age=timedelta(seconds=settings.RESET_PASSWORD_SIGNATURE_MAX_AGE_SEC))
 	except SignatureExpired as e:
-		log.debug("{} Signature expired: {}".format(request_details(request), str(e)))
+		request_logger(request).debug("Signature expired: %s", e)
 		return HttpResponseForbidden()
 	except BadSignature as e:
-		log.debug("{} Bad Signature: {}".format(request_details(request), str(e)))
+		request_logger(request).debug("Bad Signature: %s", e)
 		return HttpResponseForbidden()
 	except Exception as e:
-		log.debug("{} Error occurred: {}".format(request_details(request), str(e)))
+		request_logger(request).debug("Error occurred: %s", e)
 		return HttpResponseForbidden()
 
 	return HttpResponse(template.render(context, request))
@@ -242,7 +273,7 @@ def dashboardView(request, is_valid, payload):
 		return HttpResponseRedirect(reverse("login"))
 
 	template = loader.get_template("backend/dashboard.html")
-	user_obj = Users.objects.filter(id=payload["user_id"]).first()
+	user_obj = current_user(request)
 	user_info = get_user_info(request, user_obj)
 	context = {
 		"title": "Dashboard",
@@ -261,7 +292,7 @@ def knowledgeRepositoryView(request, is_valid, payload):
 		return HttpResponseRedirect(reverse("login"))
 
 	template = loader.get_template("backend/kr.html")
-	user_obj = Users.objects.filter(id=payload["user_id"]).first()
+	user_obj = current_user(request)
 	user_info = get_user_info(request, user_obj)
 	context = {
 		"title": "Knowledge Repository",
@@ -280,7 +311,7 @@ def profileView(request, is_valid, payload):
 		return HttpResponseRedirect(reverse("login"))
 
 	template = loader.get_template("backend/profile.html")
-	user_obj = Users.objects.filter(id=payload["user_id"]).first()
+	user_obj = current_user(request)
 	user_info = get_user_info(request, user_obj)
 	media_type_uuid = generate_random_uuid()
 	context = {
@@ -305,7 +336,7 @@ def securityView(request, is_valid, payload):
 		return HttpResponseRedirect(reverse("login"))
 
 	template = loader.get_template("backend/security.html")
-	user_obj = Users.objects.filter(id=payload["user_id"]).first()
+	user_obj = current_user(request)
 	user_info = get_user_info(request, user_obj)
 	context = {
 		"title": "Security Settings",
@@ -323,7 +354,7 @@ def treasuresAddView(request, is_valid, payload):
 		return HttpResponseRedirect(reverse("login"))
 
 	template = loader.get_template("backend/treasures/add.html")
-	user_obj = Users.objects.filter(id=payload["user_id"]).first()
+	user_obj = current_user(request)
 	user_info = get_user_info(request, user_obj)
 	conservation_photos_uuid = generate_random_uuid()
 	content_uuid = generate_random_uuid()
@@ -354,43 +385,17 @@ def treasuresDeleteView(request, is_valid, payload):
 		request.session["next_url"] = "/backend/treasures/delete/?treasure_id=" + treasure_uuid_req
 		return HttpResponseRedirect(reverse("login"))
 
-	treasure_obj_row = Ecclesiastical_Treasures.objects.filter(
-		uuid = treasure_uuid_req,
-	).first()
+	treasure_access = get_treasure_access(request, treasure_uuid_req)
 
-	if not treasure_obj_row:
+	if not treasure_access:
 		return HttpResponseRedirect(reverse("dashboard"))
 
-	added_by_user_fk = treasure_obj_row.user_fk_id
-	user_obj = Users.objects.filter(id=payload["user_id"]).first()
-
-	if user_obj:
-		current_user_id = user_obj.id
-
-		if current_user_id != added_by_user_fk and user_obj.role != RoleModel.ADMIN:
-			return HttpResponseRedirect(reverse("no_permission"))
+	if not treasure_access.can_edit:
+		return HttpResponseRedirect(reverse("no_permission"))
 
+	user_obj = current_user(request)
 	user_info = get_user_info(request, user_obj)
-	lang_en_row = E56_Language.objects.filter(code="en").first()
-	lang_en_fk_id = lang_en_row.id
-	title_en_row = E35_Title.objects.filter(
-		treasure_fk_id=treasure_uuid_req,
-		language_fk_id=lang_en_fk_id,
-	).first()
-	title_en = ""
-
-	if title_en_row:
-		title_en = title_en_row.content
-
-	appellation_en_row = E41_Appellation.objects.filter(
-		treasure_fk_id=treasure_uuid_req,
-		language_fk_id=lang_en_fk_id,
-	).first()
-
-	appellation_en = ""
-
-	if appellation_en_row:
-		appellation_en = appellation_en_row.content
+	title_en, appellation_en = get_treasure_titles(treasure_uuid_req)
 
 	template = loader.get_template("backend/treasures/delete.html")
 	context = {
@@ -413,52 +418,20 @@ def treasuresMediaView(request, is_valid, payload):
 		request.session["next_url"] = "/backend/treasures/media/?treasure_id=" + treasure_uuid_req
 		return HttpResponseRedirect(reverse("login"))
 
-	treasure_obj_row = Ecclesiastical_Treasures.objects.filter(
-		uuid = treasure_uuid_req,
-	).first()
+	treasure_access = get_treasure_access(request, treasure_uuid_req)
 
-	if not treasure_obj_row:
+	if not treasure_access:
 		return HttpResponseRedirect(reverse("dashboard"))
 
-	added_by_user_fk = treasure_obj_row.user_fk_id
-	user_row = Users.objects.filter(
-		id=added_by_user_fk
-	).first()
-
-	is_editable = False
-	if user_row:
-		current_user_obj = Users.objects.filter(id=payload["user_id"]).first()
-		current_user_id = current_user_obj.id
-
-		if current_user_id != added_by_user_fk and current_user_obj.role != RoleModel.ADMIN:
-			return HttpResponseRedirect(reverse("no_permission"))
+	if not treasure_access.can_edit:
+		return HttpResponseRedirect(reverse("no_permission"))
 
-		if current_user_id == added_by_user_fk or current_user_obj.role == RoleModel.ADMIN:
-			is_editable = True
+	is_editable = treasure_access.can_edit
 
 	template = loader.get_template("backend/treasures/media/list.html")
-	user_obj = Users.objects.filter(id=payload["user_id"]).first()
+	user_obj = current_user(request)
 	user_info = get_user_info(request, user_obj)
-	lang_en_row = E56_Language.objects.filter(code="en").first()
-	lang_en_fk_id = lang_en_row.id
-	title_en_row = E35_Title.objects.filter(
-		treasure_fk_id=treasure_uuid_req,
-		language_fk_id=lang_en_fk_id,
-	).first()
-	title_en = ""
-
-	if title_en_row:
-		title_en = title_en_row.content
-
-	appellation_en_row = E41_Appellation.objects.filter(
-		treasure_fk_id=treasure_uuid_req,
-		language_fk_id=lang_en_fk_id,
-	).first()
-
-	appellation_en = ""
-
-	if appellation_en_row:
-		appellation_en = appellation_en_row.content
+	title_en, appellation_en = get_treasure_titles(treasure_uuid_req)
 
 	context = {
 		"title": "Manage Media of Ecclesiastical Treasure",
@@ -481,45 +454,17 @@ def treasuresMediaAddView(request, is_valid, payload):
 		request.session["next_url"] = "/backend/treasures/media/add/?treasure_id=" + treasure_uuid_req
 		return HttpResponseRedirect(reverse("login"))
 
-	treasure_obj_row = Ecclesiastical_Treasures.objects.filter(
-		uuid = treasure_uuid_req,
-	).first()
+	treasure_access = get_treasure_access(request, treasure_uuid_req)
 
-	if not treasure_obj_row:
+	if not treasure_access:
 		return HttpResponseRedirect(reverse("dashboard"))
 
-	added_by_user_fk = treasure_obj_row.user_fk_id
-	user_row = Users.objects.filter(
-		id=added_by_user_fk
-	).first()
-
-	if user_row:
-		user_obj = Users.objects.filter(id=payload["user_id"]).first()
-
-		if user_obj.id != added_by_user_fk and user_obj.role != RoleModel.ADMIN:
-			return HttpResponseRedirect(reverse("no_permission"))
+	if not treasure_access.can_edit:
+		return HttpResponseRedirect(reverse("no_permission"))
 
+	user_obj = current_user(request)
 	user_info = get_user_info(request, user_obj)
-	lang_en_row = E56_Language.objects.filter(code="en").first()
-	lang_en_fk_id = lang_en_row.id
-	title_en_row = E35_Title.objects.filter(
-		treasure_fk_id=treasure_uuid_req,
-		language_fk_id=lang_en_fk_id,
-	).first()
-	title_en = ""
-
-	if title_en_row:
-		title_en = title_en_row.content
-
-	appellation_en_row = E41_Appellation.objects.filter(
-		treasure_fk_id=treasure_uuid_req,
-		language_fk_id=lang_en_fk_id,
-	).first()
-
-	appellation_en = ""
-
-	if appellation_en_row:
-		appellation_en = appellation_en_row.content
+	title_en, appellation_en = get_treasure_titles(treasure_uuid_req)
 
 	template = loader.get_template("backend/treasures/media/upload_new.html")
 	media_type_uuid = generate_random_uuid()
@@ -554,11 +499,9 @@ def treasuresMediaDeleteView(request, is_valid, payload):
 		request.session["next_url"] = "/backend/treasures/media/delete/?treasure_id=" + treasure_uuid_req + "&media_id=" + media_uuid_req
 		return HttpResponseRedirect(reverse("login"))
 
-	treasure_obj_row = Ecclesiastical_Treasures.objects.filter(
-		uuid = treasure_uuid_req,
-	).first()
+	treasure_access = get_treasure_access(request, treasure_uuid_req)
 
-	if not treasure_obj_row:
+	if not treasure_access:
 		return HttpResponseRedirect(reverse("dashboard"))
 
 	media_obj_row = MediaFile.objects.filter(
@@ -569,36 +512,12 @@ def treasuresMediaDeleteView(request, is_valid, payload):
 	if not media_obj_row:
 		return HttpResponseRedirect(reverse("dashboard"))
 
-	added_by_user_fk = treasure_obj_row.user_fk_id
-	user_obj = Users.objects.filter(id=payload["user_id"]).first()
-
-	if user_obj:
-		current_user_id = user_obj.id
-
-		if current_user_id != added_by_user_fk and user_obj.role != RoleModel.ADMIN:
-			return HttpResponseRedirect(reverse("no_permission"))
+	if not treasure_access.can_edit:
+		return HttpResponseRedirect(reverse("no_permission"))
 
+	user_obj = current_user(request)
 	user_info = get_user_info(request, user_obj)
-	lang_en_row = E56_Language.objects.filter(code="en").first()
-	lang_en_fk_id = lang_en_row.id
-	title_en_row = E35_Title.objects.filter(
-		treasure_fk_id=treasure_uuid_req,
-		language_fk_id=lang_en_fk_id,
-	).first()
-	title_en = ""
-
-	if title_en_row:
-		title_en = title_en_row.content
-
-	appellation_en_row = E41_Appellation.objects.filter(
-		treasure_fk_id=treasure_uuid_req,
-		language_fk_id=lang_en_fk_id,
-	).first()
-
-	appellation_en = ""
-
-	if appellation_en_row:
-		appellation_en = appellation_en_row.content
+	title_en, appellation_en = get_treasure_titles(treasure_uuid_req)
 
 	template = loader.get_template("backend/treasures/media/delete.html")
 	context = {
@@ -626,11 +545,9 @@ def treasuresMediaUpdateView(request, is_valid, payload):
 		request.session["next_url"] = "/backend/treasures/media/update/?treasure_id=" + treasure_uuid_req + "&media_id=" + media_uuid_req
 		return HttpResponseRedirect(reverse("login"))
 
-	treasure_obj_row = Ecclesiastical_Treasures.objects.filter(
-		uuid = treasure_uuid_req,
-	).first()
+	treasure_access = get_treasure_access(request, treasure_uuid_req)
 
-	if not treasure_obj_row:
+	if not treasure_access:
 		return HttpResponseRedirect(reverse("dashboard"))
 
 	media_obj_row = MediaFile.objects.filter(
@@ -641,37 +558,13 @@ def treasuresMediaUpdateView(request, is_valid, payload):
 	if not media_obj_row:
 		return HttpResponseRedirect(reverse("dashboard"))
 
-	added_by_user_fk = treasure_obj_row.user_fk_id
-	user_obj = Users.objects.filter(id=payload["user_id"]).first()
-
-	if user_obj:
-		current_user_id = user_obj.id
-
-		if current_user_id != added_by_user_fk and user_obj.role != RoleModel.ADMIN:
-			return HttpResponseRedirect(reverse("no_permission"))
+	if not treasure_access.can_edit:
+		return HttpResponseRedirect(reverse("no_permission"))
 
+	user_obj = current_user(request)
 	user_info = get_user_info(request, user_obj)
 	conservation_photos_uuid = generate_random_uuid()
-	lang_en_row = E56_Language.objects.filter(code="en").first()
-	lang_en_fk_id = lang_en_row.id
-	title_en_row = E35_Title.objects.filter(
-		treasure_fk_id=treasure_uuid_req,
-		language_fk_id=lang_en_fk_id,
-	).first()
-	title_en = ""
-
-	if title_en_row:
-		title_en = title_en_row.content
-
-	appellation_en_row = E41_Appellation.objects.filter(
-		treasure_fk_id=treasure_uuid_req,
-		language_fk_id=lang_en_fk_id,
-	).first()
-
-	appellation_en = ""
-
-	if appellation_en_row:
-		appellation_en = appellation_en_row.content
+	title_en, appellation_en = get_treasure_titles(treasure_uuid_req)
 
 	template = loader.get_template("backend/treasures/media/update.html")
 	context = {
@@ -700,27 +593,16 @@ def treasuresUpdateView(request, is_valid, payload):
 		request.session["next_url"] = "/backend/treasures/update/?treasure_id=" + treasure_uuid_req
 		return HttpResponseRedirect(reverse("login"))
 
-	treasure_obj_row = Ecclesiastical_Treasures.objects.filter(
-		uuid = treasure_uuid_req,
-	).first()
+	treasure_access = get_treasure_access(request, treasure_uuid_req)
 
-	if not treasure_obj_row:
+	if not treasure_access:
 		return HttpResponseRedirect(reverse("dashboard"))
 
-	added_by_user_fk = treasure_obj_row.user_fk_id
-	user_row = Users.objects.filter(
-		id=added_by_user_fk
-	).first()
-
-	if user_row:
-		current_user_obj = Users.objects.filter(id=payload["user_id"]).first()
-		current_user_id = current_user_obj.id
-
-		if current_user_id != added_by_user_fk and current_user_obj.role != RoleModel.ADMIN:
-			return HttpResponseRedirect(reverse("no_permission"))
+	if not treasure_access.can_edit:
+		return HttpResponseRedirect(reverse("no_permission"))
 
 	template = loader.get_template("backend/treasures/update.html")
-	user_obj = Users.objects.filter(id=payload["user_id"]).first()
+	user_obj = current_user(request)
 	user_info = get_user_info(request, user_obj)
 	conservation_photos_row = MediaFile.objects.filter(
 		media_type = "conservation",
@@ -751,15 +633,13 @@ def treasuresView(request, is_valid, payload):
 		request.session["next_url"] = "/backend/treasures/view/?treasure_id=" + treasure_uuid_req
 		return HttpResponseRedirect(reverse("login"))
 
-	treasure_obj_row = Ecclesiastical_Treasures.objects.filter(
-		uuid = treasure_uuid_req,
-	).first()
+	treasure_access = get_treasure_access(request, treasure_uuid_req)
 
-	if not treasure_obj_row:
+	if not treasure_access:
 		return HttpResponseRedirect(reverse("dashboard"))
 
 	template = loader.get_template("backend/treasures/view.html")
-	user_obj = Users.objects.filter(id=payload["user_id"]).first()
+	user_obj = current_user(request)
 	user_info = get_user_info(request, user_obj)
 	context = {
 		"title": "View Existing Ecclesiastical Treasure",
@@ -777,7 +657,7 @@ def noPermissionView(request, is_valid, payload):
 		return HttpResponseRedirect(reverse("login"))
 
 	template = loader.get_template("backend/assets_and_tools/no_permission.html")
-	user_obj = Users.objects.filter(id=payload["user_id"]).first()
+	user_obj = current_user(request)
 	user_info = get_user_info(request, user_obj)
 	context = {
 		"title": "No Permission",
@@ -802,6 +682,7 @@ class ActivateAccount(GenericAPIView):
 		["resource_not_found", "user"],
 		["method_not_allowed"],
 		["unsupported_media_type"],
+		["request_limit_exceeded", "user"],
 		["internal_server_error"]
 	]
 	response_dict = build_fields("ActivateAccount", response_types)
@@ -810,22 +691,21 @@ class ActivateAccount(GenericAPIView):
 		responses=response_dict,
 		security=[]
 	)
+	@rate_limited("ActivateAccount")
 	def post(self, request, *args, **kwargs):
-		log.debug("{} Received request".format(request_details(request)))
+		request_logger(request).debug("Received request")
 		try:
 			response = {}
 			data = {}
 			req_data = request.data
-			log.debug("{} START".format(request_details(request)))
+			request_logger(request).debug("START")
 			serialized_item = ActivateAccountSerializer(data=req_data)
 			is_resource_activated = False
 			is_resource_already_activated = False
 
 			if not serialized_item.is_valid():
-				log.debug("{} VALIDATION ERROR: {}".format(
-						request_details(request),
-						serialized_item.formatted_error_response()
-					)
+				request_logger(request).debug("VALIDATION ERROR: %s",
+					serialized_item.formatted_error_response()
 				)
 				response = {}
 				response[CONTENT] = serialized_item.formatted_error_response(include_already_exists=True)
@@ -833,7 +713,7 @@ class ActivateAccount(GenericAPIView):
 				data = response
 			else:
 				with transaction.atomic():
-					log.debug("{} VALID DATA".format(request_details(request)))
+					request_logger(request).debug("VALID DATA")
 					email = req_data.get("email")
 					received_activation_code = req_data.get("activation_code")
 					ts_now = now()
@@ -852,7 +732,7 @@ class ActivateAccount(GenericAPIView):
 					stored_ts_activation = active_user_row[0].get("ts_activation")
 
 					if stored_activation_code == received_activation_code and not stored_ts_activation:
-						log.debug("{} Activation codes match.".format(request_details(request)))
+						request_logger(request).debug("Activation codes match.")
 						ActiveUsers.objects.filter(
 							user_fk_id=user_fk_id
 						).update(
@@ -860,18 +740,17 @@ class ActivateAccount(GenericAPIView):
 						)
 						is_resource_activated = True
 					elif stored_ts_activation:
-						log.debug("{} Account is already activated {}".format(request_details(request), email))
+						request_logger(request).debug("Account is already activated %s", email)
 						is_resource_already_activated = True
 					else:
-						log.debug("{} Verification codes mismatch.".format(request_details(request)))
+						request_logger(request).debug("Verification codes mismatch.")
 						is_resource_activated = False
 
-					log.info("{} DB LOG".format(request_details(request)),
+					request_logger(request).info("DB LOG",
 						extra={
 							"api": self.class_name,
 							"action": self.class_action,
 							"data": model_to_json(req_data),
-							"ip_address": get_ip_address(request),
 						}
 					)
 					status_code, message = get_code_and_response(["resource_is_activated", "user"])
@@ -883,16 +762,15 @@ class ActivateAccount(GenericAPIView):
 					response = {}
 					response[CONTENT] = content
 					response[STATUS_CODE] = status_code
-					log.debug("{} SUCCESS".format(request_details(request)))
+					request_logger(request).debug("SUCCESS")
 					data = response
 		except ApplicationError as e:
-			log.info("{} DB LOG (ApplicationError): {}".format(request_details(request), str(e)),
+			request_logger(request).info("DB LOG (ApplicationError): %s", e,
 				extra={
 					"api": self.class_name,
 					"action": self.class_action,
 					"data": model_to_json(req_data),
 					"error_data": str(e),
-					"ip_address": get_ip_address(request),
 					"is_error": True
 				}
 			)
@@ -901,13 +779,12 @@ class ActivateAccount(GenericAPIView):
 			response[STATUS_CODE] = e.status_code
 			data = response
 		except Exception as e:
-			log.error("{} DB LOG (Internal error): {}".format(request_details(request), str(e)),
+			request_logger(request).error("DB LOG (Internal error): %s", e,
 				extra={
 					"api": self.class_name,
 					"action": self.class_action,
 					"data": model_to_json(req_data),
 					"error_data": str(e),
-					"ip_address": get_ip_address(request),
 					"is_error": True
 				}
 			)
@@ -937,7 +814,9 @@ class Login(TokenObtainPairView):
 		["resource_not_found", "user"],
 		["method_not_allowed"],
 		["unsupported_media_type"],
-		["internal_server_error"]
+		["request_limit_exceeded", "user"],
+		["internal_server_error"],
+		["service_unavailable"]
 	]
 	response_dict = build_fields("Login", response_types)
 
@@ -945,8 +824,9 @@ class Login(TokenObtainPairView):
 		responses=response_dict,
 		security=[]
 	)
+	@rate_limited("Login")
 	def post(self, request, *args, **kwargs):
-		log.debug("{} Received request".format(request_details(request)))
+		request_logger(request).debug("Received request")
 		data = {}
 		response = {}
 
@@ -955,21 +835,20 @@ class Login(TokenObtainPairView):
 			req_obj = {
 				"email": req_data.get("email")
 			}
-			log.debug("{} START".format(request_details(request)))
-			log.debug("{} Requested login email: {}".format(request_details(request), req_data.get("email")))
+			request_logger(request).debug("START")
+			request_logger(request).debug("Requested login email: %s", req_data.get("email"))
 			status_code, tokens = LoginSerializer(req_data).validate(req_data)
 			response[CONTENT] = tokens
 			response[STATUS_CODE] = status_code
-			log.debug("{} SUCCESS".format(request_details(request)))
+			request_logger(request).debug("SUCCESS")
 			data = response
 		except ApplicationError as e:
-			log.info("{} DB LOG (ApplicationError): {}".format(request_details(request), str(e)),
+			request_logger(request).info("DB LOG (ApplicationError): %s", e,
 				extra={
 					"api": self.class_name,
 					"action": self.class_action,
 					"data": model_to_json(req_obj),
 					"error_data": str(e),
-					"ip_address": get_ip_address(request),
 					"is_error": True
 				}
 			)
@@ -979,13 +858,12 @@ class Login(TokenObtainPairView):
 			data = response
 			return Response(data[CONTENT], status=data[STATUS_CODE])
 		except Exception as e:
-			log.error("{} DB LOG (Internal error): {}".format(request_details(request), str(e)),
+			request_logger(request).error("DB LOG (Internal error): %s", e,
 				extra={
 					"api": self.class_name,
 					"action": self.class_action,
 					"data": model_to_json(req_obj),
 					"error_data": str(e),
-					"ip_address": get_ip_address(request),
 					"is_error": True
 				}
 			)
@@ -995,12 +873,11 @@ class Login(TokenObtainPairView):
 			}
 			return Response(content, status=status_code)
 
-		log.info("{} DB LOG".format(request_details(request)),
+		request_logger(request).info("DB LOG",
 			extra={
 				"api": self.class_name,
 				"action": self.class_action,
 				"data": model_to_json(req_obj),
-				"ip_address": get_ip_address(request),
 			}
 		)
 		login_response = Response(data[CONTENT], status=data[STATUS_CODE])
@@ -1012,6 +889,7 @@ class Login(TokenObtainPairView):
 			httponly = settings.SIMPLE_JWT["AUTH_COOKIE_HTTP_ONLY"],
 			samesite = settings.SIMPLE_JWT["AUTH_COOKIE_SAMESITE"]
 		)
+		set_access_cookie(login_response, data["content"]["resource_obj"]["access"])
 		return login_response
 
 
@@ -1048,26 +926,24 @@ class PollResetEmailStatus(GenericAPIView):
 	)
 	def get(self, request):
 		try:
-			log.debug("{} Received request".format(request_details(request)))
+			request_logger(request).debug("Received request")
 			response = {}
 			data = {}
 
 			req_data = request.GET
-			log.debug("{} START".format(request_details(request)))
+			request_logger(request).debug("START")
 			serialized_item = PollResetEmailStatusSerializer(data=req_data)
 
 			if not serialized_item.is_valid():
-				log.debug("{} VALIDATION ERROR: {}".format(
-						request_details(request),
-						serialized_item.formatted_error_response()
-					)
+				request_logger(request).debug("VALIDATION ERROR: %s",
+					serialized_item.formatted_error_response()
 				)
 				response = {}
 				response[CONTENT] = serialized_item.formatted_error_response(include_already_exists=True)
 				response[STATUS_CODE] = status.HTTP_400_BAD_REQUEST
 				data = response
 			else:
-				log.debug("{} VALID DATA".format(request_details(request)))
+				request_logger(request).debug("VALID DATA")
 				email = req_data.get("email")
 				user_row = Users.objects.filter(email=email).values("c_reset_task_id")
 
@@ -1089,12 +965,11 @@ class PollResetEmailStatus(GenericAPIView):
 				elif result.state == "SUCCESS":
 					c_task_status = "SUCCESS"
 
-				log.info("{} DB LOG".format(request_details(request)),
+				request_logger(request).info("DB LOG",
 					extra={
 						"api": self.class_name,
 						"action": self.class_action,
 						"data": model_to_json(req_data),
-						"ip_address": get_ip_address(request),
 					}
 				)
 				status_code, message = get_code_and_response(["success_with_status_return"])
@@ -1104,16 +979,15 @@ class PollResetEmailStatus(GenericAPIView):
 				response = {}
 				response[CONTENT] = content
 				response[STATUS_CODE] = status_code
-				log.debug("{} SUCCESS".format(request_details(request)))
+				request_logger(request).debug("SUCCESS")
 				data = response
 		except ApplicationError as e:
-			log.info("{} DB LOG (ApplicationError): {}".format(request_details(request), str(e)),
+			request_logger(request).info("DB LOG (ApplicationError): %s", e,
 				extra={
 					"api": self.class_name,
 					"action": self.class_action,
 					"data": model_to_json(req_data),
 					"error_data": str(e),
-					"ip_address": get_ip_address(request),
 					"is_error": True
 				}
 			)
@@ -1122,13 +996,12 @@ class PollResetEmailStatus(GenericAPIView):
 			response[STATUS_CODE] = e.status_code
 			data = response
 		except Exception as e:
-			log.error("{} DB LOG (Internal error): {}".format(request_details(request), str(e)),
+			request_logger(request).error("DB LOG (Internal error): %s", e,
 				extra={
 					"api": self.class_name,
 					"action": self.class_action,
 					"data": model_to_json(req_data),
 					"error_data": str(e),
-					"ip_address": get_ip_address(request),
 					"is_error": True
 				}
 			)
@@ -1163,26 +1036,26 @@ class RefreshToken(TokenRefreshView):
 		security=[]
 	)
 	def post(self, request, *args, **kwargs):
-		log.debug("{} Received request".format(request_details(request)))
+		request_logger(request).debug("Received request")
 		data = {}
 		response = {}
 
 		try:
-			log.debug("{} START".format(request_details(request)))
+			request_logger(request).debug("START")
 			req_data = request.data
 			status_code, token = RefreshTokenSerializer(req_data).validate(req_data)
 			response[CONTENT] = token
 			response[STATUS_CODE] = status_code
-			log.debug("{} SUCCESS".format(request_details(request)))
+			request_logger(request).debug("SUCCESS")
 			data = response
 		except ApplicationError as e:
-			log.debug("{} ERROR: {}".format(request_details(request), str(e)))
+			request_logger(request).debug("ERROR: %s", e)
 			response = {}
 			response[CONTENT] = e.get_response_body()
 			response[STATUS_CODE] = e.status_code
 			data = response
 		except Exception as e:
-			log.debug("{} Internal error: {}".format(request_details(request), str(e)))
+			request_logger(request).debug("Internal error: %s", e)
 			status_code, _ = get_code_and_response(["internal_server_error"])
 			content = {
 				MESSAGE: "Unable to refresh token"
@@ -1206,7 +1079,9 @@ class RegisterUser(CreateAPIView):
 		["bad_request"],
 		["method_not_allowed"],
 		["unsupported_media_type"],
-		["internal_server_error"]
+		["request_limit_exceeded", "user"],
+		["internal_server_error"],
+		["service_unavailable"]
 	]
 	response_dict = build_fields("RegisterUser", response_types)
 
@@ -1218,13 +1093,14 @@ class RegisterUser(CreateAPIView):
 		responses=response_dict,
 		security=[]
 	)
+	@rate_limited("RegisterUser")
 	def post(self, request, *args, **kwargs):
-		log.debug("{} Received request".format(request_details(request)))
+		request_logger(request).debug("Received request")
 		data = {}
 		response = {}
 
 		try:
-			log.debug("{} START".format(request_details(request)))
+			request_logger(request).debug("START")
 			req_data = request.data
 			req_obj = {
 				"email": req_data.get("email"),
@@ -1235,17 +1111,15 @@ class RegisterUser(CreateAPIView):
 			serialized_user = RegisterUserSerializer(data=req_data)
 
 			if not serialized_user.is_valid():
-				log.debug("{} VALIDATION ERROR: {}".format(
-						request_details(request),
-						serialized_user.formatted_error_response()
-					)
+				request_logger(request).debug("VALIDATION ERROR: %s",
+					serialized_user.formatted_error_response()
 				)
 				response = {}
 				response[CONTENT] = serialized_user.formatted_error_response(include_already_exists=True)
 				response[STATUS_CODE] = status.HTTP_400_BAD_REQUEST
 				data = response
 			else:
-				log.debug("{} VALID DATA".format(request_details(request)))
+				request_logger(request).debug("VALID DATA")
 				email = req_data.get("email")
 				name = req_data.get("name")
 				surname = req_data.get("surname")
@@ -1254,7 +1128,7 @@ class RegisterUser(CreateAPIView):
 				role = RoleModel.REGULAR
 				ts_now = now()
 
-				password_hash = make_password(password)
+				password_hash = hashing.make_password(password)
 
 				user = Users(
 					email=email,
@@ -1285,17 +1159,16 @@ class RegisterUser(CreateAPIView):
 					countdown=settings.EMAIL_COUNTDOWN_SEC
 				)
 				Users.objects.filter(email=email).update(c_register_task_id=result.id)
-				log.debug("{} Will send registration email to: {}. Updating async result with task ID: {}".format(
-						request_details(request), email, result.id
-					)
+				request_logger(request).debug("Will send registration email to: %s. Updating async result with task ID: %s",
+					email,
+					result.id
 				)
 
-				log.info("{} DB LOG".format(request_details(request)),
+				request_logger(request).info("DB LOG",
 					extra={
 						"api": self.class_name,
 						"action": self.class_action,
 						"data": model_to_json(req_obj),
-						"ip_address": get_ip_address(request),
 					}
 				)
 				status_code, message = get_code_and_response(["success"])
@@ -1305,16 +1178,15 @@ class RegisterUser(CreateAPIView):
 				response = {}
 				response[CONTENT] = content
 				response[STATUS_CODE] = status_code
-				log.debug("{} SUCCESS".format(request_details(request)))
+				request_logger(request).debug("SUCCESS")
 				data = response
 		except ApplicationError as e:
-			log.info("{} DB LOG (ApplicationError): {}".format(request_details(request), str(e)),
+			request_logger(request).info("DB LOG (ApplicationError): %s", e,
 				extra={
 					"api": self.class_name,
 					"action": self.class_action,
 					"data": model_to_json(req_obj),
 					"error_data": str(e),
-					"ip_address": get_ip_address(request),
 					"is_error": True
 				}
 			)
@@ -1323,13 +1195,12 @@ class RegisterUser(CreateAPIView):
 			response[STATUS_CODE] = e.status_code
 			data = response
 		except Exception as e:
-			log.error("{} DB LOG (Internal error): {}".format(request_details(request), str(e)),
+			request_logger(request).error("DB LOG (Internal error): %s", e,
 				extra={
 					"api": self.class_name,
 					"action": self.class_action,
 					"data": model_to_json(req_obj),
 					"error_data": str(e),
-					"ip_address": get_ip_address(request),
 					"is_error": True
 				}
 			)
@@ -1370,21 +1241,20 @@ class RequestPasswordResetCode(GenericAPIView):
 		responses=response_dict,
 		security=[],
 	)
+	@rate_limited("RequestPasswordResetCode")
 	def post(self, request, *args, **kwargs):
 		try:
-			log.debug("{} Received request".format(request_details(request)))
+			request_logger(request).debug("Received request")
 			response = {}
 			data = {}
 
 			req_data = request.data
-			log.debug("{} START".format(request_details(request)))
+			request_logger(request).debug("START")
 			serialized_item = RequestPasswordResetCodeSerializer(data=req_data)
 
 			if not serialized_item.is_valid():
-				log.debug("{} VALIDATION ERROR: {}".format(
-						request_details(request),
-						serialized_item.formatted_error_response()
-					)
+				request_logger(request).debug("VALIDATION ERROR: %s",
+					serialized_item.formatted_error_response()
 				)
 				response = {}
 				response[CONTENT] = serialized_item.formatted_error_response(include_already_exists=True)
@@ -1392,7 +1262,7 @@ class RequestPasswordResetCode(GenericAPIView):
 				data = response
 			else:
 				with transaction.atomic():
-					log.debug("{} VALID DATA".format(request_details(request)))
+					request_logger(request).debug("VALID DATA")
 					email = req_data.get("email")
 					user_row = Users.objects.filter(email=email).values("id")
 
@@ -1458,17 +1328,16 @@ class RequestPasswordResetCode(GenericAPIView):
 						countdown=settings.EMAIL_COUNTDOWN_SEC
 					)
 					Users.objects.filter(email=email).update(c_reset_task_id=result.id)
-					log.debug("{} Will send reset code email to: {}. Updating async result with task ID: {}".format(
-							request_details(request), email, result.id
-						)
+					request_logger(request).debug("Will send reset code email to: %s. Updating async result with task ID: %s",
+						email,
+						result.id
 					)
 
-					log.info("{} DB LOG".format(request_details(request)),
+					request_logger(request).info("DB LOG",
 						extra={
 							"api": self.class_name,
 							"action": self.class_action,
 							"data": model_to_json(req_data),
-							"ip_address": get_ip_address(request),
 						}
 					)
 					status_code, message = get_code_and_response(["success"])
@@ -1478,16 +1347,15 @@ class RequestPasswordResetCode(GenericAPIView):
 					response = {}
 					response[CONTENT] = content
 					response[STATUS_CODE] = status_code
-					log.debug("{} SUCCESS".format(request_details(request)))
+					request_logger(request).debug("SUCCESS")
 					data = response
 		except ApplicationError as e:
-			log.info("{} DB LOG (ApplicationError): {}".format(request_details(request), str(e)),
+			request_logger(request).info("DB LOG (ApplicationError): %s", e,
 				extra={
 					"api": self.class_name,
 					"action": self.class_action,
 					"data": model_to_json(req_data),
 					"error_data": str(e),
-					"ip_address": get_ip_address(request),
 					"is_error": True
 				}
 			)
@@ -1496,13 +1364,12 @@ class RequestPasswordResetCode(GenericAPIView):
 			response[STATUS_CODE] = e.status_code
 			data = response
 		except Exception as e:
-			log.error("{} DB LOG (Internal error): {}".format(request_details(request), str(e)),
+			request_logger(request).error("DB LOG (Internal error): %s", e,
 				extra={
 					"api": self.class_name,
 					"action": self.class_action,
 					"data": model_to_json(req_data),
 					"error_data": str(e),
-					"ip_address": get_ip_address(request),
 					"is_error": True
 				}
 			)
@@ -1532,7 +1399,8 @@ class ResetAccountPassword(GenericAPIView):
 		["resource_expired", "reset_code"],
 		["resource_incorrect", "reset_code"],
 		["resource_not_requested", "reset_code"],
-		["internal_server_error"]
+		["internal_server_error"],
+		["service_unavailable"]
 	]
 	response_dict = build_fields("ResetAccountPassword", response_types)
 
@@ -1542,7 +1410,7 @@ class ResetAccountPassword(GenericAPIView):
 	)
 	def post(self, request, *args, **kwargs):
 		try:
-			log.debug("{} Received request".format(request_details(request)))
+			request_logger(request).debug("Received request")
 			response = {}
 			data = {}
 
@@ -1551,15 +1419,13 @@ class ResetAccountPassword(GenericAPIView):
 				"email": req_data.get("email"),
 				"received_reset_code": req_data.get("reset_code"),
 			}
-			log.debug("{} START".format(request_details(request)))
+			request_logger(request).debug("START")
 			serialized_item = ResetPasswordSerializer(data=req_data)
 			is_resource_reset = False
 
 			if not serialized_item.is_valid():
-				log.debug("{} VALIDATION ERROR: {}".format(
-						request_details(request),
-						serialized_item.formatted_error_response()
-					)
+				request_logger(request).debug("VALIDATION ERROR: %s",
+					serialized_item.formatted_error_response()
 				)
 				response = {}
 				response[CONTENT] = serialized_item.formatted_error_response(include_already_exists=True)
@@ -1567,7 +1433,7 @@ class ResetAccountPassword(GenericAPIView):
 				data = response
 			else:
 				with transaction.atomic():
-					log.debug("{} VALID DATA".format(request_details(request)))
+					request_logger(request).debug("VALID DATA")
 					email = req_data.get("email")
 					password = req_data.get("password")
 					received_reset_code = req_data.get("reset_code")
@@ -1581,11 +1447,11 @@ class ResetAccountPassword(GenericAPIView):
 					reset_password_row = ResetPassword.objects.filter(user_fk_id=user_fk_id).first()
 
 					if not reset_password_row:
-						log.debug("{} No active reset code.".format(request_details(request)))
+						request_logger(request).debug("No active reset code.")
 						raise ApplicationError(["resource_not_requested", "reset_code"], reason="not_requested_reset_code")
 					
 					if is_compliant(password) == False:
-						log.debug("{} Password is not compliant with the password policy".format(request_details(request)))
+						request_logger(request).debug("Password is not compliant with the password policy")
 						raise ApplicationError(["resource_incorrect", "password"])
 
 					active_reset_code = reset_password_row.reset_code
@@ -1593,22 +1459,21 @@ class ResetAccountPassword(GenericAPIView):
 
 					if not reset_password_row is None and active_reset_code == received_reset_code and not code_has_expired:
 						ts_now = now()
-						log.debug("{} Reset password codes match.".format(request_details(request)))
+						request_logger(request).debug("Reset password codes match.")
 						ResetPassword.objects.filter(user_fk_id=user_fk_id).update(
 							ts_reset=ts_now,
 							ts_expiration_reset=ts_now
 						)
-						password_hash = make_password(password)
+						password_hash = hashing.make_password(password)
 						Users.objects.filter(email=email).update(
 							password=password_hash
 						)
-						log.info("{} DB LOG".format(request_details(request)),
+						request_logger(request).info("DB LOG",
 							extra={
 								"user_id": user_fk_id,
 								"api": self.class_name,
 								"action": self.class_action,
 								"data": model_to_json(req_obj),
-								"ip_address": get_ip_address(request),
 							}
 						)
 						status_code, message = get_code_and_response(["success"])
@@ -1618,22 +1483,21 @@ class ResetAccountPassword(GenericAPIView):
 						response = {}
 						response[CONTENT] = content
 						response[STATUS_CODE] = status_code
-						log.debug("{} SUCCESS".format(request_details(request)))
+						request_logger(request).debug("SUCCESS")
 						data = response
 					elif active_reset_code != received_reset_code:
-						log.debug("{} Reset codes mismatch.".format(request_details(request)))
+						request_logger(request).debug("Reset codes mismatch.")
 						raise ApplicationError(["resource_incorrect", "reset_code"], reason="incorrect_reset_code")
 					else:
-						log.debug("{} Reset code has expired.".format(request_details(request)))
+						request_logger(request).debug("Reset code has expired.")
 						raise ApplicationError(["resource_expired", "reset_code"], reason="expired_reset_code")
 		except ApplicationError as e:
-			log.info("{} DB LOG (ApplicationError): {}".format(request_details(request), str(e)),
+			request_logger(request).info("DB LOG (ApplicationError): %s", e,
 				extra={
 					"api": self.class_name,
 					"action": self.class_action,
 					"data": model_to_json(req_obj),
 					"error_data": str(e),
-					"ip_address": get_ip_address(request),
 					"is_error": True
 				}
 			)
@@ -1642,13 +1506,12 @@ class ResetAccountPassword(GenericAPIView):
 			response[STATUS_CODE] = e.status_code
 			data = response
 		except Exception as e:
-			log.error("{} DB LOG (Internal error): {}".format(request_details(request), str(e)),
+			request_logger(request).error("DB LOG (Internal error): %s", e,
 				extra={
 					"api": self.class_name,
 					"action": self.class_action,
 					"data": model_to_json(req_obj),
 					"error_data": str(e),
-					"ip_address": get_ip_address(request),
 					"is_error": True
 				}
 			)
@@ -1677,7 +1540,8 @@ class UpdatePassword(GenericAPIView):
 		["method_not_allowed"],
 		["unsupported_media_type"],
 		["resource_incorrect", "password"],
-		["internal_server_error"]
+		["internal_server_error"],
+		["service_unavailable"]
 	]
 	response_dict = build_fields("UpdatePassword", response_types)
 
@@ -1686,7 +1550,7 @@ class UpdatePassword(GenericAPIView):
 	)
 	def post(self, request, *args, **kwargs):
 		try:
-			log.debug("{} START".format(request_details(request)))
+			request_logger(request).debug("START")
 			is_valid, payload = at.authenticate(request)
 
 			if not is_valid:
@@ -1699,17 +1563,15 @@ class UpdatePassword(GenericAPIView):
 			serialized_item = UpdatePasswordSerializer(data=req_data)
 
 			if not serialized_item.is_valid():
-				log.debug("{} VALIDATION ERROR: {}".format(
-						request_details(request),
-						serialized_item.formatted_error_response()
-					)
+				request_logger(request).debug("VALIDATION ERROR: %s",
+					serialized_item.formatted_error_response()
 				)
 				response = {}
 				response[CONTENT] = serialized_item.formatted_error_response(include_already_exists=True)
 				response[STATUS_CODE] = status.HTTP_400_BAD_REQUEST
 				data = response
 			else:
-				log.debug("{} VALID DATA".format(request_details(request)))
+				request_logger(request).debug("VALID DATA")
 
 				with transaction.atomic():
 					current_user = payload["sub"]
@@ -1717,33 +1579,34 @@ class UpdatePassword(GenericAPIView):
 					new_password = req_data.get("new_password")
 					ts_now = now()
 
-					user_obj = Users.objects.filter(id=payload["user_id"]).first()
+					user_obj = current_user(request)
 
 					if not user_obj:
 						raise ApplicationError(["resource_not_found", "user"])
 					
 					if is_compliant(new_password) == False:
-						log.debug("{} Password is not compliant with the password policy".format(request_details(request)))
+						request_logger(request).debug("Password is not compliant with the password policy")
 						raise ApplicationError(["resource_incorrect", "password"])
 
 					password_hash = user_obj.password
 
-					if not check_password(current_password, password_hash):
-						log.debug("{} Password is incorrect".format(request_details(request)))
+					is_correct, _ = hashing.check_password(current_password, password_hash)
+
+					if not is_correct:
+						request_logger(request).debug("Password is incorrect")
 						raise ApplicationError(["resource_incorrect", "password"])
 					else:
-						new_password_hash = make_password(new_password)
+						new_password_hash = hashing.make_password(new_password)
 						Users.objects.filter(
 							id=payload["user_id"]
 						).update(
 							password=new_password_hash
 						)
-						log.info("{} DB LOG".format(request_details(request)),
+						request_logger(request).info("DB LOG",
 							extra={
 								"user_id": payload["user_id"],
 								"api": self.class_name,
 								"action": self.class_action,
-								"ip_address": get_ip_address(request),
 							}
 						)
 						status_code, message = get_code_and_response(["success"])
@@ -1753,15 +1616,14 @@ class UpdatePassword(GenericAPIView):
 						response = {}
 						response[CONTENT] = content
 						response[STATUS_CODE] = status_code
-						log.debug("{} SUCCESS".format(request_details(request)))
+						request_logger(request).debug("SUCCESS")
 						data = response
 		except ApplicationError as e:
-			log.info("{} DB LOG (ApplicationError): {}".format(request_details(request), str(e)),
+			request_logger(request).info("DB LOG (ApplicationError): %s", e,
 				extra={
 					"api": self.class_name,
 					"action": self.class_action,
 					"error_data": str(e),
-					"ip_address": get_ip_address(request),
 					"is_error": True
 				}
 			)
@@ -1770,12 +1632,11 @@ class UpdatePassword(GenericAPIView):
 			response[STATUS_CODE] = e.status_code
 			data = response
 		except Exception as e:
-			log.error("{} DB LOG (Internal error): {}".format(request_details(request), str(e)),
+			request_logger(request).error("DB LOG (Internal error): %s", e,
 				extra={
 					"api": self.class_name,
 					"action": self.class_action,
 					"error_data": str(e),
-					"ip_address": get_ip_address(request),
 					"is_error": True
 				}
 			)
@@ -1811,12 +1672,12 @@ class UpdateProfile(GenericAPIView):
 		security=[]
 	)
 	def post(self, request, *args, **kwargs):
-		log.debug("{} Received request". format(request_details(request)))
+		request_logger(request).debug("Received request")
 		data = {}
 		response = {}
 
 		try:
-			log.debug("{} START".format(request_details(request)))
+			request_logger(request).debug("START")
 			req_data = request.data
 
 			is_valid, payload = at.authenticate(request)
@@ -1827,10 +1688,8 @@ class UpdateProfile(GenericAPIView):
 			serialized_item = UpdateProfileSerializer(data=req_data)
 
 			if not serialized_item.is_valid():
-				log.debug("{} VALIDATION ERROR: {}".format(
-						request_details(request),
-						serialized_item.formatted_error_response()
-					)
+				request_logger(request).debug("VALIDATION ERROR: %s",
+					serialized_item.formatted_error_response()
 				)
 				response = {}
 				response[CONTENT] = serialized_item.formatted_error_response(include_already_exists=True)
@@ -1841,7 +1700,7 @@ class UpdateProfile(GenericAPIView):
 					ts_now = now()
 					cleanup_dirs_list = []
 
-					user_obj = Users.objects.filter(id=payload["user_id"]).first()
+					user_obj = current_user(request)
 
 					media_type_id = req_data.get("media_type_id", None)
 					media_type = req_data.get("type", None)
@@ -1853,10 +1712,10 @@ class UpdateProfile(GenericAPIView):
 					).first()
 
 					if not media_row_obj:
-						log.debug("{} Media row not found. Will skip profile picture update".format(request_details(request)))
+						request_logger(request).debug("Media row not found. Will skip profile picture update")
 					else:
 						# HANDLE UPLOADED PROFILE PIC - START
-						log.debug("{} Will handle uploaded media".format(request_details(request)))
+						request_logger(request).debug("Will handle uploaded media")
 
 						file_to_move = DIR_CODE_MEDIA + DIR_MEDIA_TEMP + \
 										str(media_row_obj.dir_path) + "/" + str(media_row_obj.uuid) + str(media_row_obj.file_ext)
@@ -1904,20 +1763,21 @@ class UpdateProfile(GenericAPIView):
 					user_obj.save()
 					# HANDLE UPDATES OF FULL NAME AND TELEPHONE - END
 
+					treasure_sync.sync_user_treasures(user_obj)
+
 					for dir_item in cleanup_dirs_list:
 						try:
 							shutil.rmtree(dir_item)
-							log.debug("{} Media deleted: {}".format(request_details(request), dir_item))
+							request_logger(request).debug("Media deleted: %s", dir_item)
 						except Exception as e:
-							log.debug("{} Media cannot be deleted. Error: {}".format(request_details(request), str(e)))
+							request_logger(request).debug("Media cannot be deleted. Error: %s", e)
 
-				log.info("{} DB LOG".format(request_details(request)),
+				request_logger(request).info("DB LOG",
 					extra={
 						"user_id": payload["user_id"],
 						"api": self.class_name,
 						"action": self.class_action,
 						"data": model_to_json(req_data),
-						"ip_address": get_ip_address(request),
 					}
 				)
 				status_code, message = get_code_and_response(["success"])
@@ -1927,16 +1787,15 @@ class UpdateProfile(GenericAPIView):
 				response = {}
 				response[CONTENT] = content
 				response[STATUS_CODE] = status_code
-				log.debug("{} SUCCESS".format(request_details(request)))
+				request_logger(request).debug("SUCCESS")
 				data = response
 		except ApplicationError as e:
-			log.info("{} DB LOG (ApplicationError): {}".format(request_details(request), str(e)),
+			request_logger(request).info("DB LOG (ApplicationError): %s", e,
 				extra={
 					"api": self.class_name,
 					"action": self.class_action,
 					"data": model_to_json(req_data),
 					"error_data": str(e),
-					"ip_address": get_ip_address(request),
 					"is_error": True
 				}
 			)
@@ -1945,13 +1804,12 @@ class UpdateProfile(GenericAPIView):
 			response[STATUS_CODE] = e.status_code
 			data = response
 		except Exception as e:
-			log.error("{} DB LOG (Internal error): {}".format(request_details(request), str(e)),
+			request_logger(request).error("DB LOG (Internal error): %s", e,
 				extra={
 					"api": self.class_name,
 					"action": self.class_action,
 					"data": model_to_json(req_data),
 					"error_data": str(e),
-					"ip_address": get_ip_address(request),
 					"is_error": True
 				}
 			)
@@ -1987,12 +1845,12 @@ class EcclesiasticalTreasuresCreate(GenericAPIView):
 		security=[]
 	)
 	def post(self, request, *args, **kwargs):
-		log.debug("{} Received request". format(request_details(request)))
+		request_logger(request).debug("Received request")
 		data = {}
 		response = {}
 
 		try:
-			log.debug("{} START".format(request_details(request)))
+			request_logger(request).debug("START")
 			req_data = request.data
 
 			is_valid, payload = at.authenticate(request)
@@ -2003,10 +1861,8 @@ class EcclesiasticalTreasuresCreate(GenericAPIView):
 			serialized_item = EcclesiasticalTreasuresCreateSerializer(data=req_data)
 
 			if not serialized_item.is_valid():
-				log.debug("{} VALIDATION ERROR: {}".format(
-						request_details(request),
-						serialized_item.formatted_error_response()
-					)
+				request_logger(request).debug("VALIDATION ERROR: %s",
+					serialized_item.formatted_error_response()
 				)
 				response = {}
 				response[CONTENT] = serialized_item.formatted_error_response(include_already_exists=True)
@@ -2359,7 +2215,7 @@ class EcclesiasticalTreasuresCreate(GenericAPIView):
 					)
 
 					if conservation_photos_rows:
-						log.debug("{} Will handle conservation photos".format(request_details(request)))
+						request_logger(request).debug("Will handle conservation photos")
 
 						for row_item in conservation_photos_rows:
 							file_to_move = DIR_CODE_MEDIA + DIR_MEDIA_TEMP + \
@@ -2407,7 +2263,7 @@ class EcclesiasticalTreasuresCreate(GenericAPIView):
 					)
 
 					if content_rows:
-						log.debug("{} Will handle content media".format(request_details(request)))
+						request_logger(request).debug("Will handle content media")
 
 						for row_item in content_rows:
 							file_to_move = DIR_CODE_MEDIA + DIR_MEDIA_TEMP + \
@@ -2455,7 +2311,7 @@ class EcclesiasticalTreasuresCreate(GenericAPIView):
 					)
 
 					if photos_media_rows:
-						log.debug("{} Will handle photos media".format(request_details(request)))
+						request_logger(request).debug("Will handle photos media")
 
 						for row_item in photos_media_rows:
 							file_to_move = DIR_CODE_MEDIA + DIR_MEDIA_TEMP + \
@@ -2503,7 +2359,7 @@ class EcclesiasticalTreasuresCreate(GenericAPIView):
 					)
 
 					if videos_media_rows:
-						log.debug("{} Will handle videos media".format(request_details(request)))
+						request_logger(request).debug("Will handle videos media")
 
 						for row_item in videos_media_rows:
 							file_to_move = DIR_CODE_MEDIA + DIR_MEDIA_TEMP + \
@@ -2534,21 +2390,22 @@ class EcclesiasticalTreasuresCreate(GenericAPIView):
 								)
 					# VIDEOS MEDIA - END
 
+					treasure_sync.sync_treasure(new_treasure.uuid, media_changed=True)
+
 					for dir_item in cleanup_dirs_list:
 						try:
 							shutil.rmtree(dir_item)
-							log.debug("{} Media deleted: {}".format(request_details(request), dir_item))
+							request_logger(request).debug("Media deleted: %s", dir_item)
 						except Exception as e:
-							log.debug("{} Media cannot be deleted. Error: {}".format(request_details(request), str(e)))
+							request_logger(request).debug("Media cannot be deleted. Error: %s", e)
 
 				req_data["treasure_id"] = treasure_uuid
-				log.info("{} DB LOG".format(request_details(request)),
+				request_logger(request).info("DB LOG",
 					extra={
 						"user_id": payload["user_id"],
 						"api": self.class_name,
 						"action": self.class_action,
 						"data": model_to_json(req_data),
-						"ip_address": get_ip_address(request),
 					}
 				)
 				status_code, message = get_code_and_response(["success"])
@@ -2558,16 +2415,15 @@ class EcclesiasticalTreasuresCreate(GenericAPIView):
 				response = {}
 				response[CONTENT] = content
 				response[STATUS_CODE] = status_code
-				log.debug("{} SUCCESS".format(request_details(request)))
+				request_logger(request).debug("SUCCESS")
 				data = response
 		except ApplicationError as e:
-			log.info("{} DB LOG (ApplicationError): {}".format(request_details(request), str(e)),
+			request_logger(request).info("DB LOG (ApplicationError): %s", e,
 				extra={
 					"api": self.class_name,
 					"action": self.class_action,
 					"data": model_to_json(req_data),
 					"error_data": str(e),
-					"ip_address": get_ip_address(request),
 					"is_error": True
 				}
 			)
@@ -2576,13 +2432,12 @@ class EcclesiasticalTreasuresCreate(GenericAPIView):
 			response[STATUS_CODE] = e.status_code
 			data = response
 		except Exception as e:
-			log.error("{} DB LOG (Internal error): {}".format(request_details(request), str(e)),
+			request_logger(request).error("DB LOG (Internal error): %s", e,
 				extra={
 					"api": self.class_name,
 					"action": self.class_action,
 					"data": model_to_json(req_data),
 					"error_data": str(e),
-					"ip_address": get_ip_address(request),
 					"is_error": True
 				}
 			)
@@ -2638,40 +2493,29 @@ class EcclesiasticalTreasuresDelete(DestroyAPIView):
 			if not is_valid:
 				raise ApplicationError(["unauthorized"])
 
-			log.debug("{} START".format(request_details(request)))
+			request_logger(request).debug("START")
 			serialized_item = EcclesiasticalTreasuresDeleteSerializer(data=req_data)
 
 			if not serialized_item.is_valid():
-				log.debug("{} VALIDATION ERROR: {}".format(
-						request_details(request),
-						serialized_item.formatted_error_response()
-					)
+				request_logger(request).debug("VALIDATION ERROR: %s",
+					serialized_item.formatted_error_response()
 				)
 				response = {}
 				response[CONTENT] = serialized_item.formatted_error_response(include_already_exists=False)
 				response[STATUS_CODE] = status.HTTP_400_BAD_REQUEST
 				data = response
 			else:
-				log.debug("{} VALID DATA".format(request_details(request)))
+				request_logger(request).debug("VALID DATA")
 				treasure_uuid = req_data.get("treasure_id")
 				cleanup_dirs = []
 
-				treasure_row = Ecclesiastical_Treasures.objects.filter(uuid=treasure_uuid).first()
+				treasure_access = get_treasure_access(request, treasure_uuid, for_update=True)
 
-				if not treasure_row:
+				if not treasure_access:
 					raise ApplicationError(["resource_not_found", "ecclesiastical_treasure"])
 
-				current_user_obj = Users.objects.filter(id=payload["user_id"]).first()
-				current_user_id = current_user_obj.id
-
-				added_by_user_fk = treasure_row.user_fk_id
-				user_row = Users.objects.filter(
-					id=added_by_user_fk
-				).first()
-
-				if user_row:
-					if current_user_id != added_by_user_fk and current_user_obj.role != RoleModel.ADMIN:
-						raise ApplicationError(["resource_not_allowed"])
+				if not treasure_access.can_edit:
+					raise ApplicationError(["resource_not_allowed"])
 
 				conservation_photos_rows = MediaFile.objects.filter(
 						treasure_fk_id = treasure_uuid,
@@ -2723,24 +2567,26 @@ class EcclesiasticalTreasuresDelete(DestroyAPIView):
 
 				try:
 					with transaction.atomic():
-						treasure_row.delete()
+						treasure_access.treasure.delete()
+						treasure_sync.bump_catalogue_version()
+
+					invalidate_treasure_access(request, treasure_uuid)
 				except Exception as e:
-					log.debug("{} Failed to delete treasure from db. Error: {}".format(request_details(request), str(e)))
+					request_logger(request).debug("Failed to delete treasure from db. Error: %s", e)
 					raise
 
 				for dir_item in cleanup_dirs:
 					try:
 						shutil.rmtree(dir_item)
 					except Exception as e:
-						log.debug("{} Failed to delete dir path of conservation photo for ecclesiastical treasure. Error: {}".format(request_details(request), str(e)))
+						request_logger(request).debug("Failed to delete dir path of conservation photo for ecclesiastical treasure. Error: %s", e)
 
-				log.info("{} DB LOG".format(request_details(request)),
+				request_logger(request).info("DB LOG",
 					extra={
 						"user_id": payload["user_id"],
 						"api": self.class_name,
 						"action": self.class_action,
 						"data": model_to_json(req_data),
-						"ip_address": get_ip_address(request),
 					}
 				)
 				status_code, message = get_code_and_response(["success"])
@@ -2749,16 +2595,15 @@ class EcclesiasticalTreasuresDelete(DestroyAPIView):
 				response = {}
 				response[CONTENT] = content
 				response[STATUS_CODE] = status_code
-				log.debug("{} SUCCESS".format(request_details(request)))
+				request_logger(request).debug("SUCCESS")
 				data = response
 		except ApplicationError as e:
-			log.info("{} DB LOG (ApplicationError): {}".format(request_details(request), str(e)),
+			request_logger(request).info("DB LOG (ApplicationError): %s", e,
 				extra={
 					"api": self.class_name,
 					"action": self.class_action,
 					"data": model_to_json(req_data),
 					"error_data": str(e),
-					"ip_address": get_ip_address(request),
 					"is_error": True
 				}
 			)
@@ -2767,13 +2612,12 @@ class EcclesiasticalTreasuresDelete(DestroyAPIView):
 			response[STATUS_CODE] = e.status_code
 			data = response
 		except Exception as e:
-			log.error("{} DB LOG (Internal error): {}".format(request_details(request), str(e)),
+			request_logger(request).error("DB LOG (Internal error): %s", e,
 				extra={
 					"api": self.class_name,
 					"action": self.class_action,
 					"data": model_to_json(req_data),
 					"error_data": str(e),
-					"ip_address": get_ip_address(request),
 					"is_error": True
 				}
 			)
@@ -2790,6 +2634,7 @@ class EcclesiasticalTreasuresFetch(GenericAPIView):
 	"""
 	get:
 	Returns the data of a specific ecclesiastical treasure based on the `treasure_id`
+	Responses carry an `ETag`, a request whose `If-None-Match` holds it is answered with 304 Not Modified.
 	"""
 	class_name = "EcclesiasticalTreasuresFetch"
 	class_action = "LIST"
@@ -2819,9 +2664,10 @@ class EcclesiasticalTreasuresFetch(GenericAPIView):
 	)
 	def get(self, request):
 		try:
-			log.debug("{} Received request".format(request_details(request)))
+			request_logger(request).debug("Received request")
 			response = {}
 			data = {}
+			etag = None
 			req_data = request.GET
 
 			is_valid, payload = at.authenticate(request)
@@ -2832,24 +2678,37 @@ class EcclesiasticalTreasuresFetch(GenericAPIView):
 			serialized_item = EcclesiasticalTreasuresFetchSerializer(data=req_data)
 
 			if not serialized_item.is_valid():
-				log.debug("{} VALIDATION ERROR: {}".format(
-						request_details(request),
-						serialized_item.formatted_error_response()
-					)
+				request_logger(request).debug("VALIDATION ERROR: %s",
+					serialized_item.formatted_error_response()
 				)
 				response = {}
 				response[CONTENT] = serialized_item.formatted_error_response(include_already_exists=False)
 				response[STATUS_CODE] = status.HTTP_400_BAD_REQUEST
 				data = response
 			else:
-				log.debug("{} VALID DATA".format(request_details(request)))
+				request_logger(request).debug("VALID DATA")
 				treasure_id = req_data.get("treasure_id", None)
 
-				treasure_obj_row = Ecclesiastical_Treasures.objects.filter(uuid=treasure_id).first()
+				# Read fresh rather than through the access cache, the response must match its ETag
+				treasure_state = etags.treasure_state(treasure_id, payload["user_id"])
 
-				if not treasure_obj_row:
+				if not treasure_state:
 					raise ApplicationError(["resource_not_found", "ecclesiastical_treasure"])
 
+				etag = etags.make_etag(self.class_name, treasure_id, payload["user_id"], *treasure_state.version)
+
+				if etags.is_not_modified(request, etag):
+					request_logger(request).info("DB LOG",
+						extra={
+							"user_id": payload["user_id"],
+							"api": self.class_name,
+							"action": self.class_action,
+							"data": model_to_json(req_data),
+						}
+					)
+					request_logger(request).debug("NOT MODIFIED")
+					return etags.not_modified(etag)
+
 				result_obj = {}
 
 				lang_en_row = E56_Language.objects.filter(code="en").first()
@@ -3094,25 +2953,9 @@ class EcclesiasticalTreasuresFetch(GenericAPIView):
 							people_that_help_with_documentation_second = people_that_help_with_documentation_content[1]
 							people_that_help_with_documentation_third = people_that_help_with_documentation_content[2]
 
-				result_obj["user_email"] = ""
-				result_obj["user_organization"] = ""
-				result_obj["is_editable"] = False
-
-				current_user_obj = Users.objects.filter(id=payload["user_id"]).first()
-				current_user_id = current_user_obj.id
-				added_by_user_fk = treasure_obj_row.user_fk_id
-				user_row = Users.objects.filter(
-					id=added_by_user_fk
-				).first()
-
-				if user_row:
-					result_obj["user_email"] = user_row.email
-					result_obj["user_organization"] = user_row.organization
-
-					if current_user_id == added_by_user_fk or current_user_obj.role == RoleModel.ADMIN:
-						result_obj["is_editable"] = True
-					else:
-						result_obj["is_editable"] = False
+				result_obj["user_email"] = treasure_state.owner_email
+				result_obj["user_organization"] = treasure_state.owner_organization
+				result_obj["is_editable"] = treasure_state.can_edit
 
 				result_obj["e5_event_content"] = e5_event_content
 				result_obj["e11_modification_content"] = e11_modification_content
@@ -3150,13 +2993,12 @@ class EcclesiasticalTreasuresFetch(GenericAPIView):
 				result_obj["people_that_help_with_documentation_second"] = people_that_help_with_documentation_second
 				result_obj["people_that_help_with_documentation_third"] = people_that_help_with_documentation_third
 
-				log.info("{} DB LOG".format(request_details(request)),
+				request_logger(request).info("DB LOG",
 					extra={
 						"user_id": payload["user_id"],
 						"api": self.class_name,
 						"action": self.class_action,
 						"data": model_to_json(req_data),
-						"ip_address": get_ip_address(request),
 					}
 				)
 				status_code, message = get_code_and_response(["success"])
@@ -3166,16 +3008,15 @@ class EcclesiasticalTreasuresFetch(GenericAPIView):
 				response = {}
 				response[CONTENT] = content
 				response[STATUS_CODE] = status_code
-				log.debug("{} SUCCESS".format(request_details(request)))
+				request_logger(request).debug("SUCCESS")
 				data = response
 		except ApplicationError as e:
-			log.info("{} DB LOG (ApplicationError): {}".format(request_details(request), str(e)),
+			request_logger(request).info("DB LOG (ApplicationError): %s", e,
 				extra={
 					"api": self.class_name,
 					"action": self.class_action,
 					"data": model_to_json(req_data),
 					"error_data": str(e),
-					"ip_address": get_ip_address(request),
 					"is_error": True
 				}
 			)
@@ -3184,13 +3025,12 @@ class EcclesiasticalTreasuresFetch(GenericAPIView):
 			response[STATUS_CODE] = e.status_code
 			data = response
 		except Exception as e:
-			log.error("{} DB LOG (Internal error): {}".format(request_details(request), str(e)),
+			request_logger(request).error("DB LOG (Internal error): %s", e,
 				extra={
 					"api": self.class_name,
 					"action": self.class_action,
 					"data": model_to_json(req_data),
 					"error_data": str(e),
-					"ip_address": get_ip_address(request),
 					"is_error": True
 				}
 			)
@@ -3200,13 +3040,20 @@ class EcclesiasticalTreasuresFetch(GenericAPIView):
 			}
 			return Response(content, status=status_code)
 
+		if etag and data[STATUS_CODE] == status.HTTP_200_OK:
+			return etags.set_validators(Response(data[CONTENT], status=data[STATUS_CODE]), etag)
+
 		return Response(data[CONTENT], status=data[STATUS_CODE])
 
 
 class EcclesiasticalTreasuresList(GenericAPIView):
 	"""
 	get:
-	Returns the list of all ecclesiastical treasures based on the `search_keyword` and `exact_match` if given
+	Returns the list of all ecclesiastical treasures based on the `search_keyword` and `exact_match` if given.
+	With `mode=fulltext` the keyword is matched against the full text search documents and the results are ranked by relevance.
+	The treasures of the organization of the user come first. Results are paginated with `cursor` and `limit`,
+	or with the `draw`, `start`, `length`, `order` and `search` parameters of the DataTables server-side protocol if `draw` is given.
+	Responses carry an `ETag`, a request whose `If-None-Match` holds it is answered with 304 Not Modified.
 	"""
 	class_name = "EcclesiasticalTreasuresList"
 	class_action = "LIST"
@@ -3234,17 +3081,48 @@ class EcclesiasticalTreasuresList(GenericAPIView):
 		type=openapi.TYPE_BOOLEAN,
 		required=False,
 	)
+	mode = openapi.Parameter(
+		"mode",
+		in_=openapi.IN_QUERY,
+		description="How the search keyword is matched: `keyword` (default) for substrings of any field, `fulltext` for words of the full text search documents ranked by relevance",
+		type=openapi.TYPE_STRING,
+		enum=list(treasure_sync.SEARCH_MODES),
+		required=False,
+	)
+	cursor_param = openapi.Parameter(
+		"cursor",
+		in_=openapi.IN_QUERY,
+		description="The `next_cursor` of the previous page, with the same `search_keyword` and `mode`",
+		type=openapi.TYPE_STRING,
+		required=False,
+	)
+	limit_param = openapi.Parameter(
+		"limit",
+		in_=openapi.IN_QUERY,
+		description="The page size, up to {}".format(treasure_search.MAX_LIMIT),
+		type=openapi.TYPE_INTEGER,
+		required=False,
+	)
+	draw_param = openapi.Parameter(
+		"draw",
+		in_=openapi.IN_QUERY,
+		description="The DataTables draw counter, returned as is. Switches to the DataTables server-side protocol: " \
+			"`start`, `length`, `order[i][column]`, `order[i][dir]`, `columns[i][data]` and `search[value]` are read as sent by DataTables",
+		type=openapi.TYPE_INTEGER,
+		required=False,
+	)
 
 	@swagger_auto_schema(
 		responses=response_dict,
 		security=[],
-		manual_parameters=[search_keyword, exact_match,]
+		manual_parameters=[search_keyword, exact_match, mode, cursor_param, limit_param, draw_param,]
 	)
 	def get(self, request):
 		try:
-			log.debug("{} Received request".format(request_details(request)))
+			request_logger(request).debug("Received request")
 			response = {}
 			data = {}
+			etag = None
 			req_data = request.GET
 
 			is_valid, payload = at.authenticate(request)
@@ -3255,17 +3133,15 @@ class EcclesiasticalTreasuresList(GenericAPIView):
 			serialized_item = EcclesiasticalTreasuresListSerializer(data=req_data)
 
 			if not serialized_item.is_valid():
-				log.debug("{} VALIDATION ERROR: {}".format(
-						request_details(request),
-						serialized_item.formatted_error_response()
-					)
+				request_logger(request).debug("VALIDATION ERROR: %s",
+					serialized_item.formatted_error_response()
 				)
 				response = {}
 				response[CONTENT] = serialized_item.formatted_error_response(include_already_exists=False)
 				response[STATUS_CODE] = status.HTTP_400_BAD_REQUEST
 				data = response
 			else:
-				log.debug("{} VALID DATA".format(request_details(request)))
+				request_logger(request).debug("VALID DATA")
 				search_keyword = req_data.get("search_keyword", None)
 				exact_match = req_data.get("exact_match", False)
 
@@ -3274,365 +3150,79 @@ class EcclesiasticalTreasuresList(GenericAPIView):
 				else:
 					exact_match = False
 
-				list_results = []
-				filtered_uuids = []
-
-				if not search_keyword:
-					item_rows = Ecclesiastical_Treasures.objects.all()
-
-					for item in item_rows:
-						filtered_uuids.append(item.uuid)
-				else:
-					########################################################
-					# Filter based on `search_keyword` and `exact_match` in all models - START
-
-					# Filter based on treasure `uuid`
-					treasure_by_uuid_rows = Ecclesiastical_Treasures.objects.filter(Q(**{"uuid": search_keyword}) if exact_match else Q(**{f"{'uuid'}__icontains": search_keyword}))
-
-					for item in treasure_by_uuid_rows:
-						filtered_uuids.append(item.uuid)
-
-					# Filter based on user's `email`
-					user_email_rows = Users.objects.filter(Q(**{"email": search_keyword}) if exact_match else Q(**{f"{'email'}__icontains": search_keyword}))
-
-					for item in user_email_rows:
-						user_id = item.id
-						treasure_by_email_rows = Ecclesiastical_Treasures.objects.filter(
-							user_fk_id=user_id
-						)
-
-						for treasure_item in treasure_by_email_rows:
-							filtered_uuids.append(treasure_item.uuid)
-
-					# Filter based on user's `name`
-					user_name_rows = Users.objects.filter(Q(**{"name": search_keyword}) if exact_match else Q(**{f"{'name'}__icontains": search_keyword}))
-
-					for item in user_name_rows:
-						user_id = item.id
-						treasure_by_name_rows = Ecclesiastical_Treasures.objects.filter(
-							user_fk_id=user_id
-						)
-
-						for treasure_item in treasure_by_name_rows:
-							filtered_uuids.append(treasure_item.uuid)
-
-					# Filter based on user's `surname`
-					user_surname_rows = Users.objects.filter(Q(**{"surname": search_keyword}) if exact_match else Q(**{f"{'surname'}__icontains": search_keyword}))
-
-					for item in user_surname_rows:
-						user_id = item.id
-						treasure_by_surname_rows = Ecclesiastical_Treasures.objects.filter(
-							user_fk_id=user_id
-						)
-
-						for treasure_item in treasure_by_surname_rows:
-							filtered_uuids.append(treasure_item.uuid)
-
-					# Filter based on user's `telephone`
-					user_telephone_rows = Users.objects.filter(Q(**{"telephone": search_keyword}) if exact_match else Q(**{f"{'telephone'}__icontains": search_keyword}))
-
-					for item in user_telephone_rows:
-						user_id = item.id
-						treasure_by_telephone_rows = Ecclesiastical_Treasures.objects.filter(
-							user_fk_id=user_id
-						)
-
-						for treasure_item in treasure_by_telephone_rows:
-							filtered_uuids.append(treasure_item.uuid)
+				validated_data = serialized_item.validated_data
+				catalogue_state = etags.catalogue_state(payload["user_id"])
 
-					# Filter based on user's `organization`
-					user_organization_rows = Users.objects.filter(Q(**{"organization": search_keyword}) if exact_match else Q(**{f"{'organization'}__icontains": search_keyword}))
+				if catalogue_state:
+					etag = etags.make_etag(
+						self.class_name,
+						payload["user_id"],
+						payload["organization"],
+						*catalogue_state,
+						*etags.query_parts(request)
+					)
 
-					for item in user_organization_rows:
-						user_id = item.id
-						treasure_by_organization_rows = Ecclesiastical_Treasures.objects.filter(
-							user_fk_id=user_id
+					if etags.is_not_modified(request, etag):
+						request_logger(request).info("DB LOG",
+							extra={
+								"user_id": payload["user_id"],
+								"api": self.class_name,
+								"action": self.class_action,
+								"data": model_to_json(req_data),
+							}
 						)
+						request_logger(request).debug("NOT MODIFIED")
+						return etags.not_modified(etag)
 
-						for treasure_item in treasure_by_organization_rows:
-							filtered_uuids.append(treasure_item.uuid)
-
-					# Filter based on `E5_Event`
-					e5_event_rows = E5_Event.objects.filter(Q(**{"content": search_keyword}) if exact_match else Q(**{f"{'content'}__icontains": search_keyword}))
-
-					for item in e5_event_rows:
-						filtered_uuids.append(item.treasure_fk_id)
-
-					# Filter based on `E11_Modification`
-					e11_modification_rows = E11_Modification.objects.filter(Q(**{"content": search_keyword}) if exact_match else Q(**{f"{'content'}__icontains": search_keyword}))
-
-					for item in e11_modification_rows:
-						filtered_uuids.append(item.treasure_fk_id)
-
-					# Filter based on `E14_Condition_Assessment`
-					e14_condition_assessment_rows = E14_Condition_Assessment.objects.filter(Q(**{"content": search_keyword}) if exact_match else Q(**{f"{'content'}__icontains": search_keyword}))
-
-					for item in e14_condition_assessment_rows:
-						filtered_uuids.append(item.treasure_fk_id)
-
-					# Filter based on `E34_Inscription`
-					e34_inscription_rows = E34_Inscription.objects.filter(Q(**{"content": search_keyword}) if exact_match else Q(**{f"{'content'}__icontains": search_keyword}))
-
-					for item in e34_inscription_rows:
-						filtered_uuids.append(item.treasure_fk_id)
-
-					# Filter based on `E35_Title`
-					e35_title_rows = E35_Title.objects.filter(Q(**{"content": search_keyword}) if exact_match else Q(**{f"{'content'}__icontains": search_keyword}))
-
-					for item in e35_title_rows:
-						filtered_uuids.append(item.treasure_fk_id)
-
-					# Filter based on `E41_Appellation`
-					e41_appellation_rows = E41_Appellation.objects.filter(Q(**{"content": search_keyword}) if exact_match else Q(**{f"{'content'}__icontains": search_keyword}))
-
-					for item in e41_appellation_rows:
-						filtered_uuids.append(item.treasure_fk_id)
-
-					# Filter based on `E42_Identifier`
-					e42_identifier_rows = E42_Identifier.objects.filter(Q(**{"code": search_keyword}) if exact_match else Q(**{f"{'code'}__icontains": search_keyword}))
-
-					for item in e42_identifier_rows:
-						filtered_uuids.append(item.treasure_fk_id)
-
-					# Filter based on `E52_Time_Span`
-					e52_time_span_rows = E52_Time_Span.objects.filter(Q(**{"duration": search_keyword}) if exact_match else Q(**{f"{'duration'}__icontains": search_keyword}))
-
-					for item in e52_time_span_rows:
-						filtered_uuids.append(item.treasure_fk_id)
-
-					# Filter based on `E53_Place`
-					e53_place_rows = E53_Place.objects.filter(Q(**{"content": search_keyword}) if exact_match else Q(**{f"{'content'}__icontains": search_keyword}))
-
-					for item in e53_place_rows:
-						filtered_uuids.append(item.treasure_fk_id)
-
-					# Filter based on `E54_Dimension`
-					e54_dimension_rows = E54_Dimension.objects.filter(Q(**{"content": search_keyword}) if exact_match else Q(**{f"{'content'}__icontains": search_keyword}))
-
-					for item in e54_dimension_rows:
-						filtered_uuids.append(item.treasure_fk_id)
-
-					# Filter based on `E55_Type`
-					e55_type_rows = E55_Type.objects.filter(Q(**{"kind": search_keyword}) if exact_match else Q(**{f"{'kind'}__icontains": search_keyword}))
-
-					for item in e55_type_rows:
-						filtered_uuids.append(item.treasure_fk_id)
-
-					# Filter based on `E57_Material`
-					e57_material_rows = E57_Material.objects.filter(Q(**{"content": search_keyword}) if exact_match else Q(**{f"{'content'}__icontains": search_keyword}))
-
-					for item in e57_material_rows:
-						filtered_uuids.append(item.treasure_fk_id)
-
-					# Filter based on `E63_Beginning_of_Existence`
-					e63_beginning_of_existence_rows = E63_Beginning_of_Existence.objects.filter(Q(**{"content": search_keyword}) if exact_match else Q(**{f"{'content'}__icontains": search_keyword}))
-
-					for item in e63_beginning_of_existence_rows:
-						filtered_uuids.append(item.treasure_fk_id)
-
-					# Filter based on `E71_Human_Made_Thing`
-					e71_human_made_thing_rows = E71_Human_Made_Thing.objects.filter(Q(**{"creator": search_keyword}) if exact_match else Q(**{f"{'creator'}__icontains": search_keyword}))
-
-					for item in e71_human_made_thing_rows:
-						filtered_uuids.append(item.treasure_fk_id)
-
-					# Filter based on `E73_Information_Object`
-					e73_information_object_rows = E73_Information_Object.objects.filter(Q(**{"content": search_keyword}) if exact_match else Q(**{f"{'content'}__icontains": search_keyword}))
-
-					for item in e73_information_object_rows:
-						filtered_uuids.append(item.treasure_fk_id)
-
-					# Filter based on `E74_Group`
-					e74_group_rows = E74_Group.objects.filter(Q(**{"content": search_keyword}) if exact_match else Q(**{f"{'content'}__icontains": search_keyword}))
-
-					for item in e74_group_rows:
-						filtered_uuids.append(item.treasure_fk_id)
-
-					# Filter based on `E78_Curated_Holding`
-					e78_curated_holding_rows = E78_Curated_Holding.objects.filter(Q(**{"content": search_keyword}) if exact_match else Q(**{f"{'content'}__icontains": search_keyword}))
-
-					for item in e78_curated_holding_rows:
-						filtered_uuids.append(item.treasure_fk_id)
-
-					# Filter based on `Data_Administration`
-					data_admin_rows = Data_Administration.objects.filter(Q(**{"content": search_keyword}) if exact_match else Q(**{f"{'content'}__icontains": search_keyword}))
-
-					for item in data_admin_rows:
-						filtered_uuids.append(item.treasure_fk_id)
-
-					# Filter based on short version of `Description`
-					description_short_version_rows = Description.objects.filter(Q(**{"short_version": search_keyword}) if exact_match else Q(**{f"{'short_version'}__icontains": search_keyword}))
-
-					for item in description_short_version_rows:
-						filtered_uuids.append(item.treasure_fk_id)
-
-					# Filter based on extended version of `Description`
-					description_extended_version_rows = Description.objects.filter(Q(**{"extended_version": search_keyword}) if exact_match else Q(**{f"{'extended_version'}__icontains": search_keyword}))
-
-					for item in description_extended_version_rows:
-						filtered_uuids.append(item.treasure_fk_id)
-
-					# Filter based on documentation of `Pieces_of_Ecclesiastical_Treasure`
-					pieces_of_treasure_documentation_rows = Pieces_of_Ecclesiastical_Treasure.objects.filter(Q(**{"documentation": search_keyword}) if exact_match else Q(**{f"{'documentation'}__icontains": search_keyword}))
-
-					for item in pieces_of_treasure_documentation_rows:
-						filtered_uuids.append(item.treasure_fk_id)
-
-					# Filter based on bibliography of `Pieces_of_Ecclesiastical_Treasure`
-					pieces_of_treasure_bibliography_rows = Pieces_of_Ecclesiastical_Treasure.objects.filter(Q(**{"bibliography": search_keyword}) if exact_match else Q(**{f"{'bibliography'}__icontains": search_keyword}))
-
-					for item in pieces_of_treasure_bibliography_rows:
-						filtered_uuids.append(item.treasure_fk_id)
-
-					# Filter based on documentation of `Previous_Documentation`
-					prev_documentation_rows = Previous_Documentation.objects.filter(Q(**{"documentation": search_keyword}) if exact_match else Q(**{f"{'documentation'}__icontains": search_keyword}))
-
-					for item in prev_documentation_rows:
-						filtered_uuids.append(item.treasure_fk_id)
-
-					# Filter based on bibliography of `Previous_Documentation`
-					prev_documentation_bibliography_rows = Previous_Documentation.objects.filter(Q(**{"bibliography": search_keyword}) if exact_match else Q(**{f"{'bibliography'}__icontains": search_keyword}))
-
-					for item in prev_documentation_bibliography_rows:
-						filtered_uuids.append(item.treasure_fk_id)
-
-					# Filter based on `search_keyword` and `exact_match` in all models - END
-					########################################################
-
-				lang_en_row = E56_Language.objects.filter(code="en").first()
-				lang_en_fk_id = lang_en_row.id
-
-				filtered_uuids = list(set(filtered_uuids))
-
-				current_user_obj = Users.objects.filter(id=payload["user_id"]).first()
-				current_user_id = current_user_obj.id
-
-				for item in filtered_uuids:
-					current_item = {}
-					current_item["uuid"] = item
-					current_item["user_email"] = ""
-					current_item["user_organization"] = ""
-					current_item["is_editable"] = False
-
-					treasure_row = Ecclesiastical_Treasures.objects.filter(uuid=item).first()
-
-					if treasure_row:
-						added_by_user_fk = treasure_row.user_fk_id
-						user_row = Users.objects.filter(
-							id=added_by_user_fk
-						).first()
-
-						if user_row:
-							current_item["user_email"] = user_row.email
-							current_item["user_organization"] = user_row.organization
-
-							if current_user_id == added_by_user_fk or current_user_obj.role == RoleModel.ADMIN:
-								current_item["is_editable"] = True
-							else:
-								current_item["is_editable"] = False
-
-					title_row = E35_Title.objects.filter(
-						treasure_fk_id=item,
-						language_fk_id=lang_en_fk_id,
-					).first()
-
-					current_item["title_en"] = title_row.content
-
-					appellation_row = E41_Appellation.objects.filter(
-						treasure_fk_id=item,
-						language_fk_id=lang_en_fk_id,
-					).first()
-
-					current_item["appellation_en"] = appellation_row.content
-
-					# Set a default photo for the treasure by checking the following order:
-					# - General photos
-					# - Content photos
-					# - Conservation photos
-					default_img_src = None
+				content = {}
 
-					# Check for general photos
-					photos_rows = MediaFile.objects.filter(
-						treasure_fk_id = item,
-						media_type = "photo",
-						is_file_synced = True
-					).order_by("ts_synced")
-
-					if photos_rows:
-						file_ext_split = photos_rows[0].file_ext.split(".")
-
-						if file_ext_split[1] in settings.MEDIA_FORMAT_2D:
-							default_img_src = "/backend" + DIR_MEDIA + DIR_MEDIA_SYNCED + \
-										str(photos_rows[0].dir_path) + "/" + str(photos_rows[0].uuid) + "_resized" + str(photos_rows[0].file_ext)
-
-					# Check for content photos
-					if not default_img_src:
-						photos_rows = MediaFile.objects.filter(
-							treasure_fk_id = item,
-							media_type = "content",
-							is_file_synced = True
-						).order_by("ts_synced")
-
-						if photos_rows:
-							file_ext_split = photos_rows[0].file_ext.split(".")
-
-							if file_ext_split[1] in settings.MEDIA_FORMAT_2D:
-								default_img_src = "/backend" + DIR_MEDIA + DIR_MEDIA_SYNCED + \
-											str(photos_rows[0].dir_path) + "/" + str(photos_rows[0].uuid) + "_resized" + str(photos_rows[0].file_ext)
-
-					# Check for conservation photos
-					if not default_img_src:
-						photos_rows = MediaFile.objects.filter(
-							treasure_fk_id = item,
-							media_type = "conservation",
-							is_file_synced = True
-						).order_by("ts_synced")
-
-						if photos_rows:
-							file_ext_split = photos_rows[0].file_ext.split(".")
-
-							if file_ext_split[1] in settings.MEDIA_FORMAT_2D:
-								default_img_src = "/backend" + DIR_MEDIA + DIR_MEDIA_SYNCED + \
-											str(photos_rows[0].dir_path) + "/" + str(photos_rows[0].uuid) + "_resized" + str(photos_rows[0].file_ext)
-
-					# Finally, use a default image if none was found neither in general photos nor in conservation photos
-					if not default_img_src:
-						default_img_src = "/static/backend/assets/media/media_default.png"
-
-					current_item["default_img_src"] = default_img_src
-
-					if current_item["user_organization"] == payload["organization"]:
-						list_results.insert(0, current_item)
-					else:
-						list_results.append(current_item)
+				if "datatables" in validated_data:
+					list_results, records_total, records_filtered = treasure_search.list_treasures_datatables(
+						request,
+						payload,
+						search_keyword,
+						exact_match,
+						validated_data["mode"],
+						validated_data["datatables"],
+					)
+					content[DRAW] = validated_data["draw"]
+					content[RECORDS_TOTAL] = records_total
+					content[RECORDS_FILTERED] = records_filtered
+				else:
+					list_results, content[NEXT_CURSOR] = treasure_search.list_treasures(
+						request,
+						payload,
+						search_keyword,
+						exact_match,
+						validated_data["mode"],
+						validated_data.get("cursor"),
+						validated_data["limit"],
+					)
 
-				log.info("{} DB LOG".format(request_details(request)),
+				request_logger(request).info("DB LOG",
 					extra={
 						"user_id": payload["user_id"],
 						"api": self.class_name,
 						"action": self.class_action,
 						"data": model_to_json(req_data),
-						"ip_address": get_ip_address(request),
 					}
 				)
 
 				status_code, message = get_code_and_response(["success"])
-				content = {}
 				content[MESSAGE] = message
 				content[RESOURCE_ARRAY] = list_results
 				response = {}
 				response[CONTENT] = content
 				response[STATUS_CODE] = status_code
-				log.debug("{} SUCCESS".format(request_details(request)))
+				request_logger(request).debug("SUCCESS")
 				data = response
 		except ApplicationError as e:
-			log.info("{} DB LOG (ApplicationError): {}".format(request_details(request), str(e)),
+			request_logger(request).info("DB LOG (ApplicationError): %s", e,
 				extra={
 					"api": self.class_name,
 					"action": self.class_action,
 					"data": model_to_json(req_data),
 					"error_data": str(e),
-					"ip_address": get_ip_address(request),
 					"is_error": True
 				}
 			)
@@ -3641,13 +3231,12 @@ class EcclesiasticalTreasuresList(GenericAPIView):
 			response[STATUS_CODE] = e.status_code
 			data = response
 		except Exception as e:
-			log.error("{} DB LOG (Internal error): {}".format(request_details(request), str(e)),
+			request_logger(request).error("DB LOG (Internal error): %s", e,
 				extra={
 					"api": self.class_name,
 					"action": self.class_action,
 					"data": model_to_json(req_data),
 					"error_data": str(e),
-					"ip_address": get_ip_address(request),
 					"is_error": True
 				}
 			)
@@ -3657,6 +3246,9 @@ class EcclesiasticalTreasuresList(GenericAPIView):
 			}
 			return Response(content, status=status_code)
 
+		if etag and data[STATUS_CODE] == status.HTTP_200_OK:
+			return etags.set_validators(Response(data[CONTENT], status=data[STATUS_CODE]), etag)
+
 		return Response(data[CONTENT], status=data[STATUS_CODE])
 
 
@@ -3711,41 +3303,30 @@ class EcclesiasticalTreasuresMediaDelete(DestroyAPIView):
 			if not is_valid:
 				raise ApplicationError(["unauthorized"])
 
-			log.debug("{} START".format(request_details(request)))
+			request_logger(request).debug("START")
 			serialized_item = EcclesiasticalTreasuresMediaDeleteSerializer(data=req_data)
 
 			if not serialized_item.is_valid():
-				log.debug("{} VALIDATION ERROR: {}".format(
-						request_details(request),
-						serialized_item.formatted_error_response()
-					)
+				request_logger(request).debug("VALIDATION ERROR: %s",
+					serialized_item.formatted_error_response()
 				)
 				response = {}
 				response[CONTENT] = serialized_item.formatted_error_response(include_already_exists=False)
 				response[STATUS_CODE] = status.HTTP_400_BAD_REQUEST
 				data = response
 			else:
-				log.debug("{} VALID DATA".format(request_details(request)))
+				request_logger(request).debug("VALID DATA")
 				treasure_uuid = req_data.get("treasure_id")
 				media_uuid = req_data.get("media_id")
 				cleanup_dir = ""
 
-				treasure_row = Ecclesiastical_Treasures.objects.filter(uuid=treasure_uuid).first()
+				treasure_access = get_treasure_access(request, treasure_uuid, for_update=True)
 
-				if not treasure_row:
+				if not treasure_access:
 					raise ApplicationError(["resource_not_found", "ecclesiastical_treasure"])
 
-				current_user_obj = Users.objects.filter(id=payload["user_id"]).first()
-				current_user_id = current_user_obj.id
-
-				added_by_user_fk = treasure_row.user_fk_id
-				user_row = Users.objects.filter(
-					id=added_by_user_fk
-				).first()
-
-				if user_row:
-					if current_user_id != added_by_user_fk and current_user_obj.role != RoleModel.ADMIN:
-						raise ApplicationError(["resource_not_allowed"])
+				if not treasure_access.can_edit:
+					raise ApplicationError(["resource_not_allowed"])
 
 				with transaction.atomic():
 					media_row = MediaFile.objects.filter(
@@ -3760,18 +3341,19 @@ class EcclesiasticalTreasuresMediaDelete(DestroyAPIView):
 					else:
 						raise ApplicationError(["resource_not_found", "media_file"])	
 
+					treasure_sync.sync_treasure(treasure_uuid, media_changed=True)
+
 				try:
 					shutil.rmtree(cleanup_dir)
 				except Exception as e:
-					log.debug("{} Failed to delete dir path of media. Error: {}".format(request_details(request), str(e)))
+					request_logger(request).debug("Failed to delete dir path of media. Error: %s", e)
 
-				log.info("{} DB LOG".format(request_details(request)),
+				request_logger(request).info("DB LOG",
 					extra={
 						"user_id": payload["user_id"],
 						"api": self.class_name,
 						"action": self.class_action,
 						"data": model_to_json(req_data),
-						"ip_address": get_ip_address(request),
 					}
 				)
 				status_code, message = get_code_and_response(["success"])
@@ -3780,16 +3362,15 @@ class EcclesiasticalTreasuresMediaDelete(DestroyAPIView):
 				response = {}
 				response[CONTENT] = content
 				response[STATUS_CODE] = status_code
-				log.debug("{} SUCCESS".format(request_details(request)))
+				request_logger(request).debug("SUCCESS")
 				data = response
 		except ApplicationError as e:
-			log.info("{} DB LOG (ApplicationError): {}".format(request_details(request), str(e)),
+			request_logger(request).info("DB LOG (ApplicationError): %s", e,
 				extra={
 					"api": self.class_name,
 					"action": self.class_action,
 					"data": model_to_json(req_data),
 					"error_data": str(e),
-					"ip_address": get_ip_address(request),
 					"is_error": True
 				}
 			)
@@ -3798,13 +3379,12 @@ class EcclesiasticalTreasuresMediaDelete(DestroyAPIView):
 			response[STATUS_CODE] = e.status_code
 			data = response
 		except Exception as e:
-			log.error("{} DB LOG (Internal error): {}".format(request_details(request), str(e)),
+			request_logger(request).error("DB LOG (Internal error): %s", e,
 				extra={
 					"api": self.class_name,
 					"action": self.class_action,
 					"data": model_to_json(req_data),
 					"error_data": str(e),
-					"ip_address": get_ip_address(request),
 					"is_error": True
 				}
 			)
@@ -3821,6 +3401,7 @@ class EcclesiasticalTreasuresMediaList(GenericAPIView):
 	"""
 	get:
 	Returns the list of all media for the given ecclesiastical treasure based on the `treasure_id`
+	Responses carry an `ETag`, a request whose `If-None-Match` holds it is answered with 304 Not Modified.
 	"""
 	class_name = "EcclesiasticalTreasuresMediaList"
 	class_action = "LIST"
@@ -3850,9 +3431,10 @@ class EcclesiasticalTreasuresMediaList(GenericAPIView):
 	)
 	def get(self, request):
 		try:
-			log.debug("{} Received request".format(request_details(request)))
+			request_logger(request).debug("Received request")
 			response = {}
 			data = {}
+			etag = None
 			req_data = request.GET
 
 			is_valid, payload = at.authenticate(request)
@@ -3863,38 +3445,38 @@ class EcclesiasticalTreasuresMediaList(GenericAPIView):
 			serialized_item = EcclesiasticalTreasuresMediaListSerializer(data=req_data)
 
 			if not serialized_item.is_valid():
-				log.debug("{} VALIDATION ERROR: {}".format(
-						request_details(request),
-						serialized_item.formatted_error_response()
-					)
+				request_logger(request).debug("VALIDATION ERROR: %s",
+					serialized_item.formatted_error_response()
 				)
 				response = {}
 				response[CONTENT] = serialized_item.formatted_error_response(include_already_exists=False)
 				response[STATUS_CODE] = status.HTTP_400_BAD_REQUEST
 				data = response
 			else:
-				log.debug("{} VALID DATA".format(request_details(request)))
+				request_logger(request).debug("VALID DATA")
 				treasure_id = req_data.get("treasure_id", None)
 
-				treasure_obj_row = Ecclesiastical_Treasures.objects.filter(uuid=treasure_id).first()
+				# Read fresh rather than through the access cache, the response must match its ETag
+				treasure_state = etags.treasure_state(treasure_id, payload["user_id"])
 
-				if not treasure_obj_row:
+				if not treasure_state:
 					raise ApplicationError(["resource_not_found", "ecclesiastical_treasure"])
 
-				current_user_obj = Users.objects.filter(id=payload["user_id"]).first()
-				current_user_id = current_user_obj.id
-				added_by_user_fk = treasure_obj_row.user_fk_id
-				is_editable = False
+				etag = etags.make_etag(self.class_name, treasure_id, payload["user_id"], *treasure_state.version)
 
-				user_row = Users.objects.filter(
-					id=added_by_user_fk
-				).first()
+				if etags.is_not_modified(request, etag):
+					request_logger(request).info("DB LOG",
+						extra={
+							"user_id": payload["user_id"],
+							"api": self.class_name,
+							"action": self.class_action,
+							"data": model_to_json(req_data),
+						}
+					)
+					request_logger(request).debug("NOT MODIFIED")
+					return etags.not_modified(etag)
 
-				if user_row:
-					if current_user_id == added_by_user_fk or current_user_obj.role == RoleModel.ADMIN:
-						is_editable = True
-					else:
-						is_editable = False
+				is_editable = treasure_state.can_edit
 
 				list_results = []
 
@@ -4005,13 +3587,12 @@ class EcclesiasticalTreasuresMediaList(GenericAPIView):
 						}
 						list_results.append(current_item)
 
-				log.info("{} DB LOG".format(request_details(request)),
+				request_logger(request).info("DB LOG",
 					extra={
 						"user_id": payload["user_id"],
 						"api": self.class_name,
 						"action": self.class_action,
 						"data": model_to_json(req_data),
-						"ip_address": get_ip_address(request),
 					}
 				)
 				status_code, message = get_code_and_response(["success"])
@@ -4021,16 +3602,15 @@ class EcclesiasticalTreasuresMediaList(GenericAPIView):
 				response = {}
 				response[CONTENT] = content
 				response[STATUS_CODE] = status_code
-				log.debug("{} SUCCESS".format(request_details(request)))
+				request_logger(request).debug("SUCCESS")
 				data = response
 		except ApplicationError as e:
-			log.info("{} DB LOG (ApplicationError): {}".format(request_details(request), str(e)),
+			request_logger(request).info("DB LOG (ApplicationError): %s", e,
 				extra={
 					"api": self.class_name,
 					"action": self.class_action,
 					"data": model_to_json(req_data),
 					"error_data": str(e),
-					"ip_address": get_ip_address(request),
 					"is_error": True
 				}
 			)
@@ -4039,13 +3619,12 @@ class EcclesiasticalTreasuresMediaList(GenericAPIView):
 			response[STATUS_CODE] = e.status_code
 			data = response
 		except Exception as e:
-			log.error("{} DB LOG (Internal error): {}".format(request_details(request), str(e)),
+			request_logger(request).error("DB LOG (Internal error): %s", e,
 				extra={
 					"api": self.class_name,
 					"action": self.class_action,
 					"data": model_to_json(req_data),
 					"error_data": str(e),
-					"ip_address": get_ip_address(request),
 					"is_error": True
 				}
 			)
@@ -4055,6 +3634,9 @@ class EcclesiasticalTreasuresMediaList(GenericAPIView):
 			}
 			return Response(content, status=status_code)
 
+		if etag and data[STATUS_CODE] == status.HTTP_200_OK:
+			return etags.set_validators(Response(data[CONTENT], status=data[STATUS_CODE]), etag)
+
 		return Response(data[CONTENT], status=data[STATUS_CODE])
 
 
@@ -4084,12 +3666,12 @@ class EcclesiasticalTreasuresMediaUpdate(GenericAPIView):
 		security=[]
 	)
 	def post(self, request, *args, **kwargs):
-		log.debug("{} Received request". format(request_details(request)))
+		request_logger(request).debug("Received request")
 		data = {}
 		response = {}
 
 		try:
-			log.debug("{} START".format(request_details(request)))
+			request_logger(request).debug("START")
 			req_data = request.data
 
 			is_valid, payload = at.authenticate(request)
@@ -4100,10 +3682,8 @@ class EcclesiasticalTreasuresMediaUpdate(GenericAPIView):
 			serialized_item = EcclesiasticalTreasuresMediaUpdateSerializer(data=req_data)
 
 			if not serialized_item.is_valid():
-				log.debug("{} VALIDATION ERROR: {}".format(
-						request_details(request),
-						serialized_item.formatted_error_response()
-					)
+				request_logger(request).debug("VALIDATION ERROR: %s",
+					serialized_item.formatted_error_response()
 				)
 				response = {}
 				response[CONTENT] = serialized_item.formatted_error_response(include_already_exists=True)
@@ -4114,22 +3694,13 @@ class EcclesiasticalTreasuresMediaUpdate(GenericAPIView):
 					ts_now = now()
 
 					treasure_uuid = req_data.get("treasure_id")
-					treasure_row = Ecclesiastical_Treasures.objects.filter(uuid=treasure_uuid).first()
+					treasure_access = get_treasure_access(request, treasure_uuid, for_update=True)
 
-					if not treasure_row:
+					if not treasure_access:
 						raise ApplicationError(["resource_not_found", "ecclesiastical_treasure"])
 
-					current_user_obj = Users.objects.filter(id=payload["user_id"]).first()
-					current_user_id = current_user_obj.id
-
-					added_by_user_fk = treasure_row.user_fk_id
-					user_row = Users.objects.filter(
-						id=added_by_user_fk
-					).first()
-
-					if user_row:
-						if current_user_id != added_by_user_fk and current_user_obj.role != RoleModel.ADMIN:
-							raise ApplicationError(["resource_not_allowed"])
+					if not treasure_access.can_edit:
+						raise ApplicationError(["resource_not_allowed"])
 
 					old_media_uuid = req_data.get("old_media_id")
 					new_media_uuid = req_data.get("new_media_id")
@@ -4177,21 +3748,22 @@ class EcclesiasticalTreasuresMediaUpdate(GenericAPIView):
 							old_media_row.file_ext = new_media_row.file_ext
 							old_media_row.ts_synced = now()
 							old_media_row.save()
-							log.debug("{} Updated media file extension".format(request_details(request)))
+							request_logger(request).debug("Updated media file extension")
 
 						new_media_row.delete()
-						log.debug("{} Updated old media file with new media file".format(request_details(request)))
+						request_logger(request).debug("Updated old media file with new media file")
 					except Exception as e:
-						log.debug("{} Failed to update old media file with new media file. Reason: {}".format(request_details(request), str(e)))
+						request_logger(request).debug("Failed to update old media file with new media file. Reason: %s", e)
 						raise
 
-				log.info("{} DB LOG".format(request_details(request)),
+					treasure_sync.sync_treasure(treasure_uuid, media_changed=True)
+
+				request_logger(request).info("DB LOG",
 					extra={
 						"user_id": payload["user_id"],
 						"api": self.class_name,
 						"action": self.class_action,
 						"data": model_to_json(req_data),
-						"ip_address": get_ip_address(request),
 					}
 				)
 				status_code, message = get_code_and_response(["success"])
@@ -4201,16 +3773,15 @@ class EcclesiasticalTreasuresMediaUpdate(GenericAPIView):
 				response = {}
 				response[CONTENT] = content
 				response[STATUS_CODE] = status_code
-				log.debug("{} SUCCESS".format(request_details(request)))
+				request_logger(request).debug("SUCCESS")
 				data = response
 		except ApplicationError as e:
-			log.info("{} DB LOG (ApplicationError): {}".format(request_details(request), str(e)),
+			request_logger(request).info("DB LOG (ApplicationError): %s", e,
 				extra={
 					"api": self.class_name,
 					"action": self.class_action,
 					"data": model_to_json(req_data),
 					"error_data": str(e),
-					"ip_address": get_ip_address(request),
 					"is_error": True
 				}
 			)
@@ -4219,13 +3790,12 @@ class EcclesiasticalTreasuresMediaUpdate(GenericAPIView):
 			response[STATUS_CODE] = e.status_code
 			data = response
 		except Exception as e:
-			log.error("{} DB LOG (Internal error): {}".format(request_details(request), str(e)),
+			request_logger(request).error("DB LOG (Internal error): %s", e,
 				extra={
 					"api": self.class_name,
 					"action": self.class_action,
 					"data": model_to_json(req_data),
 					"error_data": str(e),
-					"ip_address": get_ip_address(request),
 					"is_error": True
 				}
 			)
@@ -4264,12 +3834,12 @@ class EcclesiasticalTreasuresMediaUploadNew(GenericAPIView):
 		security=[]
 	)
 	def post(self, request, *args, **kwargs):
-		log.debug("{} Received request". format(request_details(request)))
+		request_logger(request).debug("Received request")
 		data = {}
 		response = {}
 
 		try:
-			log.debug("{} START".format(request_details(request)))
+			request_logger(request).debug("START")
 			req_data = request.data
 
 			is_valid, payload = at.authenticate(request)
@@ -4280,10 +3850,8 @@ class EcclesiasticalTreasuresMediaUploadNew(GenericAPIView):
 			serialized_item = EcclesiasticalTreasuresMediaUploadNewSerializer(data=req_data)
 
 			if not serialized_item.is_valid():
-				log.debug("{} VALIDATION ERROR: {}".format(
-						request_details(request),
-						serialized_item.formatted_error_response()
-					)
+				request_logger(request).debug("VALIDATION ERROR: %s",
+					serialized_item.formatted_error_response()
 				)
 				response = {}
 				response[CONTENT] = serialized_item.formatted_error_response(include_already_exists=True)
@@ -4295,22 +3863,13 @@ class EcclesiasticalTreasuresMediaUploadNew(GenericAPIView):
 					cleanup_dirs_list = []
 
 					treasure_id = req_data.get("treasure_id", None)
-					treasure_row = Ecclesiastical_Treasures.objects.filter(uuid=treasure_id).first()
+					treasure_access = get_treasure_access(request, treasure_id, for_update=True)
 
-					if not treasure_row:
+					if not treasure_access:
 						raise ApplicationError(["resource_not_found", "ecclesiastical_treasure"])
 
-					current_user_obj = Users.objects.filter(id=payload["user_id"]).first()
-					current_user_id = current_user_obj.id
-
-					added_by_user_fk = treasure_row.user_fk_id
-					user_row = Users.objects.filter(
-						id=added_by_user_fk
-					).first()
-
-					if user_row:
-						if current_user_id != added_by_user_fk and current_user_obj.role != RoleModel.ADMIN:
-							raise ApplicationError(["resource_not_allowed"])
+					if not treasure_access.can_edit:
+						raise ApplicationError(["resource_not_allowed"])
 
 					media_type_id = req_data.get("media_type_id", None)
 					media_type = req_data.get("type", None)
@@ -4323,7 +3882,7 @@ class EcclesiasticalTreasuresMediaUploadNew(GenericAPIView):
 					if not media_rows:
 						raise ApplicationError(["resource_not_found", "media_file"])
 
-					log.debug("{} Will handle uploaded media".format(request_details(request)))
+					request_logger(request).debug("Will handle uploaded media")
 
 					for row_item in media_rows:
 						file_to_move = DIR_CODE_MEDIA + DIR_MEDIA_TEMP + \
@@ -4362,20 +3921,21 @@ class EcclesiasticalTreasuresMediaUploadNew(GenericAPIView):
 								ts_synced = now(),
 							)
 
+					treasure_sync.sync_treasure(treasure_id, media_changed=True)
+
 					for dir_item in cleanup_dirs_list:
 						try:
 							shutil.rmtree(dir_item)
-							log.debug("{} Media deleted: {}".format(request_details(request), dir_item))
+							request_logger(request).debug("Media deleted: %s", dir_item)
 						except Exception as e:
-							log.debug("{} Media cannot be deleted. Error: {}".format(request_details(request), str(e)))
+							request_logger(request).debug("Media cannot be deleted. Error: %s", e)
 
-				log.info("{} DB LOG".format(request_details(request)),
+				request_logger(request).info("DB LOG",
 					extra={
 						"user_id": payload["user_id"],
 						"api": self.class_name,
 						"action": self.class_action,
 						"data": model_to_json(req_data),
-						"ip_address": get_ip_address(request),
 					}
 				)
 				status_code, message = get_code_and_response(["success"])
@@ -4385,16 +3945,15 @@ class EcclesiasticalTreasuresMediaUploadNew(GenericAPIView):
 				response = {}
 				response[CONTENT] = content
 				response[STATUS_CODE] = status_code
-				log.debug("{} SUCCESS".format(request_details(request)))
+				request_logger(request).debug("SUCCESS")
 				data = response
 		except ApplicationError as e:
-			log.info("{} DB LOG (ApplicationError): {}".format(request_details(request), str(e)),
+			request_logger(request).info("DB LOG (ApplicationError): %s", e,
 				extra={
 					"api": self.class_name,
 					"action": self.class_action,
 					"data": model_to_json(req_data),
 					"error_data": str(e),
-					"ip_address": get_ip_address(request),
 					"is_error": True
 				}
 			)
@@ -4403,13 +3962,12 @@ class EcclesiasticalTreasuresMediaUploadNew(GenericAPIView):
 			response[STATUS_CODE] = e.status_code
 			data = response
 		except Exception as e:
-			log.error("{} DB LOG (Internal error): {}".format(request_details(request), str(e)),
+			request_logger(request).error("DB LOG (Internal error): %s", e,
 				extra={
 					"api": self.class_name,
 					"action": self.class_action,
 					"data": model_to_json(req_data),
 					"error_data": str(e),
-					"ip_address": get_ip_address(request),
 					"is_error": True
 				}
 			)
@@ -4447,12 +4005,12 @@ class EcclesiasticalTreasuresUpdate(GenericAPIView):
 		security=[]
 	)
 	def post(self, request, *args, **kwargs):
-		log.debug("{} Received request". format(request_details(request)))
+		request_logger(request).debug("Received request")
 		data = {}
 		response = {}
 
 		try:
-			log.debug("{} START".format(request_details(request)))
+			request_logger(request).debug("START")
 			req_data = request.data
 
 			is_valid, payload = at.authenticate(request)
@@ -4463,10 +4021,8 @@ class EcclesiasticalTreasuresUpdate(GenericAPIView):
 			serialized_item = EcclesiasticalTreasuresUpdateSerializer(data=req_data)
 
 			if not serialized_item.is_valid():
-				log.debug("{} VALIDATION ERROR: {}".format(
-						request_details(request),
-						serialized_item.formatted_error_response()
-					)
+				request_logger(request).debug("VALIDATION ERROR: %s",
+					serialized_item.formatted_error_response()
 				)
 				response = {}
 				response[CONTENT] = serialized_item.formatted_error_response(include_already_exists=True)
@@ -4477,24 +4033,13 @@ class EcclesiasticalTreasuresUpdate(GenericAPIView):
 					ts_now = now()
 					treasure_uuid = req_data.get("uuid")
 
-					treasure_row = Ecclesiastical_Treasures.objects.filter(
-						uuid=treasure_uuid,
-					).first()
+					treasure_access = get_treasure_access(request, treasure_uuid, for_update=True)
 
-					if not treasure_row:
+					if not treasure_access:
 						raise ApplicationError(["resource_not_found", "ecclesiastical_treasure"])
 
-					current_user_obj = Users.objects.filter(id=payload["user_id"]).first()
-					current_user_id = current_user_obj.id
-
-					added_by_user_fk = treasure_row.user_fk_id
-					user_row = Users.objects.filter(
-						id=added_by_user_fk
-					).first()
-
-					if user_row:
-						if current_user_id != added_by_user_fk and current_user_obj.role != RoleModel.ADMIN:
-							raise ApplicationError(["resource_not_allowed"])
+					if not treasure_access.can_edit:
+						raise ApplicationError(["resource_not_allowed"])
 
 					# LANGUAGE CODES - START
 					lang_en_row = E56_Language.objects.filter(code="en").first()
@@ -4895,13 +4440,14 @@ class EcclesiasticalTreasuresUpdate(GenericAPIView):
 						)
 					# DATA ADMINISTRATION - END
 
-				log.info("{} DB LOG".format(request_details(request)),
+					treasure_sync.sync_treasure(treasure_uuid)
+
+				request_logger(request).info("DB LOG",
 					extra={
 						"user_id": payload["user_id"],
 						"api": self.class_name,
 						"action": self.class_action,
 						"data": model_to_json(req_data),
-						"ip_address": get_ip_address(request),
 					}
 				)
 				status_code, message = get_code_and_response(["success"])
@@ -4911,16 +4457,15 @@ class EcclesiasticalTreasuresUpdate(GenericAPIView):
 				response = {}
 				response[CONTENT] = content
 				response[STATUS_CODE] = status_code
-				log.debug("{} SUCCESS".format(request_details(request)))
+				request_logger(request).debug("SUCCESS")
 				data = response
 		except ApplicationError as e:
-			log.info("{} DB LOG (ApplicationError): {}".format(request_details(request), str(e)),
+			request_logger(request).info("DB LOG (ApplicationError): %s", e,
 				extra={
 					"api": self.class_name,
 					"action": self.class_action,
 					"data": model_to_json(req_data),
 					"error_data": str(e),
-					"ip_address": get_ip_address(request),
 					"is_error": True
 				}
 			)
@@ -4929,13 +4474,12 @@ class EcclesiasticalTreasuresUpdate(GenericAPIView):
 			response[STATUS_CODE] = e.status_code
 			data = response
 		except Exception as e:
-			log.error("{} DB LOG (Internal error): {}".format(request_details(request), str(e)),
+			request_logger(request).error("DB LOG (Internal error): %s", e,
 				extra={
 					"api": self.class_name,
 					"action": self.class_action,
 					"data": model_to_json(req_data),
 					"error_data": str(e),
-					"ip_address": get_ip_address(request),
 					"is_error": True
 				}
 			)
@@ -4974,7 +4518,7 @@ class FileMgmtMediaTempAdd(CreateAPIView):
 	)
 	def post(self, request, *args, **kwargs):
 		try:
-			log.debug("{} Received request".format(request_details(request)))
+			request_logger(request).debug("Received request")
 			response = {}
 			data = {}
 			req_data = request.data
@@ -4984,14 +4528,12 @@ class FileMgmtMediaTempAdd(CreateAPIView):
 			if not is_valid:
 				raise ApplicationError(["unauthorized"])
 
-			log.debug("{} START".format(request_details(request)))
+			request_logger(request).debug("START")
 			serialized_item = TempMediaAddSerializer(data=req_data)
 
 			if not serialized_item.is_valid():
-				log.debug("{} VALIDATION ERROR: {}".format(
-						request_details(request),
-						serialized_item.formatted_error_response()
-					)
+				request_logger(request).debug("VALIDATION ERROR: %s",
+					serialized_item.formatted_error_response()
 				)
 				response = {}
 				response[CONTENT] = serialized_item.formatted_error_response(include_already_exists=True)
@@ -5000,7 +4542,7 @@ class FileMgmtMediaTempAdd(CreateAPIView):
 			else:
 				with transaction.atomic():
 					try:
-						log.debug("{} VALID DATA".format(request_details(request)))
+						request_logger(request).debug("VALID DATA")
 
 						post = request.POST.copy()
 						media_uuid = post.get("media_id")
@@ -5011,7 +4553,7 @@ class FileMgmtMediaTempAdd(CreateAPIView):
 						post["media_type"] = media_type
 						post["media_type_uuid"] = media_uuid
 
-						user_obj = Users.objects.filter(id=payload["user_id"]).first()
+						user_obj = current_user(request)
 
 						if not user_obj:
 							raise ApplicationError(["resource_not_found", "user"])
@@ -5048,13 +4590,12 @@ class FileMgmtMediaTempAdd(CreateAPIView):
 							)
 
 						post["temp_media_item_uuid"] = temp_media_item.uuid
-						log.info("{} DB LOG".format(request_details(request)),
+						request_logger(request).info("DB LOG",
 							extra={
 								"user_id": payload["user_id"],
 								"api": self.class_name,
 								"action": self.class_action,
 								"data": model_to_json(post),
-								"ip_address": get_ip_address(request),
 							}
 						)
 						status_code, message = get_code_and_response(["success"])
@@ -5067,18 +4608,17 @@ class FileMgmtMediaTempAdd(CreateAPIView):
 						response = {}
 						response[CONTENT] = content
 						response[STATUS_CODE] = status_code
-						log.debug("{} SUCCESS".format(request_details(request)))
+						request_logger(request).debug("SUCCESS")
 						data = response
 					except Exception as e:
-						log.debug("{} ERROR: {}".format(request_details(request), str(e)))
+						request_logger(request).debug("ERROR: %s", e)
 						raise
 		except ApplicationError as e:
-			log.info("{} DB LOG (ApplicationError): {}".format(request_details(request), str(e)),
+			request_logger(request).info("DB LOG (ApplicationError): %s", e,
 				extra={
 					"api": self.class_name,
 					"action": self.class_action,
 					"error_data": str(e),
-					"ip_address": get_ip_address(request),
 					"is_error": True
 				}
 			)
@@ -5087,12 +4627,11 @@ class FileMgmtMediaTempAdd(CreateAPIView):
 			response[STATUS_CODE] = e.status_code
 			data = response
 		except Exception as e:
-			log.error("{} DB LOG (Internal error): {}".format(request_details(request), str(e)),
+			request_logger(request).error("DB LOG (Internal error): %s", e,
 				extra={
 					"api": self.class_name,
 					"action": self.class_action,
 					"error_data": str(e),
-					"ip_address": get_ip_address(request),
 					"is_error": True
 				}
 			)
@@ -5136,7 +4675,7 @@ class FileMgmtMediaTempDelete(DestroyAPIView):
 	)
 	def delete(self, request):
 		try:
-			log.debug("{} Received request".format(request_details(request)))
+			request_logger(request).debug("Received request")
 			response = {}
 			data = {}
 			req_data = request.GET
@@ -5146,7 +4685,7 @@ class FileMgmtMediaTempDelete(DestroyAPIView):
 			if not is_valid:
 				raise ApplicationError(["unauthorized"])
 
-			log.debug("{} START".format(request_details(request)))
+			request_logger(request).debug("START")
 			temp_uuid = req_data.get("file_id")
 			user_fk_id = payload["user_id"]
 			file_src_to_remove = DIR_MEDIA_TEMP + temp_uuid
@@ -5165,23 +4704,22 @@ class FileMgmtMediaTempDelete(DestroyAPIView):
 					instance.delete()
 					is_to_delete = True
 				else:
-					log.debug("{} Media file not found.".format(request_details(request)))
+					request_logger(request).debug("Media file not found.")
 					raise ApplicationError(["resource_not_found", "media_file"])
 
 			if is_to_delete:
 				try:
 					shutil.rmtree(dir_to_remove)
-					log.debug("{} Temp media deleted: {}".format(request_details(request), dir_to_remove))
+					request_logger(request).debug("Temp media deleted: %s", dir_to_remove)
 				except Exception as e:
-					log.debug("{} Temp media cannot be deleted. Error: {}".format(request_details(request), str(e)))
+					request_logger(request).debug("Temp media cannot be deleted. Error: %s", e)
 
-			log.info("{} DB LOG".format(request_details(request)),
+			request_logger(request).info("DB LOG",
 				extra={
 					"user_id": payload["user_id"],
 					"api": self.class_name,
 					"action": self.class_action,
 					"data": model_to_json(req_data),
-					"ip_address": get_ip_address(request),
 				}
 			)
 			status_code, message = get_code_and_response(["success"])
@@ -5191,16 +4729,15 @@ class FileMgmtMediaTempDelete(DestroyAPIView):
 			response = {}
 			response[CONTENT] = content
 			response[STATUS_CODE] = status_code
-			log.debug("{} SUCCESS".format(request_details(request)))
+			request_logger(request).debug("SUCCESS")
 			data = response
 		except ApplicationError as e:
-			log.info("{} DB LOG (ApplicationError): {}".format(request_details(request), str(e)),
+			request_logger(request).info("DB LOG (ApplicationError): %s", e,
 				extra={
 					"api": self.class_name,
 					"action": self.class_action,
 					"data": model_to_json(req_data),
 					"error_data": str(e),
-					"ip_address": get_ip_address(request),
 					"is_error": True
 				}
 			)
@@ -5209,13 +4746,12 @@ class FileMgmtMediaTempDelete(DestroyAPIView):
 			response[STATUS_CODE] = e.status_code
 			data = response
 		except Exception as e:
-			log.error("{} DB LOG (Internal error): {}".format(request_details(request), str(e)),
+			request_logger(request).error("DB LOG (Internal error): %s", e,
 				extra={
 					"api": self.class_name,
 					"action": self.class_action,
 					"data": model_to_json(req_data),
 					"error_data": str(e),
-					"ip_address": get_ip_address(request),
 					"is_error": True
 				}
 			)
@@ -5231,12 +4767,15 @@ class FileMgmtMediaTempDelete(DestroyAPIView):
 class SystemLogsList(GenericAPIView):
 	"""
 	get:
-	Returns the list of all system logs
+	Returns a page of the system logs, newest first. Pass the returned
+	`next_cursor` as `cursor` to get the following page.
 	"""
 	class_name = "SystemLogsList"
 	class_action = "LIST"
+	serializer_class = SystemLogsListSerializer
 	response_types = [
 		["success"],
+		["bad_request"],
 		["unauthorized"],
 		["resource_not_allowed"],
 		["method_not_allowed"],
@@ -5244,14 +4783,78 @@ class SystemLogsList(GenericAPIView):
 		["internal_server_error"]
 	]
 	response_dict = build_fields("SystemLogsList", response_types)
+	api_param = openapi.Parameter(
+		"api",
+		in_=openapi.IN_QUERY,
+		description="Only logs of this API",
+		type=openapi.TYPE_STRING,
+		required=False,
+	)
+	action_param = openapi.Parameter(
+		"action",
+		in_=openapi.IN_QUERY,
+		description="Only logs of this action",
+		type=openapi.TYPE_STRING,
+		required=False,
+	)
+	is_error_param = openapi.Parameter(
+		"is_error",
+		in_=openapi.IN_QUERY,
+		description="Only error logs if true, only non-error logs if false",
+		type=openapi.TYPE_BOOLEAN,
+		required=False,
+	)
+	user_fk_param = openapi.Parameter(
+		"user_fk",
+		in_=openapi.IN_QUERY,
+		description="Only logs of this user ID",
+		type=openapi.TYPE_INTEGER,
+		required=False,
+	)
+	ip_address_param = openapi.Parameter(
+		"ip_address",
+		in_=openapi.IN_QUERY,
+		description="Only logs from this IP address",
+		type=openapi.TYPE_STRING,
+		required=False,
+	)
+	ts_from_param = openapi.Parameter(
+		"ts_from",
+		in_=openapi.IN_QUERY,
+		description="Only logs added at or after this ISO 8601 datetime",
+		type=openapi.TYPE_STRING,
+		required=False,
+	)
+	ts_to_param = openapi.Parameter(
+		"ts_to",
+		in_=openapi.IN_QUERY,
+		description="Only logs added before this ISO 8601 datetime",
+		type=openapi.TYPE_STRING,
+		required=False,
+	)
+	cursor_param = openapi.Parameter(
+		"cursor",
+		in_=openapi.IN_QUERY,
+		description="The `next_cursor` of the previous page",
+		type=openapi.TYPE_STRING,
+		required=False,
+	)
+	limit_param = openapi.Parameter(
+		"limit",
+		in_=openapi.IN_QUERY,
+		description="The page size, up to {}".format(system_logs.MAX_LIMIT),
+		type=openapi.TYPE_INTEGER,
+		required=False,
+	)
 
 	@swagger_auto_schema(
 		responses=response_dict,
 		security=[],
+		manual_parameters=[api_param, action_param, is_error_param, user_fk_param, ip_address_param, ts_from_param, ts_to_param, cursor_param, limit_param]
 	)
 	def get(self, request):
 		try:
-			log.debug("{} Received request".format(request_details(request)))
+			request_logger(request).debug("Received request")
 			response = {}
 			data = {}
 
@@ -5260,40 +4863,449 @@ class SystemLogsList(GenericAPIView):
 			if not is_valid:
 				raise ApplicationError(["unauthorized"])
 
-			log.debug("{} VALID DATA".format(request_details(request)))
+			current_user_obj = current_user(request)
+
+			if current_user_obj.role != RoleModel.ADMIN:
+				raise ApplicationError(["resource_not_allowed"])
+
+			serialized_item = SystemLogsListSerializer(data=request.GET.dict())
+
+			if not serialized_item.is_valid():
+				request_logger(request).debug("VALIDATION ERROR: %s",
+					serialized_item.formatted_error_response()
+				)
+				response = {}
+				response[CONTENT] = serialized_item.formatted_error_response(include_already_exists=False)
+				response[STATUS_CODE] = status.HTTP_400_BAD_REQUEST
+				data = response
+			else:
+				request_logger(request).debug("VALID DATA")
+				filters = serialized_item.validated_data
+				list_results, next_cursor = system_logs.fetch_page(
+					filters,
+					filters.get("cursor"),
+					filters["limit"]
+				)
+
+				request_logger(request).info("DB LOG",
+					extra={
+						"user_id": payload["user_id"],
+						"api": self.class_name,
+						"action": self.class_action,
+					}
+				)
+
+				status_code, message = get_code_and_response(["success"])
+				content = {}
+				content[MESSAGE] = message
+				content[RESOURCE_ARRAY] = list_results
+				content[NEXT_CURSOR] = next_cursor
+				response = {}
+				response[CONTENT] = content
+				response[STATUS_CODE] = status_code
+				request_logger(request).debug("SUCCESS")
+				data = response
+		except ApplicationError as e:
+			request_logger(request).info("DB LOG (ApplicationError): %s", e,
+				extra={
+					"api": self.class_name,
+					"action": self.class_action,
+					"error_data": str(e),
+					"is_error": True
+				}
+			)
+			response = {}
+			response[CONTENT] = e.get_response_body()
+			response[STATUS_CODE] = e.status_code
+			data = response
+		except Exception as e:
+			request_logger(request).error("DB LOG (Internal error): %s", e,
+				extra={
+					"api": self.class_name,
+					"action": self.class_action,
+					"error_data": str(e),
+					"is_error": True
+				}
+			)
+			status_code, _ = get_code_and_response(["internal_server_error"])
+			content = {
+				MESSAGE: "Unable to list system logs"
+			}
+			return Response(content, status=status_code)
+
+		return Response(data[CONTENT], status=data[STATUS_CODE])
+
+
+class SystemLogsRollupList(GenericAPIView):
+	"""
+	get:
+	Returns the number of system logs per hour or day, api, action, error
+	flag and organization, read from the pre-aggregated rollups
+	"""
+	class_name = "SystemLogsRollupList"
+	class_action = "LIST"
+	serializer_class = SystemLogsRollupListSerializer
+	response_types = [
+		["success"],
+		["bad_request"],
+		["unauthorized"],
+		["resource_not_allowed"],
+		["method_not_allowed"],
+		["unsupported_media_type"],
+		["internal_server_error"]
+	]
+	response_dict = build_fields("SystemLogsRollupList", response_types)
+	api_param = openapi.Parameter(
+		"api",
+		in_=openapi.IN_QUERY,
+		description="Only counts of this API",
+		type=openapi.TYPE_STRING,
+		required=False,
+	)
+	action_param = openapi.Parameter(
+		"action",
+		in_=openapi.IN_QUERY,
+		description="Only counts of this action",
+		type=openapi.TYPE_STRING,
+		required=False,
+	)
+	is_error_param = openapi.Parameter(
+		"is_error",
+		in_=openapi.IN_QUERY,
+		description="Only counts of errors if true, only of non-errors if false",
+		type=openapi.TYPE_BOOLEAN,
+		required=False,
+	)
+	organization_param = openapi.Parameter(
+		"organization",
+		in_=openapi.IN_QUERY,
+		description="Only counts of users of this organization, empty for anonymous requests",
+		type=openapi.TYPE_STRING,
+		required=False,
+	)
+	ts_from_param = openapi.Parameter(
+		"ts_from",
+		in_=openapi.IN_QUERY,
+		description="Start of the range as an ISO 8601 datetime, defaults to {} days before `ts_to`".format(log_rollups.DEFAULT_RANGE_DAYS),
+		type=openapi.TYPE_STRING,
+		required=False,
+	)
+	ts_to_param = openapi.Parameter(
+		"ts_to",
+		in_=openapi.IN_QUERY,
+		description="End of the range as an ISO 8601 datetime, defaults to now",
+		type=openapi.TYPE_STRING,
+		required=False,
+	)
+	granularity_param = openapi.Parameter(
+		"granularity",
+		in_=openapi.IN_QUERY,
+		description="The size of the buckets: `hour` (default) or `day`",
+		type=openapi.TYPE_STRING,
+		required=False,
+	)
+
+	@swagger_auto_schema(
+		responses=response_dict,
+		security=[],
+		manual_parameters=[api_param, action_param, is_error_param, organization_param, ts_from_param, ts_to_param, granularity_param]
+	)
+	def get(self, request):
+		try:
+			request_logger(request).debug("Received request")
+			response = {}
+			data = {}
+
+			is_valid, payload = at.authenticate(request)
+
+			if not is_valid:
+				raise ApplicationError(["unauthorized"])
+
+			current_user_obj = current_user(request)
+
+			if current_user_obj.role != RoleModel.ADMIN:
+				raise ApplicationError(["resource_not_allowed"])
+
+			serialized_item = SystemLogsRollupListSerializer(data=request.GET.dict())
+
+			if not serialized_item.is_valid():
+				request_logger(request).debug("VALIDATION ERROR: %s",
+					serialized_item.formatted_error_response()
+				)
+				response = {}
+				response[CONTENT] = serialized_item.formatted_error_response(include_already_exists=False)
+				response[STATUS_CODE] = status.HTTP_400_BAD_REQUEST
+				data = response
+			else:
+				request_logger(request).debug("VALID DATA")
+				filters = serialized_item.validated_data
+				list_results = log_rollups.query(filters, filters["granularity"])
+
+				request_logger(request).info("DB LOG",
+					extra={
+						"user_id": payload["user_id"],
+						"api": self.class_name,
+						"action": self.class_action,
+					}
+				)
+
+				status_code, message = get_code_and_response(["success"])
+				content = {}
+				content[MESSAGE] = message
+				content[RESOURCE_ARRAY] = list_results
+				response = {}
+				response[CONTENT] = content
+				response[STATUS_CODE] = status_code
+				request_logger(request).debug("SUCCESS")
+				data = response
+		except ApplicationError as e:
+			request_logger(request).info("DB LOG (ApplicationError): %s", e,
+				extra={
+					"api": self.class_name,
+					"action": self.class_action,
+					"error_data": str(e),
+					"is_error": True
+				}
+			)
+			response = {}
+			response[CONTENT] = e.get_response_body()
+			response[STATUS_CODE] = e.status_code
+			data = response
+		except Exception as e:
+			request_logger(request).error("DB LOG (Internal error): %s", e,
+				extra={
+					"api": self.class_name,
+					"action": self.class_action,
+					"error_data": str(e),
+					"is_error": True
+				}
+			)
+			status_code, _ = get_code_and_response(["internal_server_error"])
+			content = {
+				MESSAGE: "Unable to list system log counts"
+			}
+			return Response(content, status=status_code)
+
+		return Response(data[CONTENT], status=data[STATUS_CODE])
 
-			current_user_obj = Users.objects.filter(id=payload["user_id"]).first()
+
+class SystemLogsExport(GenericAPIView):
+	"""
+	get:
+	Streams the system logs that match the filters, oldest first, as NDJSON or CSV
+	"""
+	class_name = "SystemLogsExport"
+	class_action = "EXPORT"
+	serializer_class = SystemLogsExportSerializer
+	response_types = [
+		["success"],
+		["bad_request"],
+		["unauthorized"],
+		["resource_not_allowed"],
+		["method_not_allowed"],
+		["unsupported_media_type"],
+		["internal_server_error"]
+	]
+	response_dict = build_fields("SystemLogsExport", response_types)
+	api_param = openapi.Parameter(
+		"api",
+		in_=openapi.IN_QUERY,
+		description="Only logs of this API",
+		type=openapi.TYPE_STRING,
+		required=False,
+	)
+	action_param = openapi.Parameter(
+		"action",
+		in_=openapi.IN_QUERY,
+		description="Only logs of this action",
+		type=openapi.TYPE_STRING,
+		required=False,
+	)
+	is_error_param = openapi.Parameter(
+		"is_error",
+		in_=openapi.IN_QUERY,
+		description="Only error logs if true, only non-error logs if false",
+		type=openapi.TYPE_BOOLEAN,
+		required=False,
+	)
+	user_fk_param = openapi.Parameter(
+		"user_fk",
+		in_=openapi.IN_QUERY,
+		description="Only logs of this user ID",
+		type=openapi.TYPE_INTEGER,
+		required=False,
+	)
+	ip_address_param = openapi.Parameter(
+		"ip_address",
+		in_=openapi.IN_QUERY,
+		description="Only logs from this IP address",
+		type=openapi.TYPE_STRING,
+		required=False,
+	)
+	ts_from_param = openapi.Parameter(
+		"ts_from",
+		in_=openapi.IN_QUERY,
+		description="Only logs added at or after this ISO 8601 datetime",
+		type=openapi.TYPE_STRING,
+		required=False,
+	)
+	ts_to_param = openapi.Parameter(
+		"ts_to",
+		in_=openapi.IN_QUERY,
+		description="Only logs added before this ISO 8601 datetime",
+		type=openapi.TYPE_STRING,
+		required=False,
+	)
+	export_format_param = openapi.Parameter(
+		"export_format",
+		in_=openapi.IN_QUERY,
+		description="The format of the export: `ndjson` (default) or `csv`",
+		type=openapi.TYPE_STRING,
+		required=False,
+	)
+
+	@swagger_auto_schema(
+		responses=response_dict,
+		security=[],
+		manual_parameters=[api_param, action_param, is_error_param, user_fk_param, ip_address_param, ts_from_param, ts_to_param, export_format_param]
+	)
+	def get(self, request):
+		try:
+			request_logger(request).debug("Received request")
+			response = {}
+			data = {}
+
+			is_valid, payload = at.authenticate(request)
+
+			if not is_valid:
+				raise ApplicationError(["unauthorized"])
+
+			current_user_obj = current_user(request)
 
 			if current_user_obj.role != RoleModel.ADMIN:
 				raise ApplicationError(["resource_not_allowed"])
 
-			list_results = list(LoggingEntries.objects.all().values())
+			req_data = request.GET.dict()
+			serialized_item = SystemLogsExportSerializer(data=req_data)
 
-			log.info("{} DB LOG".format(request_details(request)),
+			if not serialized_item.is_valid():
+				request_logger(request).debug("VALIDATION ERROR: %s",
+					serialized_item.formatted_error_response()
+				)
+				response = {}
+				response[CONTENT] = serialized_item.formatted_error_response(include_already_exists=False)
+				response[STATUS_CODE] = status.HTTP_400_BAD_REQUEST
+				data = response
+			else:
+				request_logger(request).debug("VALID DATA")
+				filters = serialized_item.validated_data
+				export_format = filters["export_format"]
+
+				request_logger(request).info("DB LOG",
+					extra={
+						"user_id": payload["user_id"],
+						"api": self.class_name,
+						"action": self.class_action,
+						"data": model_to_json(req_data),
+					}
+				)
+
+				response = StreamingHttpResponse(
+					system_logs.export_entries(filters, export_format),
+					content_type=system_logs.EXPORT_CONTENT_TYPES[export_format]
+				)
+				response["Content-Disposition"] = "attachment; filename=\"narrate_logs_{}.{}\"".format(
+					now().strftime("%Y%m%d%H%M%S"),
+					export_format
+				)
+				request_logger(request).debug("SUCCESS")
+				return response
+		except ApplicationError as e:
+			request_logger(request).info("DB LOG (ApplicationError): %s", e,
 				extra={
-					"user_id": payload["user_id"],
 					"api": self.class_name,
 					"action": self.class_action,
-					"ip_address": get_ip_address(request),
+					"error_data": str(e),
+					"is_error": True
 				}
 			)
+			response = {}
+			response[CONTENT] = e.get_response_body()
+			response[STATUS_CODE] = e.status_code
+			data = response
+		except Exception as e:
+			request_logger(request).error("DB LOG (Internal error): %s", e,
+				extra={
+					"api": self.class_name,
+					"action": self.class_action,
+					"error_data": str(e),
+					"is_error": True
+				}
+			)
+			status_code, _ = get_code_and_response(["internal_server_error"])
+			content = {
+				MESSAGE: "Unable to export system logs"
+			}
+			return Response(content, status=status_code)
+
+		return Response(data[CONTENT], status=data[STATUS_CODE])
+
+
+class SystemMetricsList(GenericAPIView):
+	"""
+	get:
+	Returns the runtime counters of the worker that served the request
+	"""
+	class_name = "SystemMetricsList"
+	class_action = "LIST"
+	response_types = [
+		["success"],
+		["unauthorized"],
+		["resource_not_allowed"],
+		["method_not_allowed"],
+		["unsupported_media_type"],
+		["internal_server_error"]
+	]
+	response_dict = build_fields("SystemMetricsList", response_types)
+
+	@swagger_auto_schema(
+		responses=response_dict,
+		security=[],
+	)
+	def get(self, request):
+		try:
+			request_logger(request).debug("Received request")
+			response = {}
+			data = {}
+
+			is_valid, payload = at.authenticate(request)
+
+			if not is_valid:
+				raise ApplicationError(["unauthorized"])
+
+			request_logger(request).debug("VALID DATA")
+
+			current_user_obj = current_user(request)
+
+			if current_user_obj.role != RoleModel.ADMIN:
+				raise ApplicationError(["resource_not_allowed"])
 
 			status_code, message = get_code_and_response(["success"])
 			content = {}
 			content[MESSAGE] = message
-			content[RESOURCE_ARRAY] = list_results
+			content[RESOURCE_OBJ] = metrics.snapshot()
+			content[RESOURCE_OBJ]["pid"] = os.getpid()
 			response = {}
 			response[CONTENT] = content
 			response[STATUS_CODE] = status_code
-			log.debug("{} SUCCESS".format(request_details(request)))
+			request_logger(request).debug("SUCCESS")
 			data = response
 		except ApplicationError as e:
-			log.info("{} DB LOG (ApplicationError): {}".format(request_details(request), str(e)),
+			request_logger(request).info("DB LOG (ApplicationError): %s", e,
 				extra={
 					"api": self.class_name,
 					"action": self.class_action,
 					"error_data": str(e),
-					"ip_address": get_ip_address(request),
 					"is_error": True
 				}
 			)
@@ -5302,18 +5314,17 @@ class SystemLogsList(GenericAPIView):
 			response[STATUS_CODE] = e.status_code
 			data = response
 		except Exception as e:
-			log.error("{} DB LOG (Internal error): {}".format(request_details(request), str(e)),
+			request_logger(request).error("DB LOG (Internal error): %s", e,
 				extra={
 					"api": self.class_name,
 					"action": self.class_action,
 					"error_data": str(e),
-					"ip_address": get_ip_address(request),
 					"is_error": True
 				}
 			)
 			status_code, _ = get_code_and_response(["internal_server_error"])
 			content = {
-				MESSAGE: "Unable to list system logs"
+				MESSAGE: "Unable to list system metrics"
 			}
 			return Response(content, status=status_code)
 
@@ -9,6 +9,7 @@ from email.mime.text import MIMEText
 from .custom_logging import logger as log
 
 import json
+import logging
 import smtplib
 import ssl
 import uuid
@@ -110,6 +111,84 @@ def get_ip_address(request):
 	return ip
 
 
+class RequestContext:
+	"""
+	The "<ip> - <username> - " prefix of the log messages of a request.
+	Computed on first use only, since resolving the username may parse the
+	request body, and reused by every later log call of the request.
+	"""
+
+	def __init__(self, request):
+		self.request = request
+		self._prefix = None
+		self._ip_address = None
+
+	@property
+	def ip_address(self):
+		if self._ip_address is None:
+			self._ip_address = get_ip_address(self.request)
+
+		return self._ip_address
+
+	def __str__(self):
+		if self._prefix is None:
+			self._prefix = request_details(self.request)
+
+		return self._prefix
+
+
+class RequestMessage:
+	"""
+	A log message that is prefixed with the request context only when a
+	handler formats the record
+	"""
+
+	def __init__(self, context, msg):
+		self.context = context
+		self.msg = msg
+
+	def __str__(self):
+		return "{}{}".format(self.context, self.msg)
+
+
+class RequestLogAdapter(logging.LoggerAdapter):
+	"""
+	Logs on behalf of a request. Messages take %-style arguments that are
+	only interpolated when a handler accepts the record, calls below the
+	logger level cost a level check, and `ip_address` is added to the extra
+	data of every record.
+	"""
+
+	def __init__(self, logger, request):
+		super().__init__(logger, {})
+		self.context = RequestContext(request)
+
+	def process(self, msg, kwargs):
+		extra = kwargs.get("extra") or {}
+
+		if "ip_address" not in extra:
+			extra = dict(extra, ip_address=self.context.ip_address)
+
+		kwargs["extra"] = extra
+		return RequestMessage(self.context, msg), kwargs
+
+
+def request_logger(request):
+	# DRF requests wrap the HttpRequest, keep a single adapter on the latter
+	http_request = getattr(request, "_request", request)
+
+	if isinstance(http_request, dict):
+		return RequestLogAdapter(log, request)
+
+	adapter = getattr(http_request, "narrate_logger", None)
+
+	if adapter is None:
+		adapter = RequestLogAdapter(log, request)
+		http_request.narrate_logger = adapter
+
+	return adapter
+
+
 def build_email_object(fromaddr, toaddr, code=None, reset_password_url=None):
 	msg = MIMEMultipart("alternative")
 	msg["From"] = fromaddr
@@ -0,0 +1,108 @@
+"""
+Measures how many log records per second the narrate logger formats with
+the previous inspect.stack() based ClassFilter and with the current one.
+The database handler is detached so that only filtering and formatting
+are measured.
+
+Run from the server directory with the same environment as the service:
+
+	python benchmarks/logging_class_filter.py --records 20000
+"""
+import argparse
+import inspect
+import io
+import logging
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "narrate_project.settings")
+
+import django
+django.setup()
+
+from backend import custom_logging
+
+
+class ClassFilter(logging.Filter):
+	"""
+	The ClassFilter before the frame walking resolver, kept for comparison.
+	It keeps its name since it skips its own frames by class name.
+	"""
+	def _get_class_from_frame(self, fr):
+		args, _, _, value_dict = inspect.getargvalues(fr)
+		instance = None
+
+		if len(args) and args[0] == "self":
+			instance = value_dict.get("self", None)
+
+		if instance:
+			return getattr(instance, "__class__", None)
+
+		return None
+
+	def filter(self, record):
+		stack = inspect.stack()
+		unwanted_classes = ["Logger", "ClassFilter"]
+		classname = "None"
+
+		for stack_frame in stack:
+			class_obj = self._get_class_from_frame(stack_frame[0])
+
+			if class_obj and class_obj.__name__ not in unwanted_classes:
+				classname = class_obj.__name__
+				break
+
+		record.classname = classname
+		return True
+
+
+class BenchmarkView:
+	def nested(self, depth, records):
+		# Simulates the depth of a Django/DRF request stack
+		if depth:
+			return self.nested(depth - 1, records)
+
+		return self.get(records)
+
+	def get(self, records):
+		for i in range(records):
+			custom_logging.logger.debug("%s Received request", "127.0.0.1 - user@narrate.com - ")
+
+
+def run(label, class_filter, records, depth):
+	logger = custom_logging.logger
+	stream = io.StringIO()
+	handler = logging.StreamHandler(stream)
+	handler.setLevel(logging.DEBUG)
+	handler.setFormatter(custom_logging.formatter)
+	saved_handlers = list(logger.handlers)
+	saved_filters = list(logger.filters)
+	logger.handlers = [handler]
+	logger.filters = [class_filter]
+
+	try:
+		started = time.perf_counter()
+		BenchmarkView().nested(depth, records)
+		elapsed = time.perf_counter() - started
+	finally:
+		logger.handlers = saved_handlers
+		logger.filters = saved_filters
+
+	last_line = stream.getvalue().splitlines()[-1]
+	print("{:<14} {:>10.0f} records/s   {}".format(label, records / elapsed, last_line.split(" - ")[1]))
+
+
+def main():
+	parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+	parser.add_argument("--records", type=int, default=20000)
+	parser.add_argument("--depth", type=int, default=40, help="Extra frames below the logging call")
+	args = parser.parse_args()
+
+	run("inspect.stack", ClassFilter(), args.records, args.depth)
+	run("frame walk", custom_logging.ClassFilter(), args.records, args.depth)
+
+
+if __name__ == "__main__":
+	main()
@@ -0,0 +1,123 @@
+"""
+Measures the latency of requests on a single gevent worker with DEBUG
+logging enabled, with the file and stdout handlers called synchronously by
+the greenlets and with them behind the queue and native listener thread of
+backend.custom_logging. Both handlers write to files in a temporary
+directory, stdout is not touched.
+
+Run from the server directory with the same environment as the service:
+
+	python benchmarks/logging_pipeline_latency.py --requests 50 --lines 20 --duration 10
+"""
+from gevent import monkey
+monkey.patch_all()
+
+import argparse
+import logging
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "narrate_project.settings")
+
+import django
+django.setup()
+
+import gevent
+
+from backend.custom_logging import (
+	ClassFilter,
+	NativeQueueListener,
+	PipelineQueueHandler,
+)
+
+
+FORMAT = "%(levelname)s - %(classname)s - %(funcName)s - %(asctime)s - %(message)s"
+
+
+def percentile(values, pct):
+	values = sorted(values)
+	index = min(len(values) - 1, int(round(pct / 100.0 * (len(values) - 1))))
+	return values[index]
+
+
+def build_handlers(directory, label):
+	handlers = [
+		logging.FileHandler(os.path.join(directory, "{}.log".format(label))),
+		logging.StreamHandler(open(os.path.join(directory, "{}.stdout".format(label)), "w")),
+	]
+
+	for handler in handlers:
+		handler.setLevel(logging.DEBUG)
+		handler.setFormatter(logging.Formatter(FORMAT))
+
+	return handlers
+
+
+def build_logger(label, handlers):
+	bench_logger = logging.getLogger("benchmark_{}".format(label))
+	bench_logger.setLevel(logging.DEBUG)
+	bench_logger.propagate = False
+	bench_logger.addFilter(ClassFilter())
+
+	for handler in handlers:
+		bench_logger.addHandler(handler)
+
+	return bench_logger
+
+
+class Request:
+	def handle(self, bench_logger, lines):
+		for line in range(lines):
+			bench_logger.debug("Line %s of a request, payload %s", line, {"treasure": "x" * 64})
+
+		# A request yields to the loop at least once (e.g. for I/O)
+		gevent.sleep(0)
+
+
+def request_loop(bench_logger, lines, deadline, latencies):
+	while time.monotonic() < deadline:
+		started = time.monotonic()
+		Request().handle(bench_logger, lines)
+		latencies.append((time.monotonic() - started) * 1000)
+
+
+def run(label, bench_logger, requests, lines, duration_sec):
+	deadline = time.monotonic() + duration_sec
+	latencies = []
+	greenlets = [gevent.spawn(request_loop, bench_logger, lines, deadline, latencies) for _ in range(requests)]
+	gevent.joinall(greenlets)
+
+	print("{:<10} requests/s={:>8.1f} p50={:>8.2f}ms p99={:>8.2f}ms max={:>8.2f}ms".format(
+			label,
+			len(latencies) / duration_sec,
+			percentile(latencies, 50),
+			percentile(latencies, 99),
+			max(latencies),
+		)
+	)
+
+
+def main():
+	parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+	parser.add_argument("--requests", type=int, default=50, help="Concurrent request greenlets")
+	parser.add_argument("--lines", type=int, default=20, help="DEBUG lines logged per request")
+	parser.add_argument("--duration", type=float, default=10, help="Seconds per mode")
+	args = parser.parse_args()
+
+	with tempfile.TemporaryDirectory() as directory:
+		print("requests={} lines={} duration={}s".format(args.requests, args.lines, args.duration))
+		run("sync", build_logger("sync", build_handlers(directory, "sync")), args.requests, args.lines, args.duration)
+
+		listener = NativeQueueListener(*build_handlers(directory, "pipeline"))
+		queue_handler = PipelineQueueHandler(listener)
+		run("pipeline", build_logger("pipeline", [queue_handler]), args.requests, args.lines, args.duration)
+		started = time.monotonic()
+		listener.stop(timeout_sec=60)
+		print("pipeline drained in {:.2f}s after the run".format(time.monotonic() - started))
+
+
+if __name__ == "__main__":
+	main()
@@ -0,0 +1,88 @@
+"""
+Measures the latency of unrelated requests on a single gevent worker while
+logins are hashing passwords, with the hashing done inline on the event loop
+and with the hashing done on the executor of backend.hashing.
+
+Run from the server directory with the same environment as the service:
+
+	python benchmarks/password_hashing_latency.py --logins 8 --duration 10
+"""
+from gevent import monkey
+monkey.patch_all()
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "narrate_project.settings")
+
+import django
+django.setup()
+
+import gevent
+from django.contrib.auth import hashers
+
+from backend import hashing
+
+
+def percentile(values, pct):
+	values = sorted(values)
+	index = min(len(values) - 1, int(round(pct / 100.0 * (len(values) - 1))))
+	return values[index]
+
+
+def login_loop(check, encoded, deadline, counter):
+	while time.monotonic() < deadline:
+		check("benchmark-password", encoded)
+		counter[0] += 1
+		gevent.sleep(0)
+
+
+def unrelated_request_loop(interval_sec, deadline, latencies):
+	while time.monotonic() < deadline:
+		started = time.monotonic()
+		# An unrelated request yields to the loop at least once (e.g. for I/O)
+		gevent.sleep(0)
+		latencies.append((time.monotonic() - started) * 1000)
+		gevent.sleep(interval_sec)
+
+
+def run(label, check, encoded, logins, duration_sec, interval_sec):
+	deadline = time.monotonic() + duration_sec
+	latencies = []
+	counter = [0]
+	greenlets = [gevent.spawn(login_loop, check, encoded, deadline, counter) for _ in range(logins)]
+	greenlets.append(gevent.spawn(unrelated_request_loop, interval_sec, deadline, latencies))
+	gevent.joinall(greenlets)
+
+	print("{:<10} logins/s={:>7.1f} requests={:>6} p50={:>8.2f}ms p99={:>8.2f}ms max={:>8.2f}ms".format(
+			label,
+			counter[0] / duration_sec,
+			len(latencies),
+			percentile(latencies, 50),
+			percentile(latencies, 99),
+			max(latencies),
+		)
+	)
+
+
+def main():
+	parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+	parser.add_argument("--logins", type=int, default=8, help="Concurrent login greenlets")
+	parser.add_argument("--duration", type=float, default=10, help="Seconds per mode")
+	parser.add_argument("--interval-ms", type=float, default=10, help="Pause between unrelated requests")
+	args = parser.parse_args()
+
+	encoded = hashers.make_password("benchmark-password")
+	interval_sec = args.interval_ms / 1000
+
+	print("hasher={} logins={} duration={}s".format(encoded.split("$")[0], args.logins, args.duration))
+	run("inline", hashers.check_password, encoded, args.logins, args.duration, interval_sec)
+	run("executor", hashing.check_password, encoded, args.logins, args.duration, interval_sec)
+	print(hashing.executor.stats())
+
+
+if __name__ == "__main__":
+	main()
@@ -0,0 +1,83 @@
+"""
+Counts the SQL queries and the time of EcclesiasticalTreasuresList for a
+few keywords, as a regression check that the number of queries does not
+grow with the number of matching treasures. Exits with status 1 if any
+request runs more than --max-queries queries. The same bound is asserted
+on seeded data by backend.tests.test_treasure_list_queries; this script
+checks it, with timings, against real data.
+
+Run from the server directory against a database with data, as one of its users:
+
+	python benchmarks/treasure_search_queries.py --email admin@example.com --keyword a --keyword church
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "narrate_project.settings")
+
+import django
+django.setup()
+
+from django.db import connection
+from django.test import RequestFactory
+from django.test.utils import CaptureQueriesContext
+from rest_framework_simplejwt.tokens import AccessToken
+
+from backend import views
+from backend.authentication_tools.middleware import RequestAuthentication
+from backend.models import Users
+
+
+def build_request(user, params):
+	token = AccessToken.for_user(user)
+	token["organization"] = user.organization
+	token["role"] = user.role
+	request = RequestFactory().get(
+		"/backend/ecclesiastical-treasures/list/",
+		params,
+		HTTP_AUTHORIZATION="Bearer {}".format(token),
+	)
+	request.narrate_auth = RequestAuthentication(request)
+	return request
+
+
+def main():
+	parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+	parser.add_argument("--email", required=True, help="The user that runs the searches")
+	parser.add_argument("--keyword", action="append", default=[], help="A search keyword, may be repeated")
+	parser.add_argument("--max-queries", type=int, default=5, help="Queries allowed per request")
+	args = parser.parse_args()
+
+	user = Users.objects.get(email=args.email)
+	view = views.EcclesiasticalTreasuresList.as_view()
+	cases = [{}] + [{"search_keyword": keyword} for keyword in args.keyword] + \
+		[{"search_keyword": keyword, "exact_match": "true"} for keyword in args.keyword]
+	failed = False
+
+	for params in cases:
+		request = build_request(user, params)
+
+		with CaptureQueriesContext(connection) as queries:
+			started = time.monotonic()
+			response = view(request)
+			elapsed_ms = (time.monotonic() - started) * 1000
+
+		results = len(response.data.get("resource_array", []))
+		failed = failed or len(queries) > args.max_queries
+		print("{:<50} status={} results={:>6} queries={:>3} time={:>9.2f}ms".format(
+				str(params),
+				response.status_code,
+				results,
+				len(queries),
+				elapsed_ms,
+			)
+		)
+
+	sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+	main()
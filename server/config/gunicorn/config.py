@@ -7,3 +7,16 @@ worker_class = 'gevent'
 worker_connections = 1000
 timeout = 500
 keepalive = 120
+
+
+def post_worker_init(worker):
+	# Load the revoked token index before the worker accepts requests
+	from backend.authentication_tools.revocation import revocation_index
+	revocation_index.start()
+
+
+def worker_exit(server, worker):
+	# Write the log entries and records still buffered in the worker
+	from backend.custom_logging import db_handler, listener
+	db_handler.close()
+	listener.stop()
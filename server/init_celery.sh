@@ -1,4 +1,6 @@
 #!/bin/bash
 pkill -9 celery
+# The only process that rotates the log file shared with narrate-server
+while true; do logrotate --state /tmp/logrotate.state /code/config/logrotate/narrate_project.conf; sleep 300; done &
 celery -A narrate_project worker & celery -A narrate_project beat & celery -A narrate_project flower --conf=./narrate_project/flowerconfig.py
 sleep 5
@@ -1,3 +1,4 @@
+from celery.schedules import crontab
 from datetime import timedelta
 
 import os
@@ -20,6 +21,7 @@ INSTALLED_APPS = [
 	"django.contrib.sessions",
 	"django.contrib.messages",
 	"django.contrib.staticfiles",
+	"django.contrib.postgres",
 	"rest_framework_simplejwt.token_blacklist",
 	"corsheaders",
 	"backend",
@@ -36,6 +38,7 @@ MIDDLEWARE = [
 	"django.middleware.common.CommonMiddleware",
 	"django.middleware.csrf.CsrfViewMiddleware",
 	"django.contrib.auth.middleware.AuthenticationMiddleware",
+	"backend.authentication_tools.middleware.AccessTokenAuthenticationMiddleware",
 	"django.contrib.messages.middleware.MessageMiddleware",
 	"django.middleware.clickjacking.XFrameOptionsMiddleware",
 ]
@@ -111,7 +114,7 @@ SIMPLE_JWT = {
 	"ALGORITHM": "HS256",
 	"SIGNING_KEY": SECRET_KEY,
 	"USER_ID_CLAIM": "user_id",
-	"ACCESS_TOKEN_LIFETIME": timedelta(days=60),
+	"ACCESS_TOKEN_LIFETIME": timedelta(minutes=int(os.environ.get("ACCESS_TOKEN_LIFETIME_MIN", 5))),
 	"REFRESH_TOKEN_LIFETIME": timedelta(days=365),
 	"AUDIENCE": ["AUTH", "IHU", "KMKD", "SUSKO",],
 	"AUTH_COOKIE": "access_token",
@@ -123,12 +126,60 @@ SIMPLE_JWT = {
 	"AUTH_COOKIE_SAMESITE": "Strict",
 }
 
+# Per-worker cache of verified principals, keyed by the hash of the refresh token.
+# A token blacklisted by another worker is accepted here for at most TTL_SEC.
+PRINCIPAL_CACHE = {
+	"MAX_ENTRIES": int(os.environ.get("PRINCIPAL_CACHE_MAX_ENTRIES", 10000)),
+	"TTL_SEC": int(os.environ.get("PRINCIPAL_CACHE_TTL_SEC", 60)),
+}
+
+# In-process index of revoked refresh tokens, kept current through LISTEN/NOTIFY
+TOKEN_REVOCATION = {
+	"RECONNECT_INTERVAL_SEC": 5,
+	"POLL_TIMEOUT_SEC": 60,
+	"FLUSH_EXPIRED_INTERVAL_SEC": 86400,
+}
+
+# Per-worker memo of "can user U view/edit treasure T" decisions
+TREASURE_ACCESS_CACHE = {
+	"MAX_ENTRIES": 10000,
+	"TTL_SEC": 5,
+}
+
+# Per-worker LRU cache of the pages of the treasure list, keyed by the catalogue version.
+# MAX_ITEMS bounds the list items of all pages together, pages above a tenth of it are not cached.
+TREASURE_LIST_CACHE = {
+	"MAX_ENTRIES": int(os.environ.get("TREASURE_LIST_CACHE_MAX_ENTRIES", 1000)),
+	"MAX_ITEMS": int(os.environ.get("TREASURE_LIST_CACHE_MAX_ITEMS", 20000)),
+}
+
 AUTH_USER_MODEL = "backend.Users"
 
-PASSWORD_HASHERS = [
-	"django.contrib.auth.hashers.PBKDF2PasswordHasher",
+# The preferred hasher is used for new hashes. Hashes made by the others, or
+# with a different work factor, still verify and are upgraded on login.
+PASSWORD_HASHING = {
+	"PREFERRED": os.environ.get("PASSWORD_HASHER", "pbkdf2_sha256"),
+	"PBKDF2_ITERATIONS": int(os.environ.get("PASSWORD_HASH_PBKDF2_ITERATIONS", 320000)),
+	"SCRYPT_WORK_FACTOR": int(os.environ.get("PASSWORD_HASH_SCRYPT_WORK_FACTOR", 2 ** 14)),
+}
+
+_PASSWORD_HASHER_CLASSES = {
+	"pbkdf2_sha256": "backend.hashers.TunedPBKDF2PasswordHasher",
+	"scrypt": "backend.hashers.TunedScryptPasswordHasher",
+}
+
+PASSWORD_HASHERS = [_PASSWORD_HASHER_CLASSES[PASSWORD_HASHING["PREFERRED"]]] + [
+	hasher for algorithm, hasher in _PASSWORD_HASHER_CLASSES.items()
+	if algorithm != PASSWORD_HASHING["PREFERRED"]
 ]
 
+# Password hashing runs on native threads so that it does not block the gevent loop
+PASSWORD_HASHING_EXECUTOR = {
+	"MAX_WORKERS": int(os.environ.get("PASSWORD_HASHING_MAX_WORKERS", 2)),
+	"MAX_QUEUE": int(os.environ.get("PASSWORD_HASHING_MAX_QUEUE", 32)),
+	"QUEUE_TIMEOUT_SEC": 10,
+}
+
 LANGUAGE_CODE = "en-us"
 TIME_ZONE = "UTC"
 USE_I18N = True
@@ -149,9 +200,75 @@ CELERY_TASK_SERIALIZER = "json"
 CELERY_RESULT_SERIALIZER = "json"
 CELERY_TASK_INTERVAL = 0.5
 CELERY_TASK_TIME_LIMIT = 1000
+# Monthly partitions of the logs table, see backend.log_partitions
+LOG_PARTITIONING = {
+	"MONTHS_AHEAD": 3,
+	"RETENTION_MONTHS": int(os.environ.get("LOG_RETENTION_MONTHS", 12)),
+	"ARCHIVE_DIR": os.environ.get("LOG_ARCHIVE_DIR", "./log_archive"),
+}
+
+CELERY_BEAT_SCHEDULE = {
+	"flush-expired-tokens": {
+		"task": "backend.tasks.flush_expired_tokens",
+		"schedule": TOKEN_REVOCATION["FLUSH_EXPIRED_INTERVAL_SEC"],
+	},
+	"create-log-partitions": {
+		"task": "backend.tasks.create_log_partitions",
+		"schedule": crontab(minute=0, hour=2),
+	},
+	"archive-log-partitions": {
+		"task": "backend.tasks.archive_log_partitions",
+		"schedule": crontab(minute=30, hour=2),
+	},
+	"purge-rate-limit-buckets": {
+		"task": "backend.tasks.purge_rate_limit_buckets",
+		"schedule": crontab(minute=15),
+	},
+}
 
 LOGGER_PATH = "./narrate_project.log"
 
+# Level of the file and stdout logs, the database log always receives INFO and above
+LOG_LEVEL = os.environ.get("NARRATE_LOG_LEVEL", "DEBUG").upper()
+
+# "text" or "json" (one object per line) for the file and stdout logs
+LOG_FORMAT = os.environ.get("NARRATE_LOG_FORMAT", "text")
+
+LOG_FILE = {
+	# "watched" reopens the file after it is rotated by logrotate, see
+	# config/logrotate. The gunicorn workers and the celery processes all write
+	# the same file, so "size" or "time", which rotate the file from the process
+	# itself, are only safe for a single process, e.g. runserver.
+	"ROTATION": os.environ.get("NARRATE_LOG_ROTATION", "watched"),
+	"MAX_BYTES": 50 * 1024 * 1024,
+	"WHEN": "midnight",
+	"BACKUP_COUNT": 10,
+}
+
+# Buffered writes of log entries to the database, see backend.custom_logging
+DB_LOG_HANDLER = {
+	"CAPACITY": int(os.environ.get("DB_LOG_HANDLER_CAPACITY", 10000)),
+	"BATCH_SIZE": int(os.environ.get("DB_LOG_HANDLER_BATCH_SIZE", 200)),
+	"FLUSH_INTERVAL_SEC": float(os.environ.get("DB_LOG_HANDLER_FLUSH_INTERVAL_SEC", 2)),
+	# "drop" or "spill" entries that do not fit in the buffer or fail to be written
+	"OVERFLOW_POLICY": os.environ.get("DB_LOG_HANDLER_OVERFLOW_POLICY", "spill"),
+	"SPILL_PATH": "./narrate_project_db_log_spill.log",
+}
+
+# Fraction of the successful requests of an api that get a row in the logs table,
+# errors always do. Every request is counted in the hourly rollups regardless.
+_READ_SAMPLE_RATE = float(os.environ.get("AUDIT_READ_SAMPLE_RATE", 0.05))
+
+AUDIT_POLICY = {
+	"DEFAULT_SAMPLE_RATE": 1.0,
+	"SAMPLE_RATES": {
+		"EcclesiasticalTreasuresFetch": _READ_SAMPLE_RATE,
+		"EcclesiasticalTreasuresList": _READ_SAMPLE_RATE,
+		"EcclesiasticalTreasuresMediaList": _READ_SAMPLE_RATE,
+		"PollResetEmailStatus": _READ_SAMPLE_RATE,
+	},
+}
+
 GLOBAL_SETTINGS = {
 	"FROM_EMAIL": os.environ["SERVER_EMAIL"],
 	"FROM_EMAIL_ALIAS": os.environ["SERVER_EMAIL_ALIAS"],
@@ -165,6 +282,33 @@ MODEL_MAPPING = {
 	}
 }
 
+# Token buckets checked before the view runs, first in the memory of the worker.
+# With BACKEND "database" the requests admitted there are then checked against
+# the rate_limit_bucket table, shared by all workers. With "local" the limits
+# apply per worker only, so each is multiplied by the number of workers.
+RATE_LIMITS = {
+	"BACKEND": os.environ.get("RATE_LIMIT_BACKEND", "database"),
+	"MAX_LOCAL_KEYS": 100000,
+	"RULES": {
+		"ActivateAccount": {
+			"ip": {"capacity": 20, "refill_per_min": 10},
+			"email": {"capacity": 5, "refill_per_min": 1},
+		},
+		"Login": {
+			"ip": {"capacity": 30, "refill_per_min": 15},
+			"email": {"capacity": 10, "refill_per_min": 2},
+		},
+		"RegisterUser": {
+			"ip": {"capacity": 10, "refill_per_min": 2},
+			"email": {"capacity": 3, "refill_per_min": 1},
+		},
+		"RequestPasswordResetCode": {
+			"ip": {"capacity": 10, "refill_per_min": 2},
+			"email": {"capacity": 3, "refill_per_min": 1},
+		},
+	},
+}
+
 EMAIL_COUNTDOWN_SEC = 1
 FREQUENT_REQUEST_COUNT_LIMIT = 5
 ACTIVATE_ACCOUNT_BASE_URL = "http://localhost:10000/backend/activate_account"